@@ -0,0 +1,212 @@
+import asyncio
+import os
+import time
+
+import pygame
+
+from bundle import sprite_key, sound_key
+from world import WIDTH, HEIGHT
+
+# =================== Registro de sprites =================== #
+# Cada imagem é carregada uma única vez, convertida para o formato do display
+# (convert/convert_alpha) e escalada no tamanho em que é desenhada. Todos os
+# inimigos, meteoros etc. compartilham as mesmas tuplas de quadros.
+#
+# Com um pacote (bundle.py) os sprites já vêm escalados e sem compressão. Nada
+# precisa ser carregado de uma vez: frames()/sound() carregam na primeira vez
+# que são pedidos e preload() carrega o resto em segundo plano, um por quadro.
+
+# nome -> (arquivos, tamanho final ou None, cor de fallback, tem transparência)
+SPRITES = {
+    "background": (("back.png",), (WIDTH, HEIGHT), (255, 0, 0), False),
+    "ship": (("Ship_2.png",), None, (0, 255, 0), True),
+    "enemy": (("polvo.png", "polvo2.png"), (60, 60), (255, 0, 0), True),
+    "shooter": (("shooter_1.png", "shooter_2.png"), (60, 60), (255, 0, 0), True),
+    # Variantes de meteoro (o campo frame de cada meteoro escolhe uma)
+    "meteor": (("meteor_img1.png", "meteor_img2.png", "meteor_img3.png"), (40, 40), (139, 69, 19), True),
+}
+
+# nome -> arquivo de som
+SOUNDS = {
+    "shoot": "shoot.ogg",
+    "explosion": "explosion.ogg",
+    "engine": "ship_moving.ogg",
+}
+
+# Sprites desenhados já no primeiro quadro da partida (atiradores e meteoros só aparecem depois)
+FIRST_SCENE = ("background", "ship", "enemy")
+
+
+# Função para carregar imagens com verificação de erro
+def load_image(file_path, fallback_color=(255, 0, 0)):
+    try:
+        if os.path.exists(file_path):
+            return pygame.image.load(file_path)
+        else:
+            print(f"❌ Arquivo não encontrado: {file_path}")
+            # Criar uma superfície de fallback
+            surf = pygame.Surface((50, 50))
+            surf.fill(fallback_color)
+            return surf
+    except pygame.error as e:
+        print(f"❌ Erro ao carregar imagem {file_path}: {e}")
+        # Criar uma superfície de fallback
+        surf = pygame.Surface((50, 50))
+        surf.fill(fallback_color)
+        return surf
+
+
+def surface_bytes(surface):
+    """ Memória ocupada pelos pixels de uma superfície """
+    return surface.get_pitch() * surface.get_height()
+
+
+class AssetRegistry:
+    def __init__(self, base_dir="", bundle=None):
+        """ bundle: Bundle aberto (bundle.py) ou None para ler os arquivos soltos """
+        self.base_dir = base_dir
+        self.bundle = bundle
+        self._images = {}  # arquivo -> superfície convertida no tamanho original
+        self._scaled = {}  # (arquivo, tamanho) -> superfície escalada
+        self._frames = {}  # nome -> tupla de quadros prontos para blit
+        self._sounds = {}  # nome -> pygame.mixer.Sound
+        self.load_times = {}  # nome -> ms gastos carregando
+        self.on_demand = []  # Nomes carregados só quando pedidos (o preload não chegou a tempo)
+
+    def _convert(self, surface, alpha):
+        # convert() exige um display aberto; sem ele a superfície fica como veio
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def image(self, file_name, fallback_color=(255, 0, 0), alpha=True):
+        """ Imagem original (carregada e convertida só na primeira chamada) """
+        surface = self._images.get(file_name)
+        if surface is None:
+            surface = load_image(os.path.join(self.base_dir, file_name), fallback_color)
+            surface = self._convert(surface, alpha)
+            self._images[file_name] = surface
+        return surface
+
+    def scaled(self, file_name, size, fallback_color=(255, 0, 0), alpha=True):
+        """ Imagem escalada para size, compartilhada entre todos que pedirem o mesmo tamanho """
+        if size is None:
+            return self.image(file_name, fallback_color, alpha)
+        key = (file_name, size)
+        surface = self._scaled.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(self.image(file_name, fallback_color, alpha), size)
+            self._scaled[key] = surface
+        return surface
+
+    def define(self, name, files, size=None, fallback_color=(255, 0, 0), alpha=True):
+        """ Registra uma animação (ou conjunto de variantes) com nome """
+        frames = tuple(self.scaled(f, size, fallback_color, alpha) for f in files)
+        self._frames[name] = frames
+        return frames
+
+    def _own(self, surface, alpha):
+        # A superfície do pacote aponta para o mmap: converter (ou copiar) cria os pixels próprios
+        converted = self._convert(surface, alpha)
+        return converted if converted is not surface else surface.copy()
+
+    def load(self, name):
+        """ Carrega o sprite name de SPRITES (do pacote, se ele tiver) """
+        start = time.perf_counter()
+        files, size, fallback_color, alpha = SPRITES[name]
+        bundle = self.bundle
+        if bundle is not None and sprite_key(name, 0) in bundle:
+            frames = tuple(self._own(bundle.image(sprite_key(name, i)), alpha) for i in range(len(files)))
+            self._frames[name] = frames
+        else:
+            frames = self.define(name, files, size, fallback_color, alpha)
+            if size is not None:
+                # Com tudo escalado, as originais grandes (ex.: fundo 2048x1536) não são mais usadas
+                for file_name in files:
+                    self._images.pop(file_name, None)
+        self.load_times[name] = (time.perf_counter() - start) * 1000
+        return frames
+
+    def load_defaults(self, names=None):
+        """ Carrega os sprites names (padrão: todos os de SPRITES) """
+        for name in names or SPRITES:
+            if name not in self._frames:
+                self.load(name)
+        return self
+
+    def loaded(self, name):
+        return name in self._frames
+
+    def pending(self):
+        """ Sprites e sons ainda não carregados """
+        return ([name for name in SPRITES if name not in self._frames]
+                + [name for name in SOUNDS if name not in self._sounds])
+
+    async def preload(self):
+        """ Carrega o que falta, um asset por vez, devolvendo o event loop entre eles (um por quadro) """
+        for name in SPRITES:
+            if name not in self._frames:
+                self.load(name)
+                await asyncio.sleep(0)
+        if pygame.mixer.get_init():
+            for name in SOUNDS:
+                if name not in self._sounds:
+                    self._load_sound(name)
+                    await asyncio.sleep(0)
+
+    def frames(self, name):
+        frames = self._frames.get(name)
+        if frames is None:
+            frames = self.load(name)
+            self.on_demand.append(name)
+        return frames
+
+    def frame(self, name, index=0):
+        return self.frames(name)[index]
+
+    # ===== Sons ===== #
+    def _load_sound(self, name):
+        start = time.perf_counter()
+        bundle = self.bundle
+        try:
+            if bundle is not None and sound_key(name) in bundle:
+                sound = bundle.sound(sound_key(name))
+            else:
+                sound = pygame.mixer.Sound(os.path.join(self.base_dir, SOUNDS[name]))
+        except pygame.error as e:
+            print(f"❌ Erro ao carregar som {name}: {e}")
+            # Criar um som vazio como fallback
+            sound = pygame.mixer.Sound(buffer=bytearray(44100))  # 1 segundo de silêncio
+        self._sounds[name] = sound
+        self.load_times[f"som:{name}"] = (time.perf_counter() - start) * 1000
+        return sound
+
+    def sound(self, name):
+        """ Som de SOUNDS (precisa do mixer iniciado) """
+        sound = self._sounds.get(name)
+        if sound is None:
+            sound = self._load_sound(name)
+            self.on_demand.append(name)
+        return sound
+
+    def memory_report(self):
+        """ Bytes de pixels por superfície guardada (cada superfície contada uma vez) """
+        report = {}
+        counted = set()
+        for file_name, surface in self._images.items():
+            report[file_name] = surface_bytes(surface)
+            counted.add(id(surface))
+        for (file_name, size), surface in self._scaled.items():
+            if id(surface) not in counted:
+                report[f"{file_name}@{size[0]}x{size[1]}"] = surface_bytes(surface)
+                counted.add(id(surface))
+        # Quadros vindos do pacote só existem em _frames (não passam por image/scaled)
+        for name, frames in self._frames.items():
+            for index, surface in enumerate(frames):
+                if id(surface) not in counted:
+                    report[sprite_key(name, index)] = surface_bytes(surface)
+                    counted.add(id(surface))
+        return report
+
+    def memory_bytes(self):
+        return sum(self.memory_report().values())
@@ -0,0 +1,143 @@
+import time
+
+import pygame
+
+# =================== Vozes de áudio =================== #
+# Cada categoria de som tem canais reservados do mixer (grupos) e cada som um
+# limite de vozes simultâneas e um intervalo mínimo entre inícios. Pedidos
+# dentro do intervalo são fundidos com a voz que acabou de começar: dez
+# explosões no mesmo tick viram um play() só. Um som no limite de vozes é
+# ignorado até uma delas terminar (o motor não recomeça a cada tick); com o
+# grupo cheio de outros sons, a voz mais antiga é reaproveitada. Como os
+# canais são reservados, tiros e explosões nunca tomam o canal do motor
+# (antes o motor só tocava com o mixer inteiro livre e sumia nos combates).
+
+# grupo -> canais reservados
+CHANNEL_GROUPS = {
+    "motor": 1,
+    "tiros": 2,
+    "explosões": 3,
+}
+
+# som -> (grupo, vozes simultâneas, segundos mínimos entre dois inícios)
+VOICES = {
+    "engine": ("motor", 1, 0.0),
+    "shoot": ("tiros", 2, 0.06),
+    "explosion": ("explosões", 3, 0.08),
+}
+
+
+class AudioManager:
+    def __init__(self, assets, groups=CHANNEL_GROUPS, voices=VOICES, clock=time.monotonic):
+        """
+        assets: AssetRegistry de onde vêm os sons (assets.sound(nome))
+        clock: relógio em segundos usado nos intervalos entre inícios
+        """
+        self.assets = assets
+        self.groups = dict(groups)
+        self.voices = dict(voices)
+        self.clock = clock
+        self.ready = False
+        self._channels = {}  # grupo -> [(índice, pygame.mixer.Channel)]
+        self._playing = {}  # índice do canal -> (som, início)
+        self._last_start = {}  # som -> início da voz mais recente
+        self.stats = {name: {"requests": 0, "played": 0, "coalesced": 0, "stolen": 0} for name in voices}
+        self.last_batch = 0  # play() feitos no último play_all
+        self.max_batch = 0  # Maior play_all até agora
+
+    def start(self):
+        """ Reserva os canais dos grupos (chamar com o mixer já iniciado) """
+        reserved = sum(self.groups.values())
+        # Canais além dos reservados ficam para sons sem grupo
+        if pygame.mixer.get_num_channels() < reserved + 2:
+            pygame.mixer.set_num_channels(reserved + 2)
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for group, count in self.groups.items():
+            self._channels[group] = [(i, pygame.mixer.Channel(i)) for i in range(index, index + count)]
+            index += count
+        self.ready = True
+        return self
+
+    def _channel_for(self, name, group, max_voices):
+        """ ((índice, canal), reaproveitado): canal livre do grupo, a voz mais antiga ou (None, False) no limite """
+        playing = self._playing
+        free = None
+        oldest = None
+        oldest_start = None
+        voices = 0
+        for index, channel in self._channels[group]:
+            voice = playing.get(index)
+            if voice is None or not channel.get_busy():
+                if free is None:
+                    free = (index, channel)
+                continue
+            if voice[0] == name:
+                voices += 1
+            if oldest_start is None or voice[1] < oldest_start:
+                oldest, oldest_start = (index, channel), voice[1]
+        if voices >= max_voices:
+            return None, False
+        if free is not None:
+            return free, False
+        return oldest, True
+
+    def play(self, name):
+        """ Toca name respeitando grupo, limite de vozes e intervalo; retorna True se houve play() """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = {"requests": 0, "played": 0, "coalesced": 0, "stolen": 0}
+        stats["requests"] += 1
+        rule = self.voices.get(name)
+        if rule is None or not self.ready:
+            # Som sem grupo: qualquer canal livre que não seja reservado
+            self.assets.sound(name).play()
+            stats["played"] += 1
+            return True
+
+        group, max_voices, interval = rule
+        now = self.clock()
+        last = self._last_start.get(name)
+        if last is not None and now - last < interval:
+            stats["coalesced"] += 1
+            return False
+
+        slot, stolen = self._channel_for(name, group, max_voices)
+        if slot is None:
+            stats["coalesced"] += 1  # As vozes que já tocam cobrem este pedido
+            return False
+        index, channel = slot
+        channel.play(self.assets.sound(name))
+        self._playing[index] = (name, now)
+        self._last_start[name] = now
+        stats["played"] += 1
+        if stolen:
+            stats["stolen"] += 1
+        return True
+
+    def play_all(self, names):
+        """ Toca os sons pedidos num tick (world.sounds) """
+        plays = 0
+        for name in names:
+            if self.play(name):
+                plays += 1
+        self.last_batch = plays
+        if plays > self.max_batch:
+            self.max_batch = plays
+        return plays
+
+    def busy(self, group):
+        """ Quantos canais do grupo estão tocando """
+        return sum(1 for _, channel in self._channels.get(group, ()) if channel.get_busy())
+
+    def metrics(self):
+        """ Totais de pedidos, play() de fato e pedidos fundidos """
+        requests = sum(s["requests"] for s in self.stats.values())
+        played = sum(s["played"] for s in self.stats.values())
+        return {
+            "requests": requests,
+            "played": played,
+            "coalesced": sum(s["coalesced"] for s in self.stats.values()),
+            "stolen": sum(s["stolen"] for s in self.stats.values()),
+            "max_batch": self.max_batch,
+        }
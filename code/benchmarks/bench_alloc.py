@@ -0,0 +1,110 @@
+"""
+Benchmark de alocações da simulação: roda o World com um bot por vários
+ticks e, com tracemalloc, mede o pico de memória temporária de cada tick
+(acima do que havia no início dele) e quanto fica retido ao longo da medição.
+Também mostra se algum arquétipo de entidades (ecs.py) cresceu no período.
+
+Antes de medir, cada arquétipo cresce (Archetype.reserve) até RESERVE
+linhas, mais que o pico de entidades vivas destas partidas: o aquecimento
+sozinho não garante isso (um pico de inimigos na medição dobraria o arquétipo
+e a cópia entraria na conta). Daí em diante spawns e mortes só reaproveitam
+linhas e os sistemas escrevem nos arrays de trabalho (Archetype.scratch):
+nenhum arquétipo cresce e nada fica retido.
+
+O pico do tick (~3,1 KB nos dois cenários) é o de refazer a grade de
+colisão (collision.py): ~2,6 KB são a área de trabalho que o NumPy aloca em
+toda ordenação, qualquer que seja o tamanho ou o dtype, e o resto são views.
+Atirar quase não muda o pico: os tiros só testam os pares candidatos da grade,
+nos arrays de trabalho de ProjectilePool.first_hits (~0,8 KB de views numa
+chamada sem acerto, ~1,5 KB com os arrays do resultado quando acerta).
+
+Uso:
+    python benchmarks/bench_alloc.py [ticks]
+"""
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+
+from world import World, Inputs  # noqa: E402
+
+WARMUP = 3000  # Ticks antes de medir (projéteis e arrays de trabalho chegam ao tamanho de regime)
+RESERVE = 64  # Linhas por arquétipo antes de medir (max_enemies é 20)
+
+# Entradas pré-montadas: o bot não pode ser ele mesmo a fonte das alocações
+TURN = Inputs(left=True, up=True)
+TURN_SHOOT = Inputs(left=True, up=True, shoot=True)
+DRIFT = Inputs(left=True)
+
+
+def shooting_bot(world):
+    # Gira, acelera metade do tempo e atira a cada 10 ticks
+    if world.frame % 10 == 0:
+        return TURN_SHOOT
+    return TURN if world.frame % 120 < 60 else DRIFT
+
+
+def idle_bot(world):
+    return TURN if world.frame % 120 < 60 else DRIFT
+
+
+SCENARIOS = {"sem tiros": idle_bot, "atirando": shooting_bot}
+
+
+def run(ticks, bot=shooting_bot, seed=1):
+    world = World(seed)
+    # Partidas mais movimentadas que o padrão: mais inimigos, meteoros e explosões
+    world.max_enemies = 20
+    world.enemy_spawn_rate = 20
+    world.meteor_spawn_rate = 40
+
+    def tick():
+        world.step(bot(world))
+        if world.game_over:
+            world.reset()
+
+    archetypes = world.entities.archetypes.values()
+    for archetype in archetypes:
+        archetype.reserve(RESERVE)
+    for _ in range(WARMUP):
+        tick()
+
+    capacity_before = [archetype.capacity for archetype in archetypes]
+    tracemalloc.start()
+    transient = np.zeros(ticks, dtype=np.int64)  # Pré-alocado: guardar a medida não pode alocar
+    start_memory = tracemalloc.get_traced_memory()[0]
+    for i in range(ticks):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        tick()
+        transient[i] = tracemalloc.get_traced_memory()[1] - before
+    retained = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    grown = [archetype.capacity - before for archetype, before in zip(archetypes, capacity_before)]
+    return world, transient, retained, grown
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"{ticks} ticks medidos após {WARMUP} de aquecimento")
+    for name, bot in SCENARIOS.items():
+        world, transient, retained, grown = run(ticks, bot)
+        print(f"\n== {name} ==")
+        print(f"Memória temporária por tick: média {transient.mean():.0f} B, "
+              f"mediana {np.median(transient):.0f} B, p99 {np.percentile(transient, 99):.0f} B")
+        # O retido varia com quantas entidades estão vivas no fim; não deve crescer com os ticks
+        print(f"Retido ao fim da medição: {retained:+d} B ({retained / ticks:+.2f} B/tick)")
+
+        kinds = world.entities.kinds.items()
+        for archetype, growth in zip(world.entities.archetypes.values(), grown):
+            name = "/".join(kind for kind, (owner, _) in kinds if owner is archetype)
+            print(f"Arquétipo {name:<9} {archetype.count:>4} vivos | capacidade {archetype.capacity:>5}"
+                  f" | cresceu {growth:+d} durante a medição")
+
+
+if __name__ == "__main__":
+    main()
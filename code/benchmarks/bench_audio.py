@@ -0,0 +1,118 @@
+"""
+Áudio num combate pesado: o cenário swarm (100 inimigos, bot girando,
+acelerando e atirando) roda em tempo real, 60 ticks/s, com o driver de áudio
+dummy do SDL (que consome os canais no mesmo ritmo de uma placa de som). Uma
+vez por segundo entram ainda 10 explosões no mesmo tick (uma fila de
+inimigos destruída de uma vez). Roda duas vezes:
+
+- antigo: cada pedido de world.sounds vira um Sound.play() e o motor só toca
+  com o mixer inteiro livre (pygame.mixer.get_busy()), como era em main.py;
+- vozes: AudioManager (audio.py), com canais reservados por grupo, limite de
+  vozes por som e fusão de pedidos próximos.
+
+Mostra quantos play() cada um fez (total e no pior tick) e em quantos dos
+ticks em que a nave acelerava o som do motor não estava tocando.
+
+Uso:
+    python benchmarks/bench_audio.py [segundos]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from audio import AudioManager  # noqa: E402
+from scenarios import SCENARIOS  # noqa: E402
+from world import TICK_RATE  # noqa: E402
+
+BURST = 10  # Explosões extras num tick só, uma vez por segundo
+
+
+class LegacyAudio:
+    """ O caminho antigo de main.py: um play() por pedido, motor só com o mixer livre """
+
+    def __init__(self, assets):
+        self.assets = assets
+        self.plays = 0
+
+    def play_all(self, sounds):
+        plays = 0
+        for sound in sounds:
+            if sound in ("shoot", "explosion") or (sound == "engine" and not pygame.mixer.get_busy()):
+                self.assets.sound(sound).play()
+                plays += 1
+        self.plays += plays
+        return plays
+
+
+def engine_playing(engine):
+    return any(pygame.mixer.Channel(i).get_sound() is engine and pygame.mixer.Channel(i).get_busy()
+               for i in range(pygame.mixer.get_num_channels()))
+
+
+def run(audio, assets, seconds):
+    scenario = SCENARIOS["swarm"]
+    scenario.frames = int(seconds * TICK_RATE)
+    world = scenario.create_world()
+    engine = assets.sound("engine")
+    result = {"requests": 0, "plays": 0, "worst_tick": 0, "engine_ticks": 0, "engine_silent": 0}
+    tick = 1.0 / TICK_RATE
+    deadline = time.perf_counter()
+
+    def on_frame(world):
+        nonlocal deadline
+        sounds = world.sounds
+        if world.frame % TICK_RATE == 0:
+            sounds = sounds + ["explosion"] * BURST
+        plays = audio.play_all(sounds)
+        result["requests"] += len(sounds)
+        result["plays"] += plays
+        result["worst_tick"] = max(result["worst_tick"], plays)
+        if "engine" in sounds:
+            result["engine_ticks"] += 1
+            if not engine_playing(engine):
+                result["engine_silent"] += 1
+        # Tempo real: os canais do driver dummy esvaziam no ritmo de uma placa de som
+        deadline += tick
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    scenario.run(world, on_frame)
+    pygame.mixer.stop()
+    return result
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    pygame.mixer.init()
+    assets = AssetRegistry()
+    for name in ("shoot", "explosion", "engine"):
+        assets.sound(name)
+
+    print(f"swarm em tempo real por {seconds:.0f} s ({pygame.mixer.get_num_channels()} canais no mixer)\n")
+    # O AudioManager reserva canais: só é criado depois da passada antiga
+    modes = {"antigo": lambda: LegacyAudio(assets), "vozes": lambda: AudioManager(assets).start()}
+    for name, make in modes.items():
+        audio = modes[name] = make()
+        result = run(audio, assets, seconds)
+        silent = result["engine_silent"] / max(1, result["engine_ticks"])
+        print(f"{name:<7} {result['requests']:>5} pedidos | {result['plays']:>5} play()"
+              f" (pior tick: {result['worst_tick']}) | motor mudo em {silent:.0%} dos ticks acelerando")
+    print("\nVozes:", modes["vozes"].metrics())
+    for name, stats in modes["vozes"].stats.items():
+        print(f"  {name:<10} {stats}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark do broad-phase de colisão.
+
+Compara, para quantidades crescentes de entidades, o teste de força bruta
+(todo projétil contra toda entidade, a matriz projéteis x alvos de antes da
+grade) com a grade de collision.SpatialHash, como World a usa em cada tick:
+refaz a grade com as posições, consulta os pares candidatos de todos os
+projéteis de uma vez e faz o teste exato só neles. A densidade é mantida
+constante (a área cresce junto com a quantidade), que é o caso de um mapa que
+rola com a câmera. Os dois lados têm que achar os mesmos acertos.
+
+Depois mede o tick inteiro do World (movimento, grade, colisões) com as
+mesmas quantidades de inimigos perseguindo a nave, no modo horda dos
+cenários; aqui a tela é fixa, então a densidade cresce com a quantidade.
+
+Uso:
+    python benchmarks/bench_collision.py [repetições]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collision import SpatialHash  # noqa: E402
+from scenarios import Scenario, spinning_shooter  # noqa: E402
+from world import HORDE_RULES  # noqa: E402
+
+ENTITY_RADIUS = 30
+BULLET_RADIUS = 5
+DENSITY = 5 / (800 * 600)  # 5 inimigos numa tela 800x600, como no jogo
+COUNTS = (100, 1000, 5000)
+BRUTE_LIMIT = 2000  # Acima disso a matriz projéteis x entidades passa de centenas de MB
+WORLD_TICKS = 300  # Ticks medidos do World por quantidade
+
+
+def make_scene(count, rng):
+    side = math.sqrt(count / DENSITY)
+    entities = rng.uniform(0, side, (2, count))
+    bullets = rng.uniform(0, side, (2, count))
+    return entities, bullets
+
+
+def brute_force(entities, bullets):
+    ex, ey = entities
+    bx, by = bullets
+    dist = np.hypot(bx[:, None] - ex, by[:, None] - ey)
+    return int(np.count_nonzero(dist < ENTITY_RADIUS + BULLET_RADIUS))
+
+
+def spatial_hash(entities, bullets, grid):
+    ex, ey = entities
+    bx, by = bullets
+    grid.clear()
+    grid.insert("entities", ex, ey, ENTITY_RADIUS)
+    points, rows = grid.query("entities", bx, by, BULLET_RADIUS)
+    dist = np.hypot(bx[points] - ex[rows], by[points] - ey[rows])
+    return int(np.count_nonzero(dist < ENTITY_RADIUS + BULLET_RADIUS))
+
+
+def world_tick(count, repeat):
+    # Melhor média de ms por tick de World.step com count inimigos (2% atiradores)
+    scenario = Scenario("horde", "", WORLD_TICKS, spinning_shooter, enemies=count, shooters=0.02,
+                        rules=dict(HORDE_RULES, max_enemies=count))
+    best = float("inf")
+    for _ in range(repeat):
+        world = scenario.create_world()
+        scenario.maintain(world, random.Random(scenario.seed))  # A população já cheia no primeiro tick medido
+        start = time.perf_counter()
+        scenario.run(world)
+        best = min(best, (time.perf_counter() - start) / WORLD_TICKS)
+    return best * 1000
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rng = np.random.default_rng(42)
+    grid = SpatialHash(64)
+
+    print(f"{'entidades':>10} {'força bruta (ms/tick)':>22} {'grade (ms/tick)':>16} {'grade µs/entidade':>18}")
+    for count in COUNTS:
+        entities, bullets = make_scene(count, rng)
+        if count <= BRUTE_LIMIT:
+            brute_time, brute_hits = timed(lambda: brute_force(entities, bullets), repeat)
+            brute_ms = f"{brute_time * 1000:22.3f}"
+        else:
+            brute_hits = None
+            brute_ms = f"{'-':>22}"
+        grid_time, grid_hits = timed(lambda: spatial_hash(entities, bullets, grid), repeat)
+        if brute_hits is not None:
+            assert brute_hits == grid_hits, (brute_hits, grid_hits)
+        per_entity = grid_time * 1e6 / count
+        print(f"{count:>10} {brute_ms} {grid_time * 1000:16.3f} {per_entity:18.2f}")
+
+    print()
+    print(f"{'inimigos':>10} {'World.step (ms/tick)':>21}")
+    for count in COUNTS:
+        print(f"{count:>10} {world_tick(count, max(1, repeat // 2)):21.3f}")
+
+
+if __name__ == "__main__":
+    main()
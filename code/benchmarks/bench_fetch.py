@@ -0,0 +1,101 @@
+"""
+Benchmark do caminho do navegador (FetchBridge) com o platform.window falso
+de fake_window.py: um laço de quadros a 60 FPS roda enquanto várias
+requisições estão em andamento ao mesmo tempo (consultas do ranking, PATCH de
+recordes e algumas que estouram o tempo limite).
+
+Mostra quantas requisições terminaram, quantas estiveram em andamento ao mesmo
+tempo e a duração dos quadros: com a ponte a rede nunca segura um quadro.
+
+Uso:
+    python benchmarks/bench_fetch.py [requisições] [latência em s]
+"""
+import asyncio
+import os
+import sys
+import time
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, CODE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import numpy as np  # noqa: E402
+
+from fake_firebase import FakeFirebase  # noqa: E402
+from fake_window import FakeWindow, firebase_handler  # noqa: E402
+from leaderboard import LeaderboardClient  # noqa: E402
+from network import RequestHandler  # noqa: E402
+from score_queue import make_key  # noqa: E402
+
+FRAME = 1 / 60
+SLOW_URL = "http://fake/slow.json"  # Nunca responde dentro do tempo limite
+
+
+async def run(requests, latency):
+    firebase = FakeFirebase(records=1000)
+    base = firebase_handler(firebase)
+
+    def handler(method, url, body, headers):
+        return base(method, url.replace("http://fake", ""), body, headers)
+
+    def latency_of(method, url):
+        return 60.0 if url == SLOW_URL else latency
+
+    window = FakeWindow(handler, latency=latency_of, jitter=latency)
+    # Folga para latência + jitter; só SLOW_URL estoura o tempo limite
+    request_handler = RequestHandler(timeout=2 * latency + 0.5, retries=0, window=window)
+    bridge = request_handler.bridge
+    leaderboard = LeaderboardClient(request_handler, "http://fake/records.json")
+
+    async def one(i):
+        if i % 10 == 9:
+            try:
+                await request_handler.get(SLOW_URL)
+            except asyncio.TimeoutError:
+                return "timeout"
+        elif i % 3 == 0:
+            key = make_key()
+            await request_handler.patch("http://fake/records.json", {key: {"name": "BOT", "score": i}})
+            return "patch"
+        else:
+            records = await leaderboard.top(10)
+            assert len(records) == 10
+            return "top"
+
+    frame_times = []
+    finished = False
+
+    async def frames():
+        last = time.perf_counter()
+        while not finished:
+            await asyncio.sleep(FRAME)  # O "quadro" do jogo
+            now = time.perf_counter()
+            frame_times.append(now - last)
+            last = now
+
+    start = time.perf_counter()
+    frame_task = asyncio.create_task(frames())
+    results = await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    finished = True
+    await frame_task
+    return results, elapsed, np.array(frame_times), bridge, window
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    results, elapsed, frame_times, bridge, window = asyncio.run(run(requests, latency))
+
+    kinds = {kind: results.count(kind) for kind in sorted(set(results))}
+    print(f"{requests} requisições em {elapsed:.2f}s com latência de {latency * 1000:.0f} ms: {kinds}")
+    print("Ponte:", bridge.stats())
+    print(f"Chamadas ao JS: {window.Fetch.calls}")
+    ms = frame_times * 1000
+    print(f"Quadros: {len(ms)} | duração p50 {np.median(ms):.1f} ms, p99 {np.percentile(ms, 99):.1f} ms,"
+          f" máx {ms.max():.1f} ms (alvo {FRAME * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
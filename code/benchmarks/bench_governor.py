@@ -0,0 +1,98 @@
+"""
+Governador de qualidade sob carga: uma partida no modo horda (inimigos
+nascendo pelas regras do modo, até 3000) com uma chuva de meteoros roda com
+simulação + desenho nos drivers dummy do SDL, duas vezes:
+
+- fixo: qualidade máxima o tempo todo;
+- governador: QualityGovernor (governor.py) observando o tempo de cada quadro.
+
+O FPS alvo padrão (144) é mais alto que o que esta carga alcança na
+qualidade máxima, para o governador ter o que fazer numa máquina rápida; num
+aparelho lento (ou no navegador) o mesmo acontece a 60 FPS. Mostra a
+distribuição do tempo por quadro, quantos quadros estouraram o orçamento,
+quantos quadros ficaram em cada nível e cada decisão tomada.
+
+Uso:
+    python benchmarks/bench_governor.py [--fps 144] [--frames 2400]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from governor import QualityGovernor  # noqa: E402
+from render import Renderer  # noqa: E402
+from scenarios import Scenario, spinning_shooter  # noqa: E402
+from world import WIDTH, HEIGHT, HORDE_RULES  # noqa: E402
+
+# Modo horda com um meteoro a cada 15 ticks
+LOAD_RULES = dict(HORDE_RULES, meteor_spawn_rate=15)
+
+
+def run(screen, assets, frames, fps, governed):
+    scenario = Scenario("carga", "Horda nascendo + chuva de meteoros", frames, spinning_shooter, rules=LOAD_RULES)
+    renderer = Renderer(screen, assets, prebake=True)
+    world = scenario.create_world(player_size=renderer.tank_img.get_size())
+    governor = QualityGovernor(renderer, world, target_fps=fps) if governed else None
+    times = np.zeros(frames)
+    count = 0
+    last = time.perf_counter()
+
+    def on_frame(world):
+        nonlocal count, last
+        renderer.draw(world)
+        renderer.present()
+        now = time.perf_counter()
+        ms = (now - last) * 1000
+        last = now
+        times[count] = ms
+        count += 1
+        if governor is not None:
+            governor.observe(ms)
+
+    scenario.run(world, on_frame)
+    return times, governor, renderer, world
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fps", type=int, default=144, help="FPS alvo do governador")
+    parser.add_argument("--frames", type=int, default=2400)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry()
+    assets.load_defaults()
+    budget = 1000 / args.fps
+    print(f"{args.frames} quadros, alvo {args.fps} FPS (orçamento {budget:.1f} ms)\n")
+
+    for name, governed in (("fixo", False), ("governador", True)):
+        times, governor, renderer, world = run(screen, assets, args.frames, args.fps, governed)
+        p50, p90, p99 = np.percentile(times, (50, 90, 99)).tolist()
+        over = np.count_nonzero(times > budget) / len(times)
+        # O segundo trecho mostra o regime, depois que o governador (se houver) se acomodou
+        late = times[len(times) // 2:]
+        print(f"{name:<11} p50 {p50:6.2f} | p90 {p90:6.2f} | p99 {p99:6.2f} ms | acima do orçamento: {over:5.1%}"
+              f" (2ª metade {np.count_nonzero(late > budget) / len(late):5.1%}) | inimigos no fim: {world.enemy_count}")
+        if governor is not None:
+            print(f"            quadros por nível: {governor.level_frames} | não desenhados: {renderer.stats['skipped']}")
+            for decision in governor.decisions:
+                print(f"            quadro {decision['frame']:>5}: {decision['from']} → {decision['to']}"
+                      f" ({decision['reason']})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark de rede contra o Firebase falso (benchmarks/fake_firebase.py).
+
+Compara o comportamento antigo, um httpx.AsyncClient novo a cada requisição
+(handshake em toda chamada), com o RequestHandler de cliente persistente
+(pool de conexões com keep-alive). O handshake TCP+TLS é simulado com um
+atraso na primeira resposta de cada conexão.
+
+Uso:
+    python benchmarks/bench_http.py [requisições] [handshake_em_segundos]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import httpx  # noqa: E402
+
+from fake_firebase import FakeFirebase  # noqa: E402
+from leaderboard import LeaderboardClient  # noqa: E402
+from network import RequestHandler  # noqa: E402
+
+
+def summary(label, latencies, connections):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<22} média {statistics.mean(latencies) * 1000:7.2f} ms   "
+          f"p95 {p95 * 1000:7.2f} ms   conexões abertas: {connections}")
+
+
+async def per_call_client(url, count):
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            (await client.get(url)).json()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def pooled_client(url, count):
+    latencies = []
+    async with RequestHandler() as handler:
+        for _ in range(count):
+            start = time.perf_counter()
+            await handler.get(url)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    handshake = float(sys.argv[2]) if len(sys.argv) > 2 else 0.03
+
+    async with FakeFirebase(records=2000, handshake=handshake) as server:
+        query = LeaderboardClient(None, server.url).query_url(limitToLast=10)
+        print(f"{count} GETs do top 10, handshake simulado de {handshake * 1000:.0f} ms")
+
+        before = server.connections
+        summary("cliente por chamada", await per_call_client(query, count), server.connections - before)
+
+        before = server.connections
+        summary("cliente persistente", await pooled_client(query, count), server.connections - before)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
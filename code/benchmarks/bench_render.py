@@ -0,0 +1,102 @@
+"""
+Benchmark do renderizador: caminho antigo (fill + grade 3x3 de blits do fundo
++ display.flip em todo quadro) contra o novo (no máximo 4 ladrilhos visíveis e
+display.update só nos retângulos sujos quando a câmera está parada).
+Também confere o cache de textos do HUD: nos quadros em que o placar não
+mudou, nenhum texto pode ser rasterizado (TextCache.last_frame_renders == 0).
+
+Roda com os drivers dummy do SDL, então não abre janela.
+
+Uso:
+    python benchmarks/bench_render.py [quadros]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from render import Renderer  # noqa: E402
+from world import World, Inputs, WIDTH, HEIGHT  # noqa: E402
+
+
+class LegacyRenderer(Renderer):
+    """ Reproduz o caminho de antes: tela preenchida e fundo 3x3 em todo quadro """
+
+    def draw(self, world):
+        screen = self.screen
+        screen.fill((0, 0, 0))
+        bg_width, bg_height = self.bg_img.get_size()
+        offset_x = world.total_offset_x % bg_width
+        offset_y = world.total_offset_y % bg_height
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                screen.blit(self.bg_img, (i * bg_width - offset_x, j * bg_height - offset_y))
+        self.draw_entities(world.entities)
+        self.draw_projectiles(world.projectiles)
+        self.draw_player(world.player)
+
+    def present(self):
+        pygame.display.flip()
+
+
+def patrol(world):
+    # Alterna entre voar (câmera rolando) e ficar parado atirando
+    phase = world.frame % 240
+    return Inputs(left=phase < 30, up=phase < 60, shoot=world.frame % 8 == 0)
+
+
+def run(renderer_cls, screen, assets, frames):
+    world = World(seed=7, player_size=assets.frame("ship").get_size())
+    renderer = renderer_cls(screen, assets, prebake=True)
+    text = renderer.hud.text
+    score = None
+    steady = 0  # Quadros sem mudança de placar
+    start = time.perf_counter()
+    for _ in range(frames):
+        world.step(patrol(world))
+        renderer.draw(world)
+        renderer.present()
+        text.end_frame()  # Como o SceneManager faz a cada quadro
+        if world.player.score == score:
+            assert text.last_frame_renders == 0, f"placar igual e {text.last_frame_renders} texto(s) rasterizado(s)"
+            steady += 1
+        score = world.player.score
+        if world.game_over:
+            world.reset()
+            renderer.invalidate()
+    return time.perf_counter() - start, renderer, steady
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry().load_defaults()
+
+    legacy_time, _, _ = run(LegacyRenderer, screen, assets, frames)
+    new_time, renderer, steady = run(Renderer, screen, assets, frames)
+    stats = renderer.stats
+
+    print(f"quadros: {frames}")
+    print(f"antigo: {legacy_time * 1000 / frames:.3f} ms/quadro")
+    print(f"novo:   {new_time * 1000 / frames:.3f} ms/quadro "
+          f"({stats['full_frames']} completos, {stats['dirty_frames']} só retângulos sujos)")
+    print(f"blits de fundo: {stats['bg_blits']} (antigo: {stats['baseline_blits']} incluindo o fill)")
+    print(f"pixels de fundo/fill economizados: {renderer.fill_rate_saved() * 100:.1f}%")
+    text = renderer.hud.text
+    print(f"HUD: {renderer.hud.updates} atualizações, {text.renders} textos rasterizados ({text.hits} do cache), "
+          f"nenhum nos {steady} quadros com o placar igual")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
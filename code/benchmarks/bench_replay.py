@@ -0,0 +1,109 @@
+"""
+Gravação e replay: uma partida de um bot que segura e solta teclas como um
+jogador (get_pressed simulado + KEYDOWN de ESPAÇO) é gravada com o Recorder
+de replay.py, com regras mudando no meio do caminho como faria o governador
+de qualidade. Depois o replay é refeito sem janela e desenhando (drivers
+dummy do SDL), na velocidade máxima, e cada resumo do estado é conferido.
+
+Mostra o tamanho do replay (bytes por minuto de jogo), o custo da gravação
+por tick e a velocidade dos dois replays.
+
+Uso:
+    python benchmarks/bench_replay.py [--ticks 18000] [--seed 7]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from render import Renderer  # noqa: E402
+from replay import Recorder, Replay, KeyState, play  # noqa: E402
+from world import World, Inputs, WIDTH, HEIGHT, TICK_RATE  # noqa: E402
+
+
+def bot_keys(frame):
+    """ Teclas seguradas e KEYDOWNs do tick: gira em rajadas, acelera metade do tempo e atira a cada 10 ticks """
+    pressed = set()
+    if frame % 240 < 150:
+        pressed.add(pygame.K_LEFT if frame % 960 < 480 else pygame.K_d)
+    if frame % 120 < 60:
+        pressed.add(pygame.K_UP)
+    elif frame % 600 < 90:
+        pressed.add(pygame.K_s)
+    keydowns = [pygame.K_SPACE] if frame % 10 == 0 else []
+    return KeyState(pressed), keydowns
+
+
+def record(ticks, seed, player_size):
+    world = World(player_size=player_size)
+    world.reset(seed=seed)
+    recorder = Recorder()
+    recorder.start(world)
+    spent = 0.0
+    for tick in range(ticks):
+        if tick == ticks // 3:
+            world.meteor_spawn_rate = 15  # Como o governador, mudando regras no meio da partida
+        elif tick == 2 * ticks // 3:
+            world.enemy_spawn_rate = 90
+        keys, keydowns = bot_keys(world.frame)
+        start = time.perf_counter()
+        recorder.tick(keys, keydowns, world)
+        spent += time.perf_counter() - start
+        world.step(Inputs.from_keys(keys, pygame.K_SPACE in keydowns))
+        start = time.perf_counter()
+        recorder.after_tick(world)
+        spent += time.perf_counter() - start
+        if world.game_over:
+            break
+    return world, recorder.ticks, recorder.finish(world), spent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=18000, help="ticks gravados (para antes se a nave morrer)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry().load_defaults()
+    renderer = Renderer(screen, assets, prebake=True)
+
+    world, ticks, data, spent = record(args.ticks, args.seed, renderer.tank_img.get_size())
+    minutes = ticks / TICK_RATE / 60
+    print(f"🎞️ Gravados {ticks} ticks ({minutes:.1f} min de jogo): {len(data)} bytes"
+          f" ({len(data) / max(minutes, 1e-9):.0f} bytes/min) | gravação {spent / ticks * 1e6:.1f} µs/tick"
+          f" | pontuação {world.player.score} | vida {world.player.health}")
+
+    replay = Replay(data)
+
+    def on_frame(world):
+        renderer.draw(world)
+        renderer.present()
+
+    ok = True
+    for name, on_tick in (("sem janela", None), ("desenhando", on_frame)):
+        start = time.perf_counter()
+        replayed, count, mismatches = play(replay, on_tick=on_tick)
+        elapsed = time.perf_counter() - start
+        same = (not mismatches and count == ticks and replayed.player.score == world.player.score)
+        ok &= same
+        print(f"{name:<11} {count} ticks em {elapsed:.3f}s ({count / elapsed:8.0f} ticks/s,"
+              f" {count / TICK_RATE / elapsed:6.1f}x tempo real) | "
+              + ("✅ mesmo estado" if same else f"❌ divergiu nos ticks {mismatches}"))
+    pygame.quit()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
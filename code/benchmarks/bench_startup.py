@@ -0,0 +1,97 @@
+"""
+Tempo até o primeiro quadro: cada medida é um processo Python novo (drivers
+dummy do SDL) que importa main.py, chama bootstrap(), desenha o primeiro
+quadro da partida e depois roda o carregamento em segundo plano (áudio,
+assets restantes e rede), como o jogo faz. Mostra também as fases do
+StartupTimer (imports, display, assets, jogo, primeiro quadro...) e confere
+que só importar main não inicia vídeo, som nem fontes.
+
+Compara o caminho antigo (todos os PNG decodificados e escalados antes da
+janela, aqui simulado com load_defaults() completo a partir dos arquivos
+soltos) com o novo (pacote assets.bundle via mmap e só os sprites da primeira
+cena antes do primeiro quadro). O pacote é gerado num diretório temporário.
+
+Uso:
+    python benchmarks/bench_startup.py [repetições]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import asyncio, json, sys, time
+t_exec = time.time()
+import main
+import pygame
+imported = {{"display": pygame.display.get_init(), "mixer": pygame.mixer.get_init() is not None,
+            "font": pygame.font.get_init()}}  # Importar main não pode iniciar nada
+first_assets = None if {eager} else main.FIRST_SCENE  # Caminho antigo: tudo antes da janela
+game = main.bootstrap(first_assets)
+game.scenes.switch("playing")
+game.scenes.tick(0.0)
+first = time.time()
+asyncio.run(game.load_background())
+done = time.time()
+print(json.dumps({{"exec": t_exec, "first": first, "done": done, "imported": imported,
+                  "phases": game.timer.phases, "bundle": game.assets.bundle is not None,
+                  "load_times": game.assets.load_times}}))
+"""
+
+
+def measure(bundle_path, eager):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", ASSET_BUNDLE=bundle_path,
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.time()
+    out = subprocess.run([sys.executable, "-c", CHILD.format(eager=eager)], cwd=CODE_DIR, env=env,
+                         capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return {
+        "first_ms": (result["first"] - start) * 1000,  # Do spawn do processo ao primeiro quadro
+        "python_ms": (result["exec"] - start) * 1000,  # Só subir o interpretador
+        "ready_ms": (result["done"] - start) * 1000,  # Todos os assets carregados
+        "phases": result["phases"],  # StartupTimer de main.py
+        "imported": result["imported"],
+        "bundle": result["bundle"],
+        "load_times": result["load_times"],
+    }
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sys.path.insert(0, CODE_DIR)
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.chdir(CODE_DIR)
+    from bundle import build
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = os.path.join(tmp, "assets.bundle")
+        build(bundle_path)
+        modes = {
+            "antigo (arquivos, tudo antes)": (os.path.join(tmp, "nenhum.bundle"), True),
+            "pacote + carga sob demanda": (bundle_path, False),
+        }
+        print(f"{runs} processos por modo\n")
+        for name, (path, eager) in modes.items():
+            samples = [measure(path, eager) for _ in range(runs)]
+            first = statistics.median(s["first_ms"] for s in samples)
+            python = statistics.median(s["python_ms"] for s in samples)
+            ready = statistics.median(s["ready_ms"] for s in samples)
+            loads = samples[-1]["load_times"]
+            phases = {name: statistics.median(s["phases"][name] for s in samples) for name in samples[-1]["phases"]}
+            side_effects = [k for k, v in samples[-1]["imported"].items() if v]
+            print(f"== {name} ==")
+            print(f"Primeiro quadro: {first:.0f} ms (mediana; {python:.0f} ms só do interpretador)"
+                  f" | tudo carregado: {ready:.0f} ms")
+            print("Fases: " + ", ".join(f"{k} {v:.1f}" for k, v in phases.items()) + " ms")
+            print(f"Iniciado só por importar main: {', '.join(side_effects) or 'nada'}")
+            print("Carga por asset: " + ", ".join(f"{k} {v:.1f}" for k, v in loads.items()) + " ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Suíte de benchmarks headless: roda os cenários de scenarios.py (idle, swarm,
+bullet_hell, meteor_storm, horde, long_session) com os drivers dummy do SDL,
+duas vezes cada um: só a simulação (update) e simulação + desenho (update_render).
+
+Para cada modo mede quadros/s, a distribuição do tempo por quadro (média,
+p50/p90/p95/p99, máximo e quantos passaram de 16,7 ms) e, numa passada à
+parte com tracemalloc (que deixa tudo mais lento), o pico de memória Python.
+O resultado vai para um JSON; com --baseline compara com um JSON anterior
+(ex.: gerado em outro commit) e mostra a variação de cada número.
+
+Uso:
+    python benchmarks/bench_suite.py [--scenarios swarm,idle] [--scale 0.25]
+        [--no-render] [--no-memory] [--out bench_results.json] [--baseline antigo.json]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from render import Renderer  # noqa: E402
+from scenarios import SCENARIOS  # noqa: E402
+from world import WIDTH, HEIGHT  # noqa: E402
+
+FRAME_BUDGET_MS = 1000 / 60
+MODES = ("update", "update_render")
+
+
+class FrameTimer:
+    """ on_frame do cenário: anota o tempo de cada quadro num array pré-alocado """
+
+    def __init__(self, frames, draw=None):
+        self.times = np.zeros(frames, dtype=np.int64)
+        self.draw = draw
+        self.count = 0
+        self.last = time.perf_counter_ns()
+
+    def __call__(self, world):
+        if self.draw is not None:
+            self.draw(world)
+        now = time.perf_counter_ns()
+        self.times[self.count] = now - self.last
+        self.last = now
+        self.count += 1
+
+
+def make_draw(renderer):
+    def draw(world):
+        renderer.draw(world)
+        renderer.present()
+    return draw
+
+
+def distribution(times_ns):
+    ms = times_ns / 1e6
+    p50, p90, p95, p99 = np.percentile(ms, (50, 90, 95, 99)).tolist()
+    return {
+        "fps": round(len(ms) / (ms.sum() / 1000), 1),
+        "mean_ms": round(float(ms.mean()), 4),
+        "p50_ms": round(p50, 4),
+        "p90_ms": round(p90, 4),
+        "p95_ms": round(p95, 4),
+        "p99_ms": round(p99, 4),
+        "max_ms": round(float(ms.max()), 4),
+        "over_budget": int(np.count_nonzero(ms > FRAME_BUDGET_MS)),
+    }
+
+
+def run_mode(scenario, renderer, memory):
+    """ Um cenário em um modo (renderer=None: só update) """
+    world = scenario.create_world(player_size=renderer.tank_img.get_size() if renderer else (32, 32))
+    draw = make_draw(renderer) if renderer else None
+    if renderer:
+        renderer.invalidate()
+
+    timer = FrameTimer(scenario.frames, draw)
+    timer.last = time.perf_counter_ns()
+    scenario.run(world, timer)
+    result = distribution(timer.times)
+    result["final"] = {"enemies": world.enemy_count, "meteors": world.meteor_count,
+                       "bullets": world.projectiles.count, "score": world.player.score}
+
+    if memory:
+        # Mesma partida de novo (mesma semente), agora com tracemalloc
+        world = scenario.create_world(player_size=renderer.tank_img.get_size() if renderer else (32, 32))
+        if renderer:
+            renderer.invalidate()
+        tracemalloc.start()
+        scenario.run(world, draw)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_kib"] = round(peak / 1024, 1)
+        result["end_memory_kib"] = round(current / 1024, 1)
+    return result
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                             cwd=CODE_DIR, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, baseline):
+    """ Variação (%) de fps e p99 em relação a um JSON anterior """
+    print(f"\n== Comparado com {baseline.get('commit') or 'baseline'} ==")
+    for name, modes in results["scenarios"].items():
+        old_modes = baseline.get("scenarios", {}).get(name)
+        if not old_modes:
+            continue
+        for mode, new in modes["modes"].items():
+            old = old_modes["modes"].get(mode)
+            if not old:
+                continue
+            fps = (new["fps"] / old["fps"] - 1) * 100
+            p99 = (new["p99_ms"] / old["p99_ms"] - 1) * 100 if old["p99_ms"] else 0.0
+            print(f"{name:<13}{mode:<14} fps {old['fps']:>9.1f} -> {new['fps']:>9.1f} ({fps:+6.1f}%)"
+                  f" | p99 {old['p99_ms']:.3f} -> {new['p99_ms']:.3f} ms ({p99:+6.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks headless por cenário")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="nomes separados por vírgula")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplica a duração dos cenários")
+    parser.add_argument("--no-render", action="store_true", help="só o modo update")
+    parser.add_argument("--no-memory", action="store_true", help="pula a passada com tracemalloc")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--baseline", help="JSON anterior para comparar")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)} (existem: {', '.join(SCENARIOS)})")
+
+    renderer = None
+    if not args.no_render:
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        renderer = Renderer(screen, AssetRegistry().load_defaults(), prebake=True)
+
+    results = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "scenarios": {},
+    }
+    for name in names:
+        scenario = SCENARIOS[name]
+        scenario.frames = max(1, int(scenario.frames * args.scale))
+        entry = {"description": scenario.description, "seed": scenario.seed, "frames": scenario.frames,
+                 "modes": {}}
+        for mode in MODES:
+            if mode == "update_render" and renderer is None:
+                continue
+            result = run_mode(scenario, renderer if mode == "update_render" else None, not args.no_memory)
+            entry["modes"][mode] = result
+            memory = f" | pico {result['peak_memory_kib']:.0f} KiB" if "peak_memory_kib" in result else ""
+            print(f"{name:<13}{mode:<14} {result['fps']:>9.1f} q/s | p50 {result['p50_ms']:.3f}"
+                  f" p99 {result['p99_ms']:.3f} máx {result['max_ms']:.2f} ms"
+                  f" | >16,7 ms: {result['over_budget']}{memory}")
+        results["scenarios"][name] = entry
+
+    if renderer is not None:
+        pygame.quit()
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Resultados em {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Confere o passo fixo da partida: a mesma PlayingScene roda 10 s de tempo real
+com o desenho a várias taxas (30, 60, 144 FPS e 45 FPS com variação) e conta
+quantos ticks a simulação deu. Com o acumulador são sempre 60 por segundo e,
+com a mesma semente, o mundo termina no mesmo estado seja qual for o FPS. No
+laço antigo (um tick por quadro desenhado) a 30 FPS o jogo rodava na metade
+da velocidade.
+
+A 10 FPS cada quadro precisaria de 6 ticks; o limite max_steps (5) descarta o
+excedente e o jogo desacelera um pouco em vez de entrar em espiral.
+
+Uso:
+    python benchmarks/bench_timestep.py [segundos]
+"""
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from render import Renderer  # noqa: E402
+from scenes import SceneManager, PlayingScene  # noqa: E402
+from world import World, WIDTH, HEIGHT, TICK_RATE  # noqa: E402
+
+RATES = {"30 FPS": (30, 0.0), "60 FPS": (60, 0.0), "144 FPS": (144, 0.0), "45 FPS ± 40%": (45, 0.4),
+         "10 FPS": (10, 0.0)}
+
+
+def world_state(world):
+    """ Resumo do estado para comparar partidas """
+    enemies = world.entities.query("position", "chase")
+    return (world.frame, world.player.score, world.enemy_count,
+            round(sum(float(e["x"].sum() + e["y"].sum()) for e in enemies), 6))
+
+
+def run(renderer, assets, seconds, fps, jitter, seed=1):
+    world = World(seed=seed, player_size=assets.frame("ship").get_size())
+    world.max_enemies = 20
+    world.enemy_spawn_rate = 20
+    scene = PlayingScene(world, renderer)
+    manager = SceneManager({"playing": scene})
+    manager.switch("playing")
+    manager.step([], 0.0)
+
+    rng = random.Random(seed)
+    elapsed = 0.0
+    frames = 0
+    while elapsed < seconds - 1e-9:
+        dt = min(1.0 / fps * (1 + rng.uniform(-jitter, jitter)), seconds - elapsed)
+        manager.step([], dt)
+        manager.draw()
+        elapsed += dt
+        frames += 1
+        world.player.health = 5  # A partida não pode acabar no meio da medição
+    return scene, frames, world_state(world)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry().load_defaults()
+    renderer = Renderer(screen, assets, prebake=True)
+
+    print(f"{seconds:.0f} s de tempo real, simulação a {TICK_RATE} ticks/s\n")
+    _, _, reference = run(renderer, assets, seconds, 60, 0.0)
+    for name, (fps, jitter) in RATES.items():
+        scene, frames, state = run(renderer, assets, seconds, fps, jitter)
+        speed = scene.ticks / (seconds * TICK_RATE)
+        legacy = frames / (seconds * TICK_RATE)  # Um tick por quadro, como antes
+        same = "sim" if state == reference else "não"
+        print(f"{name:<14} {frames:>5} quadros | {scene.ticks:>5} ticks | velocidade {speed:6.1%}"
+              f" (laço antigo {legacy:6.1%}) | descartado {scene.dropped:.2f} s | mesmo estado de 60 FPS: {same}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Servidor local que imita o endpoint REST do Firebase Realtime Database usado
+pelo ranking (/records.json): GET com orderBy="score", limitToLast, startAt e
+endAt, POST criando um registro com chave gerada e PATCH gravando vários
+registros com chaves escolhidas pelo cliente. GETs com "X-Firebase-ETag: true"
+recebem o cabeçalho ETag, e If-None-Match com o ETag atual responde 304.
+
+Serve para medir latência e reuso de conexões sem internet. Conta conexões e
+requisições, e pode simular o custo do handshake (TCP+TLS) e do servidor.
+
+Uso:
+    python benchmarks/fake_firebase.py [--port 8765] [--records 1000] [--handshake 0.05] [--latency 0.01]
+e depois:
+    FIREBASE_URL=http://127.0.0.1:8765/records.json python main.py
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import random
+from urllib.parse import urlsplit, parse_qs
+
+
+class FakeFirebase:
+    def __init__(self, records=0, handshake=0.0, latency=0.0, index=True, seed=0):
+        """
+        records: quantidade de recordes aleatórios para começar
+        handshake: segundos de atraso na primeira resposta de cada conexão
+        latency: segundos de atraso em toda resposta
+        index: False imita o banco sem ".indexOn": consultas ordenadas dão erro 400
+        """
+        self.handshake = handshake
+        self.latency = latency
+        self.index = index
+        self._keys = (f"-fake{n:08d}" for n in itertools.count())
+        rng = random.Random(seed)
+        self.records = {}
+        for _ in range(records):
+            name = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3))
+            self.records[next(self._keys)] = {"name": name, "score": rng.randint(0, 500) * 5}
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0  # Respostas 304
+        self._server = None
+        self.port = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/records.json"
+
+    async def start(self, port=0):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    # ---------- HTTP/1.1 mínimo com keep-alive ---------- #
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        first = True
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = b""
+                if "content-length" in headers:
+                    body = await reader.readexactly(int(headers["content-length"]))
+
+                self.requests += 1
+                delay = self.latency + (self.handshake if first else 0.0)
+                first = False
+                if delay:
+                    await asyncio.sleep(delay)
+
+                status, payload = self.route(method, target, body)
+                data = json.dumps(payload).encode()
+                extra = ""
+                if method == "GET" and status.startswith("200") and (
+                        headers.get("x-firebase-etag") == "true" or "if-none-match" in headers):
+                    etag = base64.b64encode(hashlib.sha1(data).digest()).decode()
+                    extra = f"ETag: {etag}\r\n"
+                    if headers.get("if-none-match") == etag:
+                        self.not_modified += 1
+                        status, data = "304 Not Modified", b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"{extra}"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def route(self, method, target, body):
+        """ Retorna (status, objeto JSON) para uma requisição """
+        parts = urlsplit(target)
+        if parts.path != "/records.json":
+            return "404 Not Found", {"error": "404 Not Found"}
+        if method == "POST":
+            key = next(self._keys)
+            self.records[key] = json.loads(body or b"null")
+            return "200 OK", {"name": key}
+        if method == "PATCH":
+            children = json.loads(body or b"{}")
+            self.records.update(children)
+            return "200 OK", children
+        if method != "GET":
+            return "405 Method Not Allowed", {"error": "Method not allowed"}
+
+        query = {name: json.loads(values[0]) for name, values in parse_qs(parts.query).items()}
+        if not query:
+            return "200 OK", self.records or None
+        if query.get("orderBy") != "score":
+            return "400 Bad Request", {"error": "orderBy must be a valid JSON encoded path"}
+        if not self.index:
+            return "400 Bad Request", {"error": "Index not defined, add \".indexOn\": \"score\", for path \"/records\", to the rules"}
+
+        items = sorted(self.records.items(), key=lambda kv: (kv[1].get("score", 0), kv[0]))
+        if "startAt" in query:
+            items = [kv for kv in items if kv[1].get("score", 0) >= query["startAt"]]
+        if "endAt" in query:
+            items = [kv for kv in items if kv[1].get("score", 0) <= query["endAt"]]
+        if "limitToLast" in query:
+            items = items[-query["limitToLast"]:] if query["limitToLast"] else []
+        if "limitToFirst" in query:
+            items = items[:query["limitToFirst"]]
+        return "200 OK", dict(items)
+
+
+async def _serve(args):
+    server = FakeFirebase(args.records, args.handshake, args.latency, index=not args.no_index)
+    url = await server.start(args.port)
+    print(f"🔥 Firebase falso em {url} ({len(server.records)} recordes)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--handshake", type=float, default=0.0, help="atraso por conexão nova (s)")
+    parser.add_argument("--latency", type=float, default=0.0, help="atraso por requisição (s)")
+    parser.add_argument("--no-index", action="store_true", help="recusa consultas ordenadas")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
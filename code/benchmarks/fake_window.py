@@ -0,0 +1,99 @@
+"""
+Substituto de platform.window do PyGBag para rodar o caminho do navegador
+(FetchBridge) no desktop. window.Fetch imita a API definida por
+fetch_bridge.JS_CODE: start() "dispara" a requisição, que termina depois de
+uma latência simulada (ou estoura o tempo limite, como o AbortController), e
+drain() devolve os resultados prontos como JSON.
+
+As respostas vêm de um handler(method, url, body, headers) -> (status,
+cabeçalhos, texto); firebase_handler() liga o shim ao FakeFirebase sem abrir
+sockets.
+
+Uso:
+    window = FakeWindow(firebase_handler(FakeFirebase(records=100)), latency=0.05)
+    handler = RequestHandler(window=window)
+"""
+import asyncio
+import json
+import random
+from urllib.parse import urlsplit
+
+
+class FakeFetch:
+    def __init__(self, handler, latency=0.05, jitter=0.0, seed=0):
+        """
+        latency: segundos até a resposta, ou função latency(method, url) -> segundos
+        jitter: atraso extra aleatório entre 0 e jitter segundos
+        """
+        self.handler = handler
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.results = []
+        self._handles = {}  # id -> (conclusão, tempo limite) agendados no event loop
+        self.calls = {"start": 0, "abort": 0, "drain": 0}
+
+    def start(self, request_id, method, url, body, headers, timeout):
+        self.calls["start"] += 1
+        loop = asyncio.get_running_loop()
+        latency = self.latency(method, url) if callable(self.latency) else self.latency
+        delay = latency + self.random.uniform(0, self.jitter)
+        done = loop.call_later(delay, self._complete, request_id, method, url, body, json.loads(headers))
+        expire = loop.call_later(timeout / 1000, self._fail, request_id, "AbortError: timeout", True)
+        self._handles[request_id] = (done, expire)
+
+    def abort(self, request_id):
+        self.calls["abort"] += 1
+        self._fail(request_id, "AbortError: The operation was aborted.")
+
+    def drain(self):
+        self.calls["drain"] += 1
+        if not self.results:
+            return ""
+        done = json.dumps(self.results)
+        self.results = []
+        return done
+
+    def _finish(self, request_id):
+        handles = self._handles.pop(request_id, None)
+        if handles is None:
+            return False  # Já terminou (resposta, erro ou abortada)
+        for handle in handles:
+            handle.cancel()
+        return True
+
+    def _complete(self, request_id, method, url, body, headers):
+        if not self._finish(request_id):
+            return
+        try:
+            status, response_headers, text = self.handler(method, url, body, headers)
+        except Exception as e:
+            self.results.append({"id": request_id, "error": f"TypeError: {e}"})
+            return
+        self.results.append({"id": request_id, "status": status, "headers": response_headers, "text": text})
+
+    def _fail(self, request_id, error, timeout=False):
+        if self._finish(request_id):
+            self.results.append({"id": request_id, "error": error, "timeout": timeout})
+
+
+class FakeWindow:
+    def __init__(self, handler, latency=0.05, jitter=0.0, seed=0):
+        self.Fetch = FakeFetch(handler, latency, jitter, seed)
+        self.evaluated = []
+
+    def eval(self, code):
+        # O JS de verdade não roda aqui; FakeFetch já faz o papel de window.Fetch
+        self.evaluated.append(code)
+
+
+def firebase_handler(firebase):
+    """ handler que responde com FakeFirebase.route(), como o servidor local """
+
+    def handler(method, url, body, headers):
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        status, payload = firebase.route(method, target, (body or "").encode())
+        return int(status.split()[0]), {"Content-Type": "application/json"}, json.dumps(payload)
+
+    return handler
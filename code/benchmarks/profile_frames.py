@@ -0,0 +1,93 @@
+"""
+Roda o jogo sem janela (drivers dummy do SDL) com um bot e o profiler de
+quadros ligado, mostra p50/p95/p99 por fase e salva o CSV e o trace do
+Chrome, para comparar versões. Também mede o mesmo número de quadros com o
+profiler desligado e ligado, para mostrar o custo da medição.
+
+Uso:
+    python benchmarks/profile_frames.py [quadros] [prefixo de saída]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from profiler import FrameProfiler, WORLD_COUNTERS, world_counters, instrument_game  # noqa: E402
+from render import Renderer  # noqa: E402
+from world import World, Inputs, WIDTH, HEIGHT  # noqa: E402
+
+
+def patrol(world):
+    # Alterna entre voar (câmera rolando) e ficar parado atirando
+    phase = world.frame % 240
+    return Inputs(left=phase < 30, up=phase < 60, shoot=world.frame % 8 == 0)
+
+
+class BotGame:
+    """ Um quadro do jogo sem o SceneManager: bot, simulação, desenho e apresentação """
+
+    def __init__(self, world, renderer):
+        self.world = world
+        self.renderer = renderer
+
+    def tick(self):
+        world = self.world
+        world.step(patrol(world))
+        if world.game_over:
+            world.reset()
+            self.renderer.invalidate()
+        self.renderer.draw(world)
+        self.renderer.present()
+
+
+def timed_run(game, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.tick()
+    return time.perf_counter() - start
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    prefix = sys.argv[2] if len(sys.argv) > 2 else "profile_bench"
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry().load_defaults()
+    world = World(seed=1, player_size=assets.frame("ship").get_size())
+    world.max_enemies = 20  # Partida mais movimentada que o padrão
+    renderer = Renderer(screen, assets, prebake=True)
+    game = BotGame(world, renderer)
+
+    profiler = FrameProfiler(capacity=frames, counters=world_counters(world), counter_names=WORLD_COUNTERS)
+    instrument_game(profiler, world, renderer)
+    profiler.frame(game, "tick")
+
+    timed_run(game, 300)  # Aquecimento (caches de rotação e de texto)
+    world.reset()
+    off = timed_run(game, frames)
+    world.reset()
+    profiler.enable()
+    on = timed_run(game, frames)
+    profiler.disable()
+    pygame.quit()
+
+    print(f"{frames} quadros | desligado {off * 1000 / frames:.3f} ms/quadro"
+          f" | ligado {on * 1000 / frames:.3f} ms/quadro ({(on / off - 1) * 100:+.1f}%)\n")
+    print(profiler.report())
+    rows = profiler.to_csv(f"{prefix}.csv")
+    events = profiler.to_chrome_trace(f"{prefix}.json")
+    print(f"\n{rows} quadros em {prefix}.csv | {events} eventos em {prefix}.json (chrome://tracing)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Teste de resistência das cenas: milhares de reinícios seguidos (partida ->
+iniciais -> game over -> às vezes top 10 -> partida, e às vezes R no meio da
+partida) passando pelo mesmo SceneManager usado no jogo.
+
+Mede a memória alocada (tracemalloc) e a profundidade da pilha de chamadas a
+cada bloco de reinícios. Com o laço único as duas ficam constantes; no laço
+antigo cada reinício abria mais um main() dentro do anterior.
+
+Uso:
+    python benchmarks/soak_scenes.py [reinícios]
+"""
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # Os assets são carregados por caminho relativo
+
+import pygame  # noqa: E402
+
+from assets import AssetRegistry  # noqa: E402
+from hud import TextCache  # noqa: E402
+from leaderboard import LeaderboardCache  # noqa: E402
+from render import Renderer  # noqa: E402
+from scenes import (SceneManager, PlayingScene, InitialsScene,  # noqa: E402
+                    GameOverScene, LeaderboardScene)
+from world import World, WIDTH, HEIGHT  # noqa: E402
+
+FRAMES_PER_GAME = 10  # Quadros jogados antes de forçar o fim da partida
+DT = 1 / 60
+
+
+class StaticLeaderboard:
+    """ Ranking fixo no lugar do LeaderboardClient (o teste não usa rede) """
+
+    async def top_conditional(self, n=10, etag=None):
+        return [{"key": f"-k{i}", "name": "AAA", "score": 100 - i} for i in range(n)], None
+
+
+class ProbedPlayingScene(PlayingScene):
+    """ PlayingScene que anota a profundidade da pilha a cada entrada """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.depths = set()
+
+    def enter(self):
+        self.depths.add(stack_depth())
+        super().enter()
+
+
+def key_event(key, char=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0, scancode=0)
+
+
+def stack_depth():
+    frame, depth = sys._getframe(), 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+async def soak(restarts, report_every):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = AssetRegistry().load_defaults()
+    text_cache = TextCache()
+    world = World(seed=1, player_size=assets.frame("ship").get_size())
+    bg_img = assets.frame("background")
+    cache = LeaderboardCache(StaticLeaderboard())
+    playing = ProbedPlayingScene(world, Renderer(screen, assets, text_cache=text_cache))
+    depths = playing.depths
+    manager = SceneManager({
+        "playing": playing,
+        "initials": InitialsScene(screen, bg_img, text_cache, lambda name, score: None, pause=0.0),
+        "game_over": GameOverScene(screen, bg_img, text_cache),
+        "leaderboard": LeaderboardScene(screen, bg_img, text_cache, cache),
+    }, text_cache=text_cache)
+
+    def frame(events=()):
+        manager.step(list(events), DT)
+        manager.draw()
+
+    manager.switch("playing")
+    frame()
+
+    tracemalloc.start()
+    samples = []
+    start = time.perf_counter()
+    for n in range(1, restarts + 1):
+        for _ in range(FRAMES_PER_GAME):
+            frame()
+        if n % 5 == 0:
+            frame([key_event(pygame.K_r)])  # Reinício no meio da partida
+        else:
+            world.player.health = 0
+            frame()  # Partida -> iniciais
+            frame([key_event(pygame.K_a, "a"), key_event(pygame.K_b, "b"), key_event(pygame.K_c, "c")])
+            frame([key_event(pygame.K_RETURN)])  # Iniciais -> game over
+            if n % 10 == 1:
+                frame([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=manager.current.ranking_rect.center, button=1)])
+                await asyncio.sleep(0)  # Deixa a revalidação do cache rodar
+                frame()
+                frame([key_event(pygame.K_ESCAPE)])  # Top 10 -> game over
+            frame([key_event(pygame.K_RETURN)])  # Game over -> partida
+        assert manager.current_name == "playing"
+
+        if n % report_every == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            samples.append((n, current, peak, max(depths)))
+            print(f"{n:>7} reinícios | memória {current / 1024:8.1f} KiB (pico {peak / 1024:8.1f} KiB)"
+                  f" | pilha {max(depths)} quadros | trocas de cena {manager.switches}")
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    await cache.close()
+    pygame.quit()
+    return samples, elapsed, depths
+
+
+def main():
+    restarts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    report_every = max(1, restarts // 10)
+    samples, elapsed, depths = asyncio.run(soak(restarts, report_every))
+
+    print(f"\n{restarts} reinícios em {elapsed:.1f}s")
+    if len(samples) >= 2:
+        # O primeiro bloco inclui aquecimento (caches de texto e de rotação)
+        growth = samples[-1][1] - samples[1][1]
+        print(f"Crescimento de memória após o aquecimento: {growth / 1024:+.1f} KiB")
+    print(f"Profundidades de pilha vistas ao reiniciar: {sorted(depths)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+import pygame
+
+# =================== Pacote de assets =================== #
+# Todos os sprites e sons num arquivo só (assets.bundle), gerado por
+# `python bundle.py`. Os sprites já vão escalados no tamanho em que são
+# desenhados e guardados como pixels crus (RGB/RGBA): carregar é só apontar
+# uma superfície para o trecho do arquivo (mmap), sem decodificar PNG nem
+# escalar o fundo de 2048x1536. Os sons vão como o OGG original.
+#
+# Formato: "SJB1", tamanho do índice (uint32 LE), índice JSON e os dados.
+# Cada entrada do índice tem offset (a partir do fim do índice) e size.
+
+BUNDLE_FILE = "assets.bundle"
+MAGIC = b"SJB1"
+HEADER = struct.Struct("<4sI")
+
+
+def sprite_key(name, index):
+    return f"sprite/{name}/{index}"
+
+
+def sound_key(name):
+    return f"sound/{name}"
+
+
+class Bundle:
+    def __init__(self, path):
+        """ Abre o pacote; usa mmap quando a plataforma permite, senão lê tudo para a memória """
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.mapped = True
+            except (OSError, ValueError):
+                f.seek(0)
+                self._data = f.read()
+                self.mapped = False
+        magic, index_size = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} não é um pacote de assets")
+        self.index = json.loads(bytes(self._data[HEADER.size:HEADER.size + index_size]))
+        self._start = HEADER.size + index_size
+
+    @classmethod
+    def open(cls, path=BUNDLE_FILE):
+        """ Bundle ou None se o arquivo não existir ou estiver corrompido (o jogo usa os arquivos soltos) """
+        try:
+            return cls(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            print(f"❌ Pacote de assets inválido ({path}): {e}")
+            return None
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def view(self, key):
+        """ Bytes da entrada, sem cópia """
+        entry = self.index[key]
+        start = self._start + entry["offset"]
+        return memoryview(self._data)[start:start + entry["size"]]
+
+    def image(self, key):
+        """ Superfície apontando para os pixels da entrada (converta ou copie antes de fechar o pacote) """
+        entry = self.index[key]
+        return pygame.image.frombuffer(self.view(key), (entry["width"], entry["height"]), entry["format"])
+
+    def sound(self, key):
+        return pygame.mixer.Sound(file=io.BytesIO(self.view(key)))
+
+    def close(self):
+        if self.mapped:
+            self._data.close()
+
+
+# =================== Geração do pacote =================== #
+def build(path=BUNDLE_FILE, base_dir=""):
+    """ Empacota SPRITES e SOUNDS de assets.py; retorna o índice gerado """
+    from assets import SPRITES, SOUNDS, load_image
+
+    index = {}
+    blobs = []
+    offset = 0
+
+    def add(key, data, **info):
+        nonlocal offset
+        index[key] = dict(info, offset=offset, size=len(data))
+        blobs.append(data)
+        offset += len(data)
+
+    for name, (files, size, fallback_color, alpha) in SPRITES.items():
+        for i, file_name in enumerate(files):
+            surface = load_image(os.path.join(base_dir, file_name), fallback_color)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            fmt = "RGBA" if alpha else "RGB"
+            add(sprite_key(name, i), pygame.image.tobytes(surface, fmt), kind="image", source=file_name,
+                format=fmt, width=surface.get_width(), height=surface.get_height())
+
+    for name, file_name in SOUNDS.items():
+        with open(os.path.join(base_dir, file_name), "rb") as f:
+            add(sound_key(name), f.read(), kind="sound", source=file_name)
+
+    header = json.dumps(index, separators=(",", ":")).encode()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)  # Quem estiver lendo o pacote antigo nunca vê um arquivo pela metade
+    return index
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_FILE
+    start = time.perf_counter()
+    index = build(out)
+    total = sum(entry["size"] for entry in index.values())
+    sources = {entry["source"] for entry in index.values()}
+    source_bytes = sum(os.path.getsize(f) for f in sources if os.path.exists(f))
+    print(f"📦 {len(index)} entradas em {out}: {total / 1024:.0f} KiB"
+          f" (arquivos originais: {source_bytes / 1024:.0f} KiB) em {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,203 @@
+import math
+
+import numpy as np
+
+# =================== Broad-phase de colisão =================== #
+# Grade uniforme (spatial hash) compartilhada por todos os testes de colisão
+# de um tick: World a refaz uma vez por tick, logo depois do movimento, com
+# uma camada por grupo de corpos (cada arquétipo com collider e os tiros dos
+# inimigos), e cada corpo entra na célula do seu centro. Uma consulta só olha
+# as células ao alcance dos pontos dados, então o custo por consulta não
+# cresce com o número total de entidades no mundo, só com as que estão perto.
+# O teste exato (distância entre círculos) continua com quem chamou.
+#
+# Sem listas por célula: cada camada é o array das chaves de célula ordenado
+# (coluna, linha), com a linha de cada corpo na mesma ordem. As células de
+# uma coluna ficam contíguas, então cada coluna consultada é uma faixa achada
+# por busca binária (searchsorted). Chave e linha vão juntas num int64 que é
+# ordenado no lugar, nos arrays da camada reaproveitados a cada tick: refazer
+# a grade não aloca arrays.
+
+_BIAS = 1 << 15  # Soma às coordenadas de célula (corpos fora da tela têm célula negativa)
+_SPAN = 1 << 16  # Chave da célula = (cx + _BIAS) * _SPAN + cy + _BIAS (até ~2 milhões de px para cada lado)
+_ROW_BITS = 20  # Linha nos bits de baixo: chave * 2 ** 20 + linha cabe nos 53 bits exatos de um float64
+_NONE = np.zeros(0, dtype=np.intp)  # Nenhum índice, reaproveitado
+# Escalares como arrays 0-d: com int/float do Python o NumPy converte (e aloca) o operando a cada chamada
+_BIAS_F = np.array(float(_BIAS))
+_SPAN_F = np.array(float(_SPAN))
+_ROW_SCALE = np.array(float(1 << _ROW_BITS))
+_ROW_SHIFT = np.array(_ROW_BITS, dtype=np.int64)
+_ROW_MASK = np.array((1 << _ROW_BITS) - 1, dtype=np.int64)
+
+
+class _Layer:
+    """ Corpos de uma camada: chaves de célula ordenadas e a linha de cada um, em arrays que só crescem """
+
+    __slots__ = ("count", "radius", "keys", "rows", "packed")
+
+    def __init__(self):
+        self.count = 0
+        self.radius = 0
+        self.keys = self.rows = self.packed = _NONE
+
+    def reserve(self, rows):
+        capacity = max(len(self.keys), 16)
+        if len(self.keys) < rows:
+            while capacity < rows:
+                capacity *= 2
+            self.keys = np.zeros(capacity, dtype=np.int64)
+            self.rows = np.zeros(capacity, dtype=np.intp)
+            self.packed = np.zeros(capacity, dtype=np.int64)
+
+
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cell = np.array(float(cell_size))
+        self.layers = {}  # camada (qualquer chave, ex.: o arquétipo) -> _Layer
+        self._offsets = {}  # células ao redor -> deslocamentos das faixas de chaves (veja _bounds)
+        # Arrays de trabalho, crescem conforme a maior camada ou consulta
+        self._arange = np.zeros(0)  # 0, 1, 2... (linhas padrão de insert)
+        self._cells = np.zeros((2, 0))  # Células de x e de y, em float
+        self._ints = np.zeros(0, dtype=np.int64)  # Célula de cada ponto de query()
+        self._values = np.zeros(0, dtype=np.int64)  # Limites das faixas de query()
+        self._found = np.zeros(0, dtype=np.intp)  # Candidatos de near()
+
+    def __len__(self):
+        return sum(layer.count for layer in self.layers.values())
+
+    def clear(self):
+        """ Esvazia todas as camadas (os arrays ficam para o próximo tick) """
+        for layer in self.layers.values():
+            layer.count = 0
+
+    def _scratch(self, n):
+        if self._cells.shape[1] < n:
+            capacity = max(n, 2 * self._cells.shape[1], 16)
+            self._arange = np.arange(capacity, dtype=np.float64)
+            self._cells = np.zeros((2, capacity))
+            self._ints = np.zeros(capacity, dtype=np.int64)
+        return self._cells[0, :n], self._cells[1, :n]
+
+    def _floor_cells(self, xs, ys):
+        # Célula de cada ponto, em float: floor(x / cell_size), floor(y / cell_size)
+        cx, cy = self._scratch(len(xs))
+        np.divide(xs, self._cell, out=cx)
+        np.floor(cx, out=cx)
+        np.divide(ys, self._cell, out=cy)
+        np.floor(cy, out=cy)
+        return cx, cy
+
+    def insert(self, layer, xs, ys, radius, rows=None):
+        """
+        Preenche a camada com os corpos de centro (xs, ys); radius é o maior
+        raio entre eles e rows a linha de cada um, o que as consultas devolvem
+        (None = 0, 1, 2...). Substitui o que a camada tinha.
+        """
+        data = self.layers.get(layer)
+        if data is None:
+            data = self.layers[layer] = _Layer()
+        n = len(xs)
+        data.count = n
+        data.radius = radius
+        if not n:
+            return
+        data.reserve(n)
+        cx, cy = self._floor_cells(xs, ys)
+        # ((cx + _BIAS) * _SPAN + cy + _BIAS) * 2 ** _ROW_BITS + linha, exato em float
+        cx += _BIAS_F
+        cx *= _SPAN_F
+        cx += cy
+        cx += _BIAS_F
+        cx *= _ROW_SCALE
+        if rows is None:
+            cx += self._arange[:n]
+        else:
+            np.copyto(cy, rows)
+            cx += cy
+        packed = data.packed[:n]
+        np.copyto(packed, cx, casting="unsafe")
+        packed.sort()  # No lugar; dentro de uma célula fica a ordem das linhas
+        np.right_shift(packed, _ROW_SHIFT, out=data.keys[:n])
+        np.bitwise_and(packed, _ROW_MASK, out=data.rows[:n])
+
+    def _rings(self, radius, layer_radius):
+        # Células ao redor a olhar; uma a mais porque a célula de um ponto na borda pode sair arredondada
+        return int((radius + layer_radius) // self.cell_size) + 1
+
+    def near(self, layer, x, y, radius=0):
+        """
+        Linhas da camada com corpo em célula ao alcance do círculo (x, y,
+        radius): os candidatos, em ordem de célula. O array é reaproveitado
+        na próxima chamada de near().
+        """
+        data = self.layers.get(layer)
+        if data is None or not data.count:
+            return _NONE
+        n = data.count
+        keys = data.keys[:n]
+        rows = data.rows
+        rings = self._rings(radius, data.radius)
+        cx = math.floor(x / self.cell_size) + _BIAS
+        cy = math.floor(y / self.cell_size) + _BIAS
+        if len(self._found) < n:
+            self._found = np.zeros(max(n, 2 * len(self._found), 16), dtype=np.intp)
+        found = self._found
+        total = 0
+        for column in range(cx - rings, cx + rings + 1):
+            base = column * _SPAN + cy
+            lo = int(keys.searchsorted(base - rings, "left"))
+            hi = int(keys.searchsorted(base + rings, "right"))
+            if hi > lo:
+                found[total:total + hi - lo] = rows[lo:hi]
+                total += hi - lo
+        return found[:total] if total else _NONE
+
+    def _bounds(self, rings):
+        """ Somados a cx * _SPAN + cy: início de cada coluna ao alcance, depois o fim (exclusivo) de cada uma """
+        offsets = self._offsets.get(rings)
+        if offsets is None:
+            columns = [column * _SPAN + _BIAS * _SPAN + _BIAS for column in range(-rings, rings + 1)]
+            offsets = self._offsets[rings] = np.array(
+                [column - rings for column in columns] + [column + rings + 1 for column in columns], dtype=np.int64)
+        return offsets
+
+    def query(self, layer, xs, ys, radius=0):
+        """
+        Pares candidatos entre os pontos (xs, ys) (círculos de raio radius) e
+        os corpos da camada: retorna (pontos, linhas), com o índice do ponto
+        em xs e a linha do corpo de cada par, sem ordem.
+        """
+        data = self.layers.get(layer)
+        n = len(xs)
+        if data is None or not data.count or not n:
+            return _NONE, _NONE
+        keys = data.keys[:data.count]
+        offsets = self._bounds(self._rings(radius, data.radius))
+        width = len(offsets)
+        cx, cy = self._floor_cells(xs, ys)
+        cx *= _SPAN_F
+        cx += cy
+        cells = self._ints[:n]
+        np.copyto(cells, cx, casting="unsafe")
+        # Uma faixa de chaves por coluna ao alcance: valores[j * n + ponto], primeiro os inícios, depois os fins
+        if len(self._values) < width * n:
+            self._values = np.zeros(max(width * n, 2 * len(self._values)), dtype=np.int64)
+        values = self._values[:width * n]
+        for j in range(width):
+            np.add(cells, offsets[j], out=values[j * n:(j + 1) * n])
+        bounds = keys.searchsorted(values)
+        half = width * n // 2
+        lo = bounds[:half]
+        counts = bounds[half:]
+        counts -= lo
+        total = int(counts.sum())
+        if not total:
+            return _NONE, _NONE
+        # Junta as faixas: o k-ésimo candidato da faixa j está em lo[j] + k
+        ends = np.cumsum(counts)
+        index = np.arange(total) + np.repeat(lo - ends + counts, counts)
+        points = np.arange(half)
+        points %= n  # Índice do ponto de cada faixa: 0..n-1 uma vez por coluna
+        points = np.repeat(points, counts)
+        return points, data.rows[index]
@@ -0,0 +1,204 @@
+import numpy as np
+
+# =================== Entidades (ECS) =================== #
+# Uma entidade é uma linha de um arquétipo, o conjunto exato de componentes
+# que ela tem. Cada campo de cada componente é uma coluna contígua do
+# arquétipo: inimigos comuns ficam numa tabela, atiradores noutra, meteoros
+# noutra. Os sistemas (systems.py) pedem os arquétipos que têm os
+# componentes de que precisam (query) e rodam sobre colunas inteiras, então
+# cada sistema só custa o número de entidades que têm aqueles componentes.
+#
+# Um tipo de entidade é só dado (componentes e valores iniciais, veja
+# ENTITY_TYPES em world.py): tipos com os mesmos componentes dividem o
+# arquétipo e se diferenciam pelos valores. Os vivos ficam sempre nas
+# primeiras `count` linhas, na ordem em que nasceram; mortos só saem em
+# compact(), no fim do tick, então uma linha vale até lá. Da linha count em
+# diante alive é sempre False: os sistemas rodam sobre a capacidade inteira
+# (sem criar views [:count] a cada tick) e filtram o resultado por alive.
+
+# componente -> campos (nome, dtype); componentes sem campos são marcadores
+COMPONENTS = {
+    "position": (("x", np.float64), ("y", np.float64),
+                 ("px", np.float64), ("py", np.float64)),  # Posição no tick anterior (interpolação)
+    "velocity": (("vx", np.float64), ("vy", np.float64)),  # px/tick
+    "chase": (("speed", np.float64),),  # Persegue o jogador
+    "collider": (("radius", np.int32),),
+    "health": (("hp", np.int32),),
+    "target": (("pad", np.int32),),  # Alvo dos tiros do jogador; pad é somado ao raio no teste
+    "sprite": (("sheet", np.int32), ("frame", np.int32)),  # Sprite (índice em EntityStore.sheets) e quadro
+    "animation": (("frames", np.int32), ("timer", np.int32), ("delay", np.int32)),  # delay: ticks por quadro
+    "spin": (("angle", np.float64), ("prev_angle", np.float64), ("rate", np.float64)),  # Graus/tick
+    "shooter": (("owner", np.int32), ("cooldown", np.int32), ("reload", np.int32),
+                ("bullet_speed", np.float64)),  # owner: dono dos tiros em ProjectilePool
+    "lifetime": (("ttl", np.int32),),  # Ticks até sumir
+    "contact": (("damage", np.int32),),  # Dano ao encostar no jogador (e morre)
+    "bounty": (("points", np.int32),),  # Pontos ao ser destruído por um tiro
+    "cull": (("margin", np.int32),),  # Some ao sair da tela por mais que margin
+    "ram": (),  # Destrói o primeiro perseguidor em que encostar (e morre)
+    "blast": (),  # Desenhada como explosão
+}
+
+_FIELD_OWNER = {}
+for _component, _fields in COMPONENTS.items():
+    for _name, _ in _fields:
+        assert _name not in _FIELD_OWNER, f"Campo {_name} repetido em {_component}"
+        _FIELD_OWNER[_name] = _component
+
+
+class Archetype:
+    def __init__(self, components, capacity=16):
+        self.components = frozenset(components)
+        self.dtypes = {"kind": np.int32}  # kind: índice do tipo da entidade (EntityStore.kinds)
+        for component in sorted(self.components):
+            self.dtypes.update(COMPONENTS[component])
+        self.fields = tuple(self.dtypes)
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype) for name, dtype in self.dtypes.items()}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._scratch = {}  # nome -> array de trabalho dos sistemas (veja scratch)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, field):
+        """ Coluna field só das linhas ocupadas (view: escrever nela altera o arquétipo) """
+        return self.columns[field][:self.count]
+
+    def has(self, *components):
+        return self.components.issuperset(components)
+
+    def scratch(self, name, dtype=np.float64):
+        """
+        Array de trabalho name com capacity linhas, para os temporários de um
+        sistema (out= dos ufuncs). É o mesmo array a cada tick: só é alocado
+        de novo quando a capacidade cresce. O conteúdo não vale entre
+        chamadas; cada nome tem um dtype só.
+        """
+        values = self._scratch.get(name)
+        if values is None or len(values) != self.capacity:
+            values = self._scratch[name] = np.empty(self.capacity, dtype)
+        return values
+
+    def reserve(self, rows):
+        """ Cresce até caber rows linhas (ex.: antes de medir, para o crescimento não entrar na medida) """
+        while self.capacity < rows:
+            self._grow()
+
+    def _grow(self):
+        """ Dobra a capacidade quando todas as linhas estão ocupadas """
+        n = self.count
+        self.capacity *= 2
+        for name, values in self.columns.items():
+            grown = np.zeros(self.capacity, values.dtype)
+            grown[:n] = values[:n]
+            self.columns[name] = grown
+        alive = np.zeros(self.capacity, dtype=bool)
+        alive[:n] = self.alive[:n]
+        self.alive = alive
+
+    def spawn(self, defaults, values=None):
+        """ Nova linha com defaults (todos os campos) sobrescritos por values; retorna o índice """
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        columns = self.columns
+        for name, value in defaults.items():
+            columns[name][i] = value
+        if values:
+            for name, value in values.items():
+                columns[name][i] = value
+        self.alive[i] = True
+        self.count += 1
+        return i
+
+    def kill(self, i):
+        """ Marca a linha i como morta (sai do arquétipo em compact) """
+        self.alive[i] = False
+
+    def compact(self):
+        """ Tira as linhas mortas mantendo a ordem das vivas; retorna quantas saíram """
+        n = self.count
+        keep = self.alive[:n]
+        alive = int(np.count_nonzero(keep))
+        if alive == n:
+            return 0
+        for values in self.columns.values():
+            values[:alive] = values[:n][keep]
+        self.alive[:alive] = True
+        self.alive[alive:n] = False
+        self.count = alive
+        return n - alive
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.count = 0
+
+
+class EntityStore:
+    def __init__(self, types=None):
+        """ types: {nome: {componente: {campo: valor inicial}}} (campos omitidos começam em 0) """
+        self.archetypes = {}  # conjunto de componentes -> Archetype, na ordem em que surgiram
+        self.kinds = {}  # nome do tipo -> (Archetype, valores iniciais)
+        self.sheets = []  # Nomes dos sprites; o campo sheet guarda o índice
+        self._queries = {}  # componentes -> arquétipos que têm todos eles
+        for name, components in (types or {}).items():
+            self.define(name, components)
+
+    def define(self, name, components):
+        """ Registra um tipo de entidade; o arquétipo é criado se for um conjunto novo de componentes """
+        for component, values in components.items():
+            if component not in COMPONENTS:
+                raise KeyError(f"Componente desconhecido em {name}: {component}")
+            for field in values:
+                if _FIELD_OWNER.get(field) != component:
+                    raise KeyError(f"Campo {field} não pertence a {component} ({name})")
+        key = frozenset(components)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            archetype = self.archetypes[key] = Archetype(key)
+            self._queries.clear()
+        defaults = dict.fromkeys(archetype.fields, 0)
+        defaults["kind"] = len(self.kinds)
+        for values in components.values():
+            defaults.update(values)
+        if "sheet" in defaults:
+            defaults["sheet"] = self.sheet(defaults["sheet"])
+        self.kinds[name] = (archetype, defaults)
+        return archetype
+
+    def sheet(self, name):
+        """ Índice do sprite name no campo sheet """
+        if isinstance(name, int):
+            return name
+        if name not in self.sheets:
+            self.sheets.append(name)
+        return self.sheets.index(name)
+
+    def spawn(self, kind, **values):
+        """ Entidade do tipo kind; retorna (arquétipo, linha) """
+        archetype, defaults = self.kinds[kind]
+        return archetype, archetype.spawn(defaults, values)
+
+    def query(self, *components):
+        """ Arquétipos que têm todos os componentes (guardado até surgir um arquétipo novo) """
+        found = self._queries.get(components)
+        if found is None:
+            found = self._queries[components] = tuple(
+                archetype for archetype in self.archetypes.values() if archetype.has(*components))
+        return found
+
+    def count(self, *components):
+        """ Entidades (vivas ou mortas neste tick) com todos os componentes """
+        total = 0
+        for archetype in self.query(*components):  # Sem gerador: é chamado várias vezes por tick
+            total += archetype.count
+        return total
+
+    def compact(self):
+        for archetype in self.archetypes.values():
+            archetype.compact()
+
+    def clear(self):
+        for archetype in self.archetypes.values():
+            archetype.clear()
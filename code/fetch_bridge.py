@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+import json
+
+# =================== Ponte fetch (JS) -> asyncio =================== #
+# No navegador (PyGBag) o Python não pode esperar uma Promise do JS
+# diretamente. Cada requisição recebe um id e é disparada com fetch(); quando a
+# Promise termina, o JS só anota o resultado numa fila. Do lado Python cada
+# requisição é um Future, e uma única tarefa (só viva enquanto houver
+# requisições pendentes) esvazia essa fila a cada poll_interval e resolve os Futures. Nenhum quadro fica
+# esperando a rede, várias requisições podem estar em andamento ao mesmo tempo
+# e o tempo limite é aplicado dos dois lados (wait_for + AbortController, que
+# fica de reserva com uma folga para liberar a conexão no navegador).
+
+JS_TIMEOUT_GRACE = 1.0  # Segundos a mais para o AbortController do JS
+
+JS_CODE = """
+window.Fetch = {
+    results: [],
+    controllers: {},
+    start: function (id, method, url, body, headers, timeout) {
+        var controller = new AbortController();
+        window.Fetch.controllers[id] = controller;
+        var timedOut = false;
+        var timer = setTimeout(function () { timedOut = true; controller.abort(); }, timeout);
+        var init = {method: method, headers: JSON.parse(headers), signal: controller.signal};
+        if (body) { init.body = body; }
+        fetch(url, init)
+            .then(function (resp) {
+                var headers = {};
+                resp.headers.forEach(function (value, name) { headers[name] = value; });
+                return resp.text().then(function (text) {
+                    return {id: id, status: resp.status, headers: headers, text: text};
+                });
+            })
+            .catch(function (err) {
+                console.log("Erro na requisição:", err);
+                return {id: id, error: String(err), timeout: timedOut};
+            })
+            .then(function (result) {
+                clearTimeout(timer);
+                delete window.Fetch.controllers[id];
+                window.Fetch.results.push(result);
+            });
+    },
+    abort: function (id) {
+        var controller = window.Fetch.controllers[id];
+        if (controller) { controller.abort(); }
+    },
+    drain: function () {
+        if (!window.Fetch.results.length) { return ""; }
+        var done = JSON.stringify(window.Fetch.results);
+        window.Fetch.results = [];
+        return done;
+    }
+};
+"""
+
+
+class FetchError(ConnectionError):
+    """ fetch() falhou no navegador (rede, CORS, abortado...) """
+
+
+class FetchResponse:
+    """ Resposta de um fetch, com a mesma cara da httpx.Response usada no desktop """
+
+    def __init__(self, status_code, headers, text):
+        self.status_code = status_code
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text) if self.text else None
+
+
+class FetchBridge:
+    def __init__(self, window, poll_interval=0.01):
+        """
+        window: platform.window do PyGBag (ou um substituto com eval() e Fetch)
+        poll_interval: segundos entre verificações da fila (no jogo, no máximo uma por quadro)
+        """
+        self.window = window
+        self.poll_interval = poll_interval
+        window.eval(JS_CODE)  # Define window.Fetch no navegador
+        self._ids = itertools.count(1)
+        self._futures = {}  # id -> Future ainda sem resposta
+        self._poller = None
+
+        # Métricas
+        self.started = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.max_in_flight = 0
+
+    @property
+    def in_flight(self):
+        return len(self._futures)
+
+    async def fetch(self, method, url, body=None, headers=None, timeout=5.0):
+        """ Dispara um fetch e espera a resposta sem bloquear o event loop """
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._futures[request_id] = future
+        self.started += 1
+        self.max_in_flight = max(self.max_in_flight, len(self._futures))
+        self.window.Fetch.start(request_id, method, url, body or "", json.dumps(headers or {}),
+                                int((timeout + JS_TIMEOUT_GRACE) * 1000))
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.window.Fetch.abort(request_id)
+            raise
+        finally:
+            self._futures.pop(request_id, None)
+
+    async def _poll(self):
+        """ Esvazia a fila de respostas do JS enquanto houver requisições pendentes """
+        while self._futures:
+            done = self.window.Fetch.drain()
+            if done:
+                for result in json.loads(done):
+                    self._resolve(result)
+            await asyncio.sleep(self.poll_interval)
+
+    def _resolve(self, result):
+        future = self._futures.get(result.get("id"))
+        if future is None or future.done():
+            return  # Já desistimos dela (tempo limite ou cancelada)
+        if result.get("timeout"):
+            future.set_exception(asyncio.TimeoutError())
+        elif "error" in result:
+            self.errors += 1
+            future.set_exception(FetchError(result["error"]))
+        else:
+            self.completed += 1
+            future.set_result(FetchResponse(result["status"], result.get("headers") or {},
+                                            result.get("text") or ""))
+
+    def stats(self):
+        return {
+            "started": self.started,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+        }
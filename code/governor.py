@@ -0,0 +1,152 @@
+# =================== Governador de qualidade =================== #
+# Observa quanto tempo cada quadro levou (sem a espera do clock.tick) e, se o
+# jogo não está cabendo no orçamento do FPS alvo, desce um nível de
+# qualidade: cada nível de QUALITY_LEVELS corta mais um pouco (sprites fora da
+# tela, explosões desenhadas, resolução do cache de rotação, ritmo de spawn e
+# teto de inimigos).
+# Com folga de sobra por várias janelas seguidas, sobe um nível de novo. A
+# distância entre os dois limiares (histerese) e a espera para subir evitam
+# que a qualidade fique oscilando a cada janela. Toda decisão é registrada em
+# `decisions` e impressa no terminal.
+
+# Ajustes de cada nível, somados à qualidade máxima (FULL_QUALITY)
+FULL_QUALITY = {
+    "cull_offscreen": False,  # Não desenhar quem está fora da tela
+    "max_blasts": None,  # Explosões desenhadas no máximo (None = todas)
+    "rotation_step": None,  # Graus por passo do cache de rotação (None = o do Renderer)
+    "spawn_slowdown": 1.0,  # Multiplica os intervalos de spawn de inimigos e meteoros
+    "enemy_budget": 1.0,  # Fração de max_enemies (os que já existem ficam; só não nascem novos)
+}
+QUALITY_LEVELS = (
+    {},
+    {"cull_offscreen": True},
+    {"cull_offscreen": True, "max_blasts": 12},
+    {"cull_offscreen": True, "max_blasts": 12, "rotation_step": 6},
+    {"cull_offscreen": True, "max_blasts": 6, "rotation_step": 10, "spawn_slowdown": 1.5, "enemy_budget": 0.75},
+    {"cull_offscreen": True, "max_blasts": 3, "rotation_step": 15, "spawn_slowdown": 2.0, "enemy_budget": 0.5},
+)
+
+
+class QualityGovernor:
+    def __init__(self, renderer, world, target_fps=60, window=30, degrade_at=1.0, restore_at=0.7,
+                 restore_after=3, levels=QUALITY_LEVELS, log=print):
+        """
+        target_fps: FPS que o governador tenta manter (orçamento = 1000 / target_fps ms)
+        window: quadros por avaliação; a medida é o p90 dos tempos da janela
+        degrade_at: p90 acima de degrade_at x orçamento desce um nível
+        restore_at: p90 abaixo de restore_at x orçamento por restore_after janelas seguidas sobe um nível
+        log: função chamada com a mensagem de cada decisão (None = só guardar em decisions)
+        """
+        self.renderer = renderer
+        self.world = world
+        self.target_fps = target_fps
+        self.budget_ms = 1000.0 / target_fps
+        self.window = window
+        self.degrade_at = degrade_at
+        self.restore_at = restore_at
+        self.restore_after = restore_after
+        self.levels = levels
+        self.log = log
+        self.enabled = True
+        self.level = 0
+        self.frames = 0
+        self.decisions = []  # {"frame", "from", "to", "p90_ms", "reason"}
+        self.level_frames = [0] * len(levels)  # Quadros passados em cada nível
+        self._times = []
+        self._headroom = 0  # Janelas seguidas com folga
+        self._base_step = renderer.rotations.step
+        self.rebase()
+
+    def rebase(self):
+        """ Guarda as regras de spawn atuais do World como as da qualidade máxima (ex.: após trocar de modo) """
+        world = self.world
+        self._base_rules = (world.enemy_spawn_rate, world.meteor_spawn_rate, world.max_enemies)
+        if self.level:
+            self.apply(self.level)
+
+    def settings(self, level):
+        settings = dict(FULL_QUALITY)
+        settings.update(self.levels[level])
+        return settings
+
+    def apply(self, level):
+        """ Aplica os ajustes do nível no Renderer e no World """
+        settings = self.settings(level)
+        renderer = self.renderer
+        renderer.cull_offscreen = settings["cull_offscreen"]
+        renderer.max_blasts = settings["max_blasts"]
+        renderer.set_rotation_step(settings["rotation_step"] or self._base_step)
+        slowdown = settings["spawn_slowdown"]
+        enemy_rate, meteor_rate, max_enemies = self._base_rules
+        world = self.world
+        world.enemy_spawn_rate = max(1, round(enemy_rate * slowdown))
+        world.meteor_spawn_rate = max(1, round(meteor_rate * slowdown))
+        world.max_enemies = max(1, round(max_enemies * settings["enemy_budget"]))
+        self.level = level
+
+    def observe(self, frame_ms):
+        """ Registra o tempo de um quadro (ms, sem a espera); a cada window quadros avalia o nível """
+        if not self.enabled:
+            return
+        self.frames += 1
+        self.level_frames[self.level] += 1
+        times = self._times
+        times.append(frame_ms)
+        if len(times) < self.window:
+            return
+        times.sort()
+        p90 = times[int(len(times) * 0.9)]
+        times.clear()
+
+        budget = self.budget_ms
+        if p90 > budget * self.degrade_at:
+            self._headroom = 0
+            if self.level < len(self.levels) - 1:
+                self._change(self.level + 1, p90, f"p90 {p90:.1f} ms > {budget * self.degrade_at:.1f} ms")
+        elif p90 < budget * self.restore_at:
+            self._headroom += 1
+            if self._headroom >= self.restore_after and self.level > 0:
+                self._headroom = 0
+                self._change(self.level - 1, p90, f"p90 < {budget * self.restore_at:.1f} ms por "
+                                                  f"{self.restore_after} janelas (agora {p90:.1f} ms)")
+        else:
+            self._headroom = 0  # Entre os limiares: fica onde está
+
+    def _change(self, level, p90, reason):
+        old = self.level
+        self.apply(level)
+        self.decisions.append({"frame": self.frames, "from": old, "to": level, "p90_ms": p90, "reason": reason})
+        if self.log is not None:
+            arrow = "⬇️" if level > old else "⬆️"
+            self.log(f"{arrow} Qualidade {old} → {level} ({reason}): {self.describe(level)}")
+
+    def describe(self, level):
+        """ Ajustes do nível em texto """
+        settings = self.settings(level)
+        parts = []
+        if settings["cull_offscreen"]:
+            parts.append("sem desenho fora da tela")
+        if settings["max_blasts"] is not None:
+            parts.append(f"até {settings['max_blasts']} explosões")
+        if settings["rotation_step"]:
+            parts.append(f"rotação a cada {settings['rotation_step']}°")
+        if settings["spawn_slowdown"] != 1.0:
+            parts.append(f"spawn {settings['spawn_slowdown']:g}x mais lento")
+        if settings["enemy_budget"] != 1.0:
+            parts.append(f"até {settings['enemy_budget']:.0%} dos inimigos")
+        return ", ".join(parts) or "qualidade máxima"
+
+    def reset(self):
+        """ Volta à qualidade máxima e esquece as medidas """
+        if self.level:
+            self.apply(0)
+        self._times.clear()
+        self._headroom = 0
+
+    def toggle(self):
+        """ Liga/desliga; desligado, fica na qualidade máxima """
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.reset()
+        return self.enabled
+
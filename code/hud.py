@@ -0,0 +1,93 @@
+from collections import OrderedDict
+
+import pygame
+
+# =================== HUD e cache de textos =================== #
+# Fontes ficam carregadas e cada texto renderizado é guardado por
+# (fonte, tamanho, texto, cor). Um texto que não mudou nunca é rasterizado de
+# novo; os contadores mostram quantas renderizações de fato aconteceram.
+
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+        self.renders = 0  # Rasterizações desde o início
+        self.hits = 0
+        self.frame_renders = 0  # Rasterizações no quadro atual
+        self.last_frame_renders = 0  # Rasterizações no último quadro completo
+
+    def font(self, size, name=None):
+        """ Fonte carregada uma única vez por (nome, tamanho) """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()  # Só no primeiro texto (bootstrap não inicia as fontes)
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size, color, name=None, antialias=True):
+        """ Superfície com o texto; só chama font.render se ainda não estiver no cache """
+        key = (name, size, text, color, antialias)
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font(size, name).render(text, antialias, color)
+        self.renders += 1
+        self.frame_renders += 1
+        surfaces[key] = surface
+        if len(surfaces) > self.max_entries:
+            surfaces.popitem(last=False)
+        return surface
+
+    def end_frame(self):
+        """ Fecha a contagem do quadro (chamar uma vez por quadro apresentado) """
+        self.last_frame_renders = self.frame_renders
+        self.frame_renders = 0
+
+
+class Hud:
+    """ Barra de vida e placar, refeitos só quando o valor muda """
+
+    SCORE_SIZE = 36
+    SCORE_COLOR = (255, 255, 255)
+    HEALTH_COLOR = (255, 0, 0)
+
+    def __init__(self, text_cache, width):
+        self.text = text_cache
+        self.width = width
+        self._score = None
+        self._score_surface = None
+        self._health = None
+        self._health_surface = None
+        self.updates = 0  # Quantas vezes algum elemento precisou ser refeito
+
+    def _refresh(self, player):
+        if player.score != self._score:
+            self._score = player.score
+            self._score_surface = self.text.render(f"Score: {player.score}", self.SCORE_SIZE, self.SCORE_COLOR)
+            self.updates += 1
+        if player.health != self._health:
+            self._health = player.health
+            bar = pygame.Surface((max(0, player.health * 20), 10))
+            bar.fill(self.HEALTH_COLOR)
+            self._health_surface = bar
+            self.updates += 1
+
+    def draw(self, screen, player):
+        """ Desenha o HUD e retorna os retângulos ocupados """
+        self._refresh(player)
+
+        # Barra de saúde
+        health_rect = screen.blit(self._health_surface, (10, 10))
+
+        # Placar
+        score_rect = screen.blit(self._score_surface, (self.width - 150, 10))
+        return [health_rect, score_rect]
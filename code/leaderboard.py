@@ -0,0 +1,427 @@
+import asyncio
+import heapq
+import json
+import time
+from urllib.parse import urlencode
+
+# =================== Ranking (consultas no servidor) =================== #
+# Em vez de baixar records.json inteiro e ordenar tudo no jogo, pedimos ao
+# Firebase só o que vai para a tela: orderBy="score" + limitToLast=N.
+# Isso exige a regra ".indexOn": "score" em /records. Se o servidor recusar a
+# consulta (sem índice) ou não devolver um objeto, o caminho reserva lê a
+# resposta em pedaços e guarda só os N melhores num heap, então a memória
+# fica proporcional ao tamanho da página e não ao total de recordes.
+
+
+def format_record(key, record):
+    """ Normaliza um registro do Firebase para {"key", "name", "score"} """
+    return {
+        "key": key,
+        "name": str(record.get("name", "???"))[:3],
+        "score": int(record.get("score", 0)),
+    }
+
+
+def sort_records(records):
+    """ Maior pontuação primeiro; empates pela chave maior, como o limitToLast do Firebase """
+    return sorted(records, key=lambda r: (r["score"], r["key"]), reverse=True)
+
+
+class Cursor:
+    """ Posição da próxima página: pontuação do último registro e chaves já vistas nela """
+
+    def __init__(self, score, keys):
+        self.score = score
+        self.keys = frozenset(keys)
+
+    def allows(self, record):
+        """ True se o registro pertence às páginas seguintes """
+        return record["score"] < self.score or (
+            record["score"] == self.score and record["key"] not in self.keys)
+
+    def after(self, page):
+        """ Cursor para a página depois de page (lista já ordenada) """
+        last = page[-1]["score"]
+        keys = {r["key"] for r in page if r["score"] == last}
+        if last == self.score:
+            keys |= self.keys
+        return Cursor(last, keys)
+
+
+class RecordStreamParser:
+    """
+    Lê um objeto JSON {chave: registro, ...} entregue em pedaços de texto e
+    devolve cada par (chave, registro) assim que ele chega completo, sem
+    montar o objeto inteiro na memória.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = "start"
+        self._key = None
+
+    @property
+    def done(self):
+        return self._state == "done"
+
+    def _skip_spaces(self, pos):
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in " \t\r\n":
+            pos += 1
+        return pos
+
+    def feed(self, chunk):
+        """ Acrescenta texto e retorna a lista de (chave, registro) completos """
+        self._buffer += chunk
+        buffer = self._buffer
+        pos = 0
+        found = []
+        while True:
+            pos = self._skip_spaces(pos)
+            if pos >= len(buffer) or self._state == "done":
+                break
+            char = buffer[pos]
+            state = self._state
+            if state == "start":
+                if char == "{":
+                    self._state = "key"
+                    pos += 1
+                elif buffer.startswith("null", pos):
+                    self._state = "done"  # Firebase responde null quando não há nada
+                    pos += 4
+                elif len(buffer) - pos < 4 and "null".startswith(buffer[pos:]):
+                    break  # "null" chegando em pedaços
+                else:
+                    raise ValueError(f"Resposta inesperada: {buffer[pos:pos + 40]!r}")
+            elif state == "key":
+                if char == "}":
+                    self._state = "done"
+                    pos += 1
+                    continue
+                try:
+                    self._key, pos = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # Chave incompleta, espera o próximo pedaço
+                self._state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise ValueError("JSON inválido: esperado ':'")
+                self._state = "value"
+                pos += 1
+            elif state == "value":
+                try:
+                    value, pos = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # Registro incompleto
+                found.append((self._key, value))
+                self._state = "comma"
+            elif state == "comma":
+                if char == ",":
+                    self._state = "key"
+                elif char == "}":
+                    self._state = "done"
+                else:
+                    raise ValueError("JSON inválido: esperado ',' ou '}'")
+                pos += 1
+        self._buffer = buffer[pos:]
+        return found
+
+    def close(self):
+        if not self.done:
+            raise ValueError("Resposta JSON terminou no meio")
+
+
+class TopN:
+    """ Heap limitado: guarda só os n registros de maior pontuação vistos até agora """
+
+    def __init__(self, n):
+        self.n = n
+        self._heap = []
+
+    def push(self, record):
+        item = (record["score"], record["key"], record)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def result(self):
+        return sort_records(item[2] for item in self._heap)
+
+
+class LeaderboardClient:
+    def __init__(self, request_handler, url):
+        """ url: endpoint REST da coleção, ex.: .../records.json """
+        self.request_handler = request_handler
+        self.url = url
+        self.server_queries = True  # Vira False se o servidor recusar orderBy
+        self.fallbacks = 0
+
+    def query_url(self, **params):
+        """ URL com parâmetros de consulta do Firebase (valores codificados em JSON) """
+        query = {"orderBy": json.dumps("score")}
+        for name, value in params.items():
+            query[name] = json.dumps(value) if isinstance(value, str) else str(value)
+        return f"{self.url}?{urlencode(query)}"
+
+    async def _query(self, **params):
+        """
+        Consulta ordenada no servidor. Retorna a lista de registros formatados
+        ou None se o servidor não suportar a consulta.
+        """
+        if not self.server_queries:
+            return None
+        return self._parse_query(await self.request_handler.get(self.query_url(**params)))
+
+    def _parse_query(self, records):
+        """ Resposta de uma consulta ordenada -> registros formatados (None = recusada) """
+        if isinstance(records, str):
+            try:
+                records = json.loads(records) if records else None
+            except json.JSONDecodeError:
+                return None
+        if records is None:
+            return []
+        if not isinstance(records, dict) or "error" in records:
+            # Ex.: {"error": "Index not defined, add \".indexOn\": \"score\"..."}
+            print("⚠️ Consulta ordenada recusada pelo servidor:", records)
+            self.server_queries = False
+            return None
+        formatted = []
+        for key, record in records.items():
+            try:
+                formatted.append(format_record(key, record))
+            except (ValueError, AttributeError, TypeError) as e:
+                print("❌ Erro ao formatar registro:", e, record)
+        return formatted
+
+    async def _stream_records(self):
+        """ Percorre todos os registros lendo a resposta em pedaços (caminho reserva) """
+        self.fallbacks += 1
+        parser = RecordStreamParser()
+        streamed_text = False
+        async for chunk in self.request_handler.stream(self.url):
+            if isinstance(chunk, dict):
+                # Ambiente que já entrega o objeto pronto (ex.: navegador)
+                pairs = list(chunk.items())
+            else:
+                streamed_text = True
+                pairs = parser.feed(chunk)
+            for key, record in pairs:
+                try:
+                    yield format_record(key, record)
+                except (ValueError, AttributeError, TypeError) as e:
+                    print("❌ Erro ao formatar registro:", e, record)
+        if streamed_text:
+            parser.close()
+
+    async def page(self, page_size=10, cursor=None):
+        """
+        Uma página do ranking, da maior pontuação para a menor.
+        Retorna (registros, cursor da próxima página ou None se acabou).
+        """
+        if cursor is None:
+            records = await self._query(limitToLast=page_size)
+        else:
+            records = await self._query(endAt=cursor.score, limitToLast=page_size + len(cursor.keys))
+
+        if records is None:
+            top = TopN(page_size)
+            async for record in self._stream_records():
+                if cursor is None or cursor.allows(record):
+                    top.push(record)
+            page = top.result()
+        else:
+            if cursor is not None:
+                records = [r for r in records if cursor.allows(r)]
+            page = sort_records(records)[:page_size]
+
+        if len(page) < page_size:
+            return page, None
+        return page, (cursor or Cursor(float("inf"), ())).after(page)
+
+    async def top(self, n=10):
+        """ Os n melhores recordes """
+        records, _ = await self.page(n)
+        return records
+
+    async def top_conditional(self, n=10, etag=None):
+        """
+        Como top(), mas revalidando pelo ETag da resposta anterior.
+        Retorna (registros, novo etag) ou (None, etag) se o ranking não mudou.
+        """
+        if self.server_queries:
+            status, new_etag, records = await self.request_handler.get_conditional(
+                self.query_url(limitToLast=n), etag)
+            # 304, ou servidor que ignora If-None-Match mas devolve o mesmo ETag
+            if status == 304 or (etag is not None and new_etag == etag):
+                return None, etag
+            records = self._parse_query(records)
+            if records is not None:
+                return sort_records(records)[:n], new_etag
+        return await self.top(n), None
+
+    async def rank_of(self, score, limit=100):
+        """
+        Posição (1 = primeiro) que a pontuação score ocuparia no ranking, ou
+        None se houver limit ou mais recordes acima dela (fora do ranking).
+        """
+        # limitToFirst: só os limit menores acima de score, nunca a tabela inteira
+        above = await self._query(startAt=int(score) + 1, limitToFirst=limit)
+        if above is not None:
+            return len(above) + 1 if len(above) < limit else None
+        count = 0
+        async for record in self._stream_records():
+            if record["score"] > score:
+                count += 1
+                if count >= limit:
+                    return None
+        return count + 1
+
+
+# =================== Cache do ranking =================== #
+# As telas leem o ranking da memória (get()) e nunca esperam a rede. Passados
+# ttl segundos o valor fica velho: continua sendo mostrado, mas a leitura
+# dispara uma revalidação em segundo plano (stale-while-revalidate). A
+# revalidação manda o ETag da última resposta, então um ranking que não mudou
+# volta como 304 sem corpo. Recordes enviados por este jogo entram na hora,
+# sem esperar o servidor.
+
+
+class LeaderboardCache:
+    def __init__(self, client, n=10, ttl=30.0, retry_delay=10.0, clock=time.monotonic):
+        """
+        client: LeaderboardClient usado nas revalidações
+        n: tamanho do ranking guardado
+        ttl: segundos em que o ranking é considerado atual
+        retry_delay: espera antes de tentar de novo após um erro de rede
+        """
+        self.client = client
+        self.n = n
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self.clock = clock
+
+        self.records = []  # Último top n vindo do servidor
+        self.etag = None
+        self.fetched_at = None  # Fim da última revalidação bem-sucedida (None = nunca)
+        self.local = {}  # chave -> recorde nosso ainda não visto no servidor
+        self._view = []  # records + local, ordenado e cortado em n
+        self._retry_at = 0.0
+        self._task = None
+        self._prefetch_task = None
+
+        # Métricas
+        self.reads = 0
+        self.stale_reads = 0
+        self.fetches = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    @property
+    def loaded(self):
+        return self.fetched_at is not None
+
+    @property
+    def age(self):
+        return self.clock() - self.fetched_at if self.loaded else float("inf")
+
+    @property
+    def stale(self):
+        return self.age >= self.ttl
+
+    @property
+    def refreshing(self):
+        return self._task is not None and not self._task.done()
+
+    # ---------- leitura ---------- #
+    def get(self):
+        """ Ranking atual (servidor + recordes locais), sem esperar; revalida se estiver velho """
+        self.reads += 1
+        if self.stale:
+            self.stale_reads += 1
+            if self.clock() >= self._retry_at:
+                self.refresh()
+        return self._view
+
+    def add_local(self, key, name, score):
+        """ Mostra um recorde recém-enviado antes de o servidor confirmá-lo """
+        self.local[key] = format_record(key, {"name": name, "score": score})
+        self._merge()
+
+    # ---------- revalidação ---------- #
+    def refresh(self):
+        """ Dispara uma revalidação em segundo plano (no máximo uma por vez) """
+        if not self.refreshing:
+            self._task = asyncio.create_task(self._revalidate())
+        return self._task
+
+    async def _revalidate(self):
+        self.fetches += 1
+        try:
+            records, etag = await self.client.top_conditional(self.n, self.etag)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.errors += 1
+            self._retry_at = self.clock() + self.retry_delay
+            print("❌ Erro ao atualizar o ranking:", e)
+            return
+        if records is None:
+            self.not_modified += 1
+        else:
+            self.records = records
+            self.etag = etag
+            print("🏆 Ranking atualizado:", records)
+        self.fetched_at = self.clock()
+        self._merge()
+
+    def _merge(self):
+        # Um recorde local sai quando o servidor já o devolve, ou quando ficou
+        # abaixo do último de um top n completo (não apareceria de qualquer jeito)
+        server_keys = {r["key"] for r in self.records}
+        last = self.records[-1] if len(self.records) >= self.n else None
+        for key, record in list(self.local.items()):
+            if key in server_keys or (
+                    last is not None and (record["score"], key) < (last["score"], last["key"])):
+                del self.local[key]
+        self._view = sort_records(self.records + list(self.local.values()))[:self.n]
+
+    # ---------- pré-carregamento ---------- #
+    def start(self):
+        """ Mantém o cache aquecido em segundo plano (ex.: durante a partida) """
+        if self._prefetch_task is None:
+            self._prefetch_task = asyncio.create_task(self._prefetch())
+        return self._prefetch_task
+
+    async def _prefetch(self):
+        while True:
+            if self.stale and self.clock() >= self._retry_at:
+                await self.refresh()
+            # Dorme até o ranking envelhecer (ou até poder tentar de novo após um erro)
+            await asyncio.sleep(max(0.1, self.ttl - self.age, self._retry_at - self.clock()))
+
+    async def close(self):
+        """ Para o pré-carregamento e qualquer revalidação em andamento """
+        for task in (self._prefetch_task, self._task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._prefetch_task = None
+        self._task = None
+
+    def metrics(self):
+        return {
+            "entries": len(self._view),
+            "local": len(self.local),
+            "age": self.age,
+            "reads": self.reads,
+            "stale_reads": self.stale_reads,
+            "fetches": self.fetches,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+        }
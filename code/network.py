@@ -0,0 +1,176 @@
+import asyncio
+import importlib.util
+import json as _json
+import sys
+
+from fetch_bridge import FetchBridge, FetchError
+
+# =================== RequestHandler para PyGBag =================== #
+# No navegador as requisições passam pelo fetch do JS (FetchBridge, sem travar
+# o quadro); no desktop usamos um único httpx.AsyncClient de vida longa (pool
+# de conexões com keep-alive, HTTP/2 quando o pacote h2 estiver instalado),
+# aberto na primeira requisição e fechado junto com o jogo. Os dois caminhos
+# devolvem respostas com status_code, headers, text e json().
+
+
+class RequestHandler:
+    def __init__(self, timeout=5.0, connect_timeout=3.0, retries=2, backoff=0.25,
+                 max_connections=4, http2=True, window=None):
+        """
+        timeout/connect_timeout: segundos para a resposta e para abrir a conexão
+        retries: novas tentativas após falha de rede (GET/PATCH) ou de conexão (POST)
+        backoff: espera antes da 1ª nova tentativa; dobra a cada tentativa
+        max_connections: tamanho do pool de conexões mantidas abertas
+        window: substituto de platform.window (testes do caminho do navegador)
+        """
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_connections = max_connections
+        self.http2 = http2
+        self._client = None
+        self.stats = {"requests": 0, "retries": 0, "errors": 0}
+
+        # No navegador as requisições passam pela ponte fetch -> asyncio (veja fetch_bridge.py).
+        # window pode ser passado para testar esse caminho fora do navegador.
+        self._bridge = None
+        if window is None and sys.platform == "emscripten":
+            try:
+                import platform
+                window = platform.window
+            except AttributeError:
+                window = None
+        self._window = window
+        self.is_emscripten = window is not None
+
+    @property
+    def bridge(self):
+        """ Ponte fetch, criada (e o JS injetado) só na primeira requisição do navegador """
+        if self._bridge is None:
+            self._bridge = FetchBridge(self._window)
+        return self._bridge
+
+    # ---------- ciclo de vida do cliente HTTP (desktop) ---------- #
+    async def open(self):
+        """ Cria o cliente com pool de conexões (idempotente) """
+        if self.is_emscripten or self._client is not None:
+            return
+        import httpx # type: ignore
+        # Sem o pacote h2 o httpx só fala HTTP/1.1
+        http2 = self.http2 and importlib.util.find_spec("h2") is not None
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections,
+                                keepalive_expiry=60.0),
+        )
+
+    async def close(self):
+        """ Fecha as conexões abertas; chamar ao sair do jogo """
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _fetch(self, method, url, json=None, headers=None):
+        """ Uma tentativa pelo fetch do navegador """
+        headers = dict(headers or {})
+        headers.setdefault("Accept", "application/json")
+        body = None
+        if json is not None:
+            body = _json.dumps(json)
+            headers["Content-Type"] = "application/json"
+        return await self.bridge.fetch(method, url, body, headers, timeout=self.timeout)
+
+    async def _browser_request(self, method, url, **kwargs):
+        """ Mesma política de novas tentativas do desktop, pelo fetch do navegador """
+        idempotent = method in ("GET", "PATCH")
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            try:
+                response = await self._fetch(method, url, **kwargs)
+                if not idempotent or response.status_code < 500 or attempt >= self.retries:
+                    return response
+            except (FetchError, asyncio.TimeoutError):
+                # fetch não diz se a requisição chegou a sair: POST nunca é repetido
+                if attempt >= self.retries or not idempotent:
+                    self.stats["errors"] += 1
+                    raise
+            attempt += 1
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+    async def _request(self, method, url, **kwargs):
+        """ Requisição pelo cliente compartilhado, com novas tentativas e backoff """
+        if self.is_emscripten:
+            return await self._browser_request(method, url, **kwargs)
+        import httpx # type: ignore
+        await self.open()
+        # GET e PATCH (com chaves geradas no cliente) podem ser repetidos sem efeito colateral
+        idempotent = method in ("GET", "PATCH")
+        attempt = 0
+        while True:
+            self.stats["requests"] += 1
+            try:
+                response = await self._client.request(method, url, **kwargs)
+                if not idempotent or response.status_code < 500 or attempt >= self.retries:
+                    return response
+            except httpx.TransportError as e:
+                # POST só é repetido se a requisição nem chegou a sair (evita recorde duplicado)
+                connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if attempt >= self.retries or (not idempotent and not connect_failed):
+                    self.stats["errors"] += 1
+                    raise
+            attempt += 1
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+    # ---------- requisições ---------- #
+    async def post(self, url, data):
+        response = await self._request("POST", url, json=data)
+        return response.text
+
+    async def patch(self, url, data):
+        """ Grava vários filhos de uma vez: data = {chave: valor, ...} """
+        response = await self._request("PATCH", url, json=data)
+        return response.json()
+
+    async def get(self, url):
+        response = await self._request("GET", url)
+        return response.json()
+
+    async def get_conditional(self, url, etag=None):
+        """
+        GET com revalidação por ETag. Retorna (status, etag, dados);
+        status 304 quer dizer que nada mudou desde a resposta com etag (dados = None).
+        """
+        # No navegador o ETag só aparece se o servidor o expuser via CORS; sem ele vale o corpo
+        headers = {"X-Firebase-ETag": "true"}  # Pede ao Firebase o ETag da resposta
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        response = await self._request("GET", url, headers=headers)
+        if response.status_code == 304:
+            return 304, etag, None
+        return response.status_code, response.headers.get("etag"), response.json()
+
+    async def stream(self, url):
+        """ Resposta de um GET em pedaços de texto, sem guardar o corpo inteiro """
+        if self.is_emscripten:
+            # fetch no navegador não entrega pedaços: o corpo vem de uma vez
+            response = await self._request("GET", url)
+            yield response.text
+        else:
+            await self.open()
+            self.stats["requests"] += 1
+            async with self._client.stream("GET", url) as response:
+                async for chunk in response.aiter_text():
+                    yield chunk
@@ -0,0 +1,312 @@
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+# =================== Profiler de quadros =================== #
+# Mede para onde vai cada quadro: eventos, jogador, spawn, cada sistema das
+# entidades (movimento, armas, colisões...), tiros, fundo, desenho e flip. Cada fase é um método de um objeto do jogo;
+# enable() troca esse método (só na instância) por um embrulho que cronometra a
+# chamada com perf_counter_ns, e disable() devolve o original. Desligado, nenhum
+# código do profiler roda durante o quadro: o custo é zero, não só "pequeno".
+#
+# Os tempos de cada quadro ficam num buffer circular com os últimos `capacity`
+# quadros (p50/p95/p99 por fase saem dele) e cada chamada vira um evento de
+# outro buffer circular, exportado como trace do Chrome (chrome://tracing ou
+# ui.perfetto.dev). O CSV tem uma linha por quadro, para comparar versões.
+
+FRAME = -1  # Índice de fase dos eventos de quadro inteiro
+
+# Contadores anotados a cada quadro por world_counters()
+WORLD_COUNTERS = ("inimigos", "meteoros", "explosões", "tiros")
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, counters=None, counter_names=(), events_per_frame=64):
+        """
+        capacity: quadros guardados no buffer circular
+        counters: função sem argumentos -> sequência de inteiros, lida no fim de cada quadro
+        counter_names: nomes desses inteiros (na mesma ordem)
+        events_per_frame: média de chamadas cronometradas por quadro que cabem no buffer de eventos
+        """
+        self.capacity = capacity
+        self.counters = counters
+        self.counter_names = tuple(counter_names)
+        self.phases = []  # Nomes das fases, na ordem em que foram registradas
+        self._phase_index = {}
+        self._hooks = []  # (objeto, método, índice da fase ou FRAME)
+        self._saved = []  # (objeto, método, atributo de instância que havia antes) enquanto ligado
+        self.enabled = False
+
+        self._current = []  # ns acumulados por fase no quadro em andamento
+        self._events = np.zeros((capacity * events_per_frame, 3), dtype=np.int64)  # fase, início, duração
+        self.epoch = time.perf_counter_ns()
+        self.reset()
+
+    # ===== Registro das fases ===== #
+    def instrument(self, obj, method, phase):
+        """ Cronometra obj.method como a fase phase (várias chamadas no quadro são somadas) """
+        index = self._phase_index.get(phase)
+        if index is None:
+            index = len(self.phases)
+            self._phase_index[phase] = index
+            self.phases.append(phase)
+            self.reset()  # O buffer ganha uma coluna
+        self._hook(obj, method, index)
+
+    def frame(self, obj, method):
+        """ Cada chamada de obj.method é um quadro inteiro; o quadro é gravado quando ela termina """
+        self._hook(obj, method, FRAME)
+
+    def _hook(self, obj, method, index):
+        self._hooks.append((obj, method, index))
+        if self.enabled:
+            self._install(obj, method, index)
+
+    # ===== Liga/desliga ===== #
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for obj, method, index in self._hooks:
+            self._install(obj, method, index)
+
+    def disable(self):
+        """ Devolve os métodos originais (o que já foi medido continua no buffer) """
+        if not self.enabled:
+            return
+        self.enabled = False
+        for obj, method, previous in reversed(self._saved):
+            if previous is None:
+                delattr(obj, method)
+            else:
+                setattr(obj, method, previous)
+        self._saved.clear()
+        for i in range(len(self._current)):
+            self._current[i] = 0
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def _install(self, obj, method, index):
+        # Objetos com __slots__ não aceitam atributo de instância: instrumente quem os chama
+        self._saved.append((obj, method, vars(obj).get(method)))
+        original = getattr(obj, method)
+        wrapper = self._frame_wrapper(original) if index == FRAME else self._phase_wrapper(original, index)
+        setattr(obj, method, wrapper)
+
+    def _phase_wrapper(self, original, index):
+        clock = time.perf_counter_ns
+        current = self._current
+        events = self._events
+        size = len(events)
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                duration = clock() - start
+                current[index] += duration
+                events[self._event_count % size] = (index, start, duration)
+                self._event_count += 1
+
+        return timed
+
+    def _frame_wrapper(self, original):
+        clock = time.perf_counter_ns
+
+        def timed_frame(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._end_frame(start, clock() - start)
+
+        return timed_frame
+
+    # ===== Buffer circular ===== #
+    def reset(self):
+        """ Esquece os quadros e eventos medidos até agora """
+        # Colunas: início (ns desde epoch), total, uma por fase, um por contador
+        self._ring = np.zeros((self.capacity, 2 + len(self.phases) + len(self.counter_names)), dtype=np.int64)
+        self._current[:] = [0] * len(self.phases)
+        self.frames = 0  # Quadros gravados (o buffer guarda os últimos capacity)
+        self._event_count = 0
+
+    def _end_frame(self, start, duration):
+        current = self._current
+        phases = len(current)
+        row = self._ring[self.frames % self.capacity]
+        row[0] = start - self.epoch
+        row[1] = duration
+        row[2:2 + phases] = current
+        if self.counters is not None:
+            row[2 + phases:] = self.counters()
+        for i in range(phases):
+            current[i] = 0
+        events = self._events
+        events[self._event_count % len(events)] = (FRAME, start, duration)
+        self._event_count += 1
+        self.frames += 1
+
+    def _window(self):
+        """ Quadros guardados, do mais antigo para o mais novo """
+        if self.frames <= self.capacity:
+            return self._ring[:self.frames]
+        pos = self.frames % self.capacity
+        return np.concatenate((self._ring[pos:], self._ring[:pos]))
+
+    def _event_window(self):
+        events = self._events
+        size = len(events)
+        if self._event_count <= size:
+            return events[:self._event_count]
+        pos = self._event_count % size
+        return np.concatenate((events[pos:], events[:pos]))
+
+    # ===== Estatísticas ===== #
+    def percentiles(self, qs=(50, 95, 99)):
+        """ {"quadro" ou fase: (p50, p95, p99)} em ms, sobre os quadros guardados """
+        rows = self._window()
+        if not len(rows):
+            return {}
+        values = np.percentile(rows[:, 1:2 + len(self.phases)], qs, axis=0) / 1e6
+        names = ["quadro"] + self.phases
+        return {name: tuple(values[:, i].tolist()) for i, name in enumerate(names)}
+
+    def latest_counts(self):
+        """ Contadores do último quadro gravado """
+        if not self.frames or not self.counter_names:
+            return {}
+        row = self._ring[(self.frames - 1) % self.capacity]
+        return dict(zip(self.counter_names, row[2 + len(self.phases):].tolist()))
+
+    def report(self):
+        """ Tabela de texto com p50/p95/p99 (ms) por fase e as contagens do último quadro """
+        lines = [f"{'fase':<12}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name, (p50, p95, p99) in self.percentiles().items():
+            lines.append(f"{name:<12}{p50:>8.3f}{p95:>8.3f}{p99:>8.3f}")
+        counts = self.latest_counts()
+        if counts:
+            lines.append(" | ".join(f"{name} {value}" for name, value in counts.items()))
+        return "\n".join(lines)
+
+    # ===== Exportação ===== #
+    def to_csv(self, path):
+        """ Uma linha por quadro guardado: tempos em ms e os contadores """
+        rows = self._window()
+        phases = len(self.phases)
+        first = self.frames - len(rows)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["quadro", "inicio_ms", "total_ms"] + [f"{name}_ms" for name in self.phases]
+                            + list(self.counter_names))
+            for i, row in enumerate(rows.tolist()):
+                writer.writerow([first + i] + [f"{value / 1e6:.4f}" for value in row[:2 + phases]]
+                                + row[2 + phases:])
+        return len(rows)
+
+    def to_chrome_trace(self, path):
+        """ Trace-event JSON: um evento "X" por chamada cronometrada e um "C" com as contagens por quadro """
+        rows = self._window()
+        oldest = int(rows[0, 0]) if len(rows) else 0
+        trace = []
+        for index, start, duration in self._event_window().tolist():
+            start -= self.epoch
+            if start < oldest:
+                continue  # O quadro desse evento já saiu do buffer
+            trace.append({
+                "name": "quadro" if index == FRAME else self.phases[index],
+                "cat": "quadro" if index == FRAME else "fase",
+                "ph": "X", "ts": start / 1000, "dur": duration / 1000, "pid": 1, "tid": 1,
+            })
+        phases = len(self.phases)
+        if self.counter_names:
+            for row in rows.tolist():
+                trace.append({"name": "entidades", "ph": "C", "ts": row[0] / 1000, "pid": 1,
+                              "args": dict(zip(self.counter_names, row[2 + phases:]))})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(trace)
+
+
+def world_counters(world):
+    """ Contadores de WORLD_COUNTERS lidos de um World """
+
+    def counts():
+        return (world.enemy_count, world.meteor_count, world.explosion_count, world.projectiles.count)
+
+    return counts
+
+
+def instrument_game(profiler, world, renderer, scenes=None):
+    """ Fases padrão do jogo; scenes (SceneManager) dá os quadros e o tempo de eventos """
+    if scenes is not None:
+        profiler.frame(scenes, "tick")
+        profiler.instrument(scenes, "poll_events", "eventos")
+    profiler.instrument(world, "_update_player", "jogador")
+    profiler.instrument(world, "_spawn_enemies", "spawn")
+    profiler.instrument(world, "_spawn_meteors", "spawn")
+    profiler.instrument(world, "_update_motion", "movimento")
+    profiler.instrument(world, "_update_weapons", "armas")
+    profiler.instrument(world, "_update_grid", "colisões")
+    profiler.instrument(world, "_update_collisions", "colisões")
+    profiler.instrument(world, "_update_timers", "animação")
+    profiler.instrument(world, "_update_bullets", "tiros")
+    profiler.instrument(renderer, "draw_background", "fundo")
+    profiler.instrument(renderer, "draw", "desenho")  # Inclui o fundo
+    profiler.instrument(renderer, "present", "flip")
+    return profiler
+
+
+# =================== Painel =================== #
+class ProfilerOverlay:
+    """ Painel semitransparente com a tabela de FrameProfiler.report() """
+
+    SIZE = 20
+    COLOR = (255, 255, 0)
+    BACKGROUND = (0, 0, 0, 170)
+    LINE_HEIGHT = 18
+
+    def __init__(self, profiler, text_cache, pos=(10, 30), refresh_frames=30):
+        """ refresh_frames: a tabela é refeita a cada tantos quadros (números mudando não viram lixo no cache) """
+        self.profiler = profiler
+        self.text = text_cache
+        self.pos = pos
+        self.refresh_frames = refresh_frames
+        self._panel = None
+        self._built_at = 0
+
+    def _build(self):
+        # Fonte do cache, mas sem guardar as linhas: elas mudam a cada atualização
+        font = self.text.font(self.SIZE)
+        lines = self.profiler.report().split("\n")
+        columns = [0, 110, 180, 250]
+        panel = pygame.Surface((330, 8 + self.LINE_HEIGHT * len(lines)), pygame.SRCALPHA)
+        panel.fill(self.BACKGROUND)
+        for row, line in enumerate(lines):
+            y = 4 + row * self.LINE_HEIGHT
+            # Tabela: nome à esquerda e números alinhados à direita em colunas fixas
+            cells = line.split() if "|" not in line else [line]
+            if len(cells) == 4:
+                panel.blit(font.render(cells[0], True, self.COLOR), (6, y))
+                for x, cell in zip(columns[1:], cells[1:]):
+                    surface = font.render(cell, True, self.COLOR)
+                    panel.blit(surface, (x + 60 - surface.get_width(), y))
+            else:
+                panel.blit(font.render(line, True, self.COLOR), (6, y))
+        self._panel = panel
+        self._built_at = self.profiler.frames
+
+    def draw(self, screen):
+        """ Desenha o painel e retorna o retângulo ocupado """
+        if self._panel is None or self.profiler.frames - self._built_at >= self.refresh_frames:
+            self._build()
+        return screen.blit(self._panel, self.pos)
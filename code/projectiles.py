@@ -0,0 +1,186 @@
+import numpy as np
+
+# =================== Pool de projéteis =================== #
+# Todos os tiros do jogo (do jogador e dos inimigos atiradores) vivem em arrays
+# contíguos pré-alocados. Movimento, remoção dos que saíram da tela e teste de
+# acerto são feitos em uma operação vetorizada por tick; slots livres são
+# reaproveitados, então atirar não aloca nada.
+
+OWNER_PLAYER = 0  # Inimigos atiradores recebem ids a partir de 1
+NO_OWNER = -1
+
+# Escalares como arrays 0-d: comparar com int/float do Python faz o NumPy
+# converter (e alocar) o operando a cada chamada
+_PLAYER = np.array(OWNER_PLAYER, dtype=np.int32)
+_ZERO = np.array(0.0)
+_NONE = np.zeros(0, dtype=np.intp)  # Nenhum índice, reaproveitado
+
+
+class ProjectilePool:
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.px = np.zeros(capacity)  # Posição no tick anterior (interpolação no desenho)
+        self.py = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.owner = np.full(capacity, NO_OWNER, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._free = list(range(capacity - 1, -1, -1))  # Pilha de slots livres
+        self.count = 0
+        # Máscaras de trabalho reaproveitadas por cull()/active() (evitam arrays temporários)
+        self._mask = np.zeros(capacity, dtype=bool)
+        self._tmp = np.zeros(capacity, dtype=bool)
+        self._bounds = None  # (largura, altura) do último cull, como arrays 0-d
+        # Arrays de trabalho de first_hits, um elemento por par candidato (crescem conforme o maior tick)
+        self._shots = np.zeros(0, dtype=np.intp)
+        self._pairs = np.zeros((3, 0))
+        self._inside = np.zeros(0, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.alive[:] = False
+        self.owner[:] = NO_OWNER
+        self.dx[:] = 0
+        self.dy[:] = 0
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self.count = 0
+
+    def _grow(self):
+        """ Dobra a capacidade quando todos os slots estão ocupados (raro) """
+        old = self.capacity
+        new = old * 2
+        for name in ("x", "y", "px", "py", "dx", "dy"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(old)]))
+        self.owner = np.concatenate([self.owner, np.full(old, NO_OWNER, dtype=np.int32)])
+        self.alive = np.concatenate([self.alive, np.zeros(old, dtype=bool)])
+        self._free.extend(range(new - 1, old - 1, -1))
+        self._mask = np.zeros(new, dtype=bool)
+        self._tmp = np.zeros(new, dtype=bool)
+        self.capacity = new
+
+    def spawn(self, x, y, dx, dy, owner):
+        """ Ocupa um slot livre com um novo projétil e retorna o índice """
+        if not self._free:
+            self._grow()
+        i = self._free.pop()
+        self.x[i] = self.px[i] = x
+        self.y[i] = self.py[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.count += 1
+        return i
+
+    def kill(self, indices):
+        """ Libera os slots indicados (array de índices ou índice único) """
+        indices = np.atleast_1d(indices)
+        indices = indices[self.alive[indices]]
+        if not len(indices):
+            return
+        self.alive[indices] = False
+        self.owner[indices] = NO_OWNER
+        self.dx[indices] = 0
+        self.dy[indices] = 0
+        self._free.extend(indices.tolist())
+        self.count -= len(indices)
+
+    def kill_owner(self, owner):
+        """ Remove todos os tiros de um dono (ex.: atirador destruído) """
+        self.kill(np.flatnonzero(self.owner == owner))
+
+    def move(self):
+        """ Avança todos os projéteis um tick (slots livres têm velocidade zero) """
+        np.copyto(self.px, self.x)
+        np.copyto(self.py, self.y)
+        np.add(self.x, self.dx, out=self.x)
+        np.add(self.y, self.dy, out=self.y)
+
+    def cull(self, width, height):
+        """ Remove os projéteis que saíram da área (0, 0, width, height) """
+        if not self.count:
+            return
+        bounds = self._bounds
+        if bounds is None or bounds[0] != width or bounds[1] != height:
+            bounds = self._bounds = (np.array(float(width)), np.array(float(height)))
+        inside = self._mask
+        tmp = self._tmp
+        np.greater(self.x, _ZERO, out=inside)
+        np.less(self.x, bounds[0], out=tmp)
+        inside &= tmp
+        np.greater(self.y, _ZERO, out=tmp)
+        inside &= tmp
+        np.less(self.y, bounds[1], out=tmp)
+        inside &= tmp
+        # Fora = vivo e não dentro
+        np.greater(self.alive, inside, out=tmp)
+        if np.count_nonzero(tmp):  # count_nonzero não aloca; any() sim
+            self.kill(np.flatnonzero(tmp))
+
+    def active(self, player=None):
+        """
+        Índices dos projéteis vivos.
+        player=True só os do jogador, player=False só os dos inimigos.
+        """
+        if player is None:
+            return np.flatnonzero(self.alive)
+        mask = self._mask
+        if player:
+            np.equal(self.owner, _PLAYER, out=mask)
+        else:
+            np.greater(self.owner, _PLAYER, out=mask)
+        mask &= self.alive
+        return np.flatnonzero(mask)
+
+    def hits_circle(self, indices, cx, cy, radius):
+        """ Subconjunto de indices cujo centro está a menos de radius de (cx, cy) """
+        ddx = self.x[indices] - cx
+        ddy = self.y[indices] - cy
+        return indices[ddx * ddx + ddy * ddy < radius * radius]
+
+    def first_hits(self, indices, points, targets, xs, ys, radii):
+        """
+        Teste círculo contra círculo dos pares candidatos vindos da grade de
+        colisão, numa única operação: o projétil indices[points[k]] contra o
+        alvo targets[k], de centro xs[targets[k]], ys[targets[k]] e raio
+        radii[targets[k]] (raio 0 nunca é atingido).
+        Retorna (projéteis, alvos): para cada projétil que acertou algo, o
+        menor alvo atingido.
+        """
+        n = len(points)
+        if len(self._shots) < n:
+            size = max(n, 2 * len(self._shots))
+            self._shots = np.zeros(size, dtype=np.intp)
+            self._pairs = np.zeros((3, size))
+            self._inside = np.zeros(size, dtype=bool)
+        # take com out= e quadrados no lugar: nenhum array por par
+        shots = indices.take(points, out=self._shots[:n], mode="clip")
+        ddx, ddy, tmp = self._pairs[:, :n]
+        self.x.take(shots, out=ddx, mode="clip")
+        ddx -= xs.take(targets, out=tmp, mode="clip")
+        self.y.take(shots, out=ddy, mode="clip")
+        ddy -= ys.take(targets, out=tmp, mode="clip")
+        ddx *= ddx
+        ddy *= ddy
+        ddx += ddy
+        radii.take(targets, out=tmp, mode="clip")
+        tmp *= tmp
+        inside = np.less(ddx, tmp, out=self._inside[:n])
+        if not np.count_nonzero(inside):
+            return _NONE, _NONE  # O caso comum
+        points = points.compress(inside)
+        targets = targets.compress(inside)
+        if len(points) > 1:
+            # Por projétil e, dentro dele, pelo alvo: o primeiro de cada projétil é o menor alvo
+            order = np.lexsort((targets, points))
+            points = points.take(order)
+            targets = targets.take(order)
+            first = np.ones(len(points), dtype=bool)
+            np.not_equal(points[1:], points[:-1], out=first[1:])
+            points = points.compress(first)
+            targets = targets.compress(first)
+        return indices.take(points), targets
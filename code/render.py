@@ -0,0 +1,331 @@
+import pygame
+
+from hud import Hud, TextCache
+from rotation_cache import RotationCache
+from world import WIDTH, EXPLOSION_COLORS, EXPLOSION_FRAMES
+
+# =================== Renderização =================== #
+# Passo opcional: desenha o estado de um World na tela. A simulação não sabe
+# que este módulo existe, então pode rodar sem ele (headless).
+
+
+class Renderer:
+    def __init__(self, screen, assets, text_cache=None, rotation_step=3, prebake=False, dirty_rects=True,
+                 max_dirty_rects=256):
+        """
+        assets: AssetRegistry (atiradores e meteoros são pedidos só quando aparecem)
+        text_cache: TextCache compartilhado com as outras telas (cria um se None)
+        rotation_step: resolução em graus do cache de rotação
+        prebake: gera todas as rotações da nave (e dos meteoros, se já carregados) na criação
+        dirty_rects: com a câmera parada, atualiza só os retângulos que mudaram
+        max_dirty_rects: com mais sprites que isso (ex.: modo horda) redesenhar tudo sai mais barato
+        """
+        self.screen = screen
+        self.assets = assets
+        self.bg_img = assets.frame("background")
+        self.tank_img = assets.frame("ship")
+        self._sprites = {}  # (sprite, raio) -> quadros do sprite com lado 2 * raio
+        # Pares [sprite, [x, y]] reaproveitados por draw_sprites: com milhares de inimigos, criar
+        # milhares de tuplas por quadro dispara coletas completas do GC (picos de ~15 ms)
+        self._blit_items = []
+
+        self.hud = Hud(text_cache or TextCache(), WIDTH)
+
+        # Rotações prontas da nave e dos meteoros (um cache por resolução, veja set_rotation_step)
+        self.rotations = RotationCache(step=rotation_step)
+        self._rotation_caches = {rotation_step: self.rotations}
+        if prebake:
+            self.rotations.prebake(self.tank_img)
+            if assets.loaded("meteor"):
+                self.prebake("meteor")
+
+        # Estado do modo de retângulos sujos
+        self.dirty_rects = dirty_rects
+        self.max_dirty_rects = max_dirty_rects
+        self._last_offset = None  # Deslocamento (em pixels) do fundo no último quadro
+        self._last_rects = []  # Onde os sprites foram desenhados no último quadro
+        self._update_rects = None  # None = tela inteira mudou (flip)
+
+        # Funções overlay(screen) -> Rect desenhadas por cima de tudo (ex.: painel do profiler)
+        self.overlays = []
+
+        # Cortes de qualidade (ligados pelo QualityGovernor quando o quadro não cabe no orçamento)
+        self.cull_offscreen = False  # Não desenhar entidades fora da tela
+        self.max_blasts = None  # Explosões desenhadas no máximo, as mais novas (None = todas)
+
+        # Taxa de preenchimento do fundo comparada ao caminho antigo
+        # (fill da tela + grade 3x3 de blits em todo quadro)
+        self.stats = {
+            "frames": 0,
+            "full_frames": 0,
+            "dirty_frames": 0,
+            "bg_pixels": 0,
+            "bg_blits": 0,
+            "baseline_pixels": 0,
+            "baseline_blits": 0,
+            "skipped": 0,  # Entidades não desenhadas pelos cortes de qualidade
+        }
+
+    def prebake(self, name):
+        """ Gera todas as rotações dos quadros do sprite name (ex.: em segundo plano, antes de aparecer) """
+        for image in self.assets.frames(name):
+            self.rotations.prebake(image)
+
+    def set_rotation_step(self, step):
+        """ Troca a resolução do cache de rotação; as rotações de cada resolução ficam guardadas """
+        if step == self.rotations.step:
+            return
+        cache = self._rotation_caches.get(step)
+        if cache is None:
+            cache = self._rotation_caches[step] = RotationCache(step=step)
+        self.rotations = cache
+
+    def invalidate(self):
+        """ Força um quadro completo (ex.: outra tela desenhou por cima ou a janela mudou) """
+        self._last_offset = None
+        self._last_rects = []
+
+    def _background_offset(self, offset_x, offset_y):
+        # Só a parte inteira importa: o blit descarta as frações de pixel
+        return (int(offset_x % self.bg_img.get_width()),
+                int(offset_y % self.bg_img.get_height()))
+
+    def draw_background(self, offset_x, offset_y):
+        """
+        Desenha o plano de fundo repetido para criar o efeito de movimentação infinita.
+        Só os ladrilhos visíveis são desenhados: no máximo 4 quando o fundo tem o tamanho da tela.
+        Respeita o clip da tela, então também serve para restaurar um retângulo.
+        """
+        screen = self.screen
+        bg_img = self.bg_img
+        bg_width, bg_height = bg_img.get_size()
+        screen_width, screen_height = screen.get_size()
+        clip = screen.get_clip()
+        ox, oy = self._background_offset(offset_x, offset_y)
+
+        stats = self.stats
+        y = -oy
+        while y < screen_height:
+            x = -ox
+            while x < screen_width:
+                tile = pygame.Rect(x, y, bg_width, bg_height)
+                if tile.colliderect(clip):
+                    drawn = screen.blit(bg_img, tile.topleft)
+                    stats["bg_blits"] += 1
+                    stats["bg_pixels"] += drawn.width * drawn.height
+                x += bg_width
+            y += bg_height
+
+    def draw(self, world, alpha=1.0):
+        """
+        Desenha um quadro do mundo (sem apresentar; veja present).
+        alpha: fração do caminho entre o tick anterior (0) e o atual (1); com o
+        passo fixo, o desenho fica entre dois ticks e o movimento não "pula".
+        Se o fundo não rolou desde o quadro anterior, só apaga os sprites antigos
+        e desenha os novos, guardando os retângulos para display.update.
+        """
+        screen = self.screen
+        stats = self.stats
+        back = 1.0 - alpha  # Quanto voltar em direção ao tick anterior (0 = posição atual, exata)
+        offset_x = world.total_offset_x - (world.total_offset_x - world.prev_offset_x) * back
+        offset_y = world.total_offset_y - (world.total_offset_y - world.prev_offset_y) * back
+        offset = self._background_offset(offset_x, offset_y)
+        full = (not self.dirty_rects or offset != self._last_offset
+                or len(self._last_rects) > self.max_dirty_rects)
+
+        stats["frames"] += 1
+        stats["baseline_pixels"] += 2 * screen.get_width() * screen.get_height()
+        stats["baseline_blits"] += 10
+
+        if full:
+            stats["full_frames"] += 1
+            self.draw_background(offset_x, offset_y)
+        else:
+            stats["dirty_frames"] += 1
+            # Apaga os sprites do quadro anterior restaurando o fundo embaixo deles
+            for rect in self._last_rects:
+                screen.set_clip(rect)
+                self.draw_background(offset_x, offset_y)
+            screen.set_clip(None)
+
+        rects = self.draw_entities(world.entities, back)
+        rects.extend(self.draw_projectiles(world.projectiles, back))
+        rects.extend(self.draw_player(world.player, back))
+        for overlay in self.overlays:
+            rects.append(overlay(screen))
+
+        self._update_rects = None if full else self._last_rects + rects
+        self._last_rects = rects
+        self._last_offset = offset
+
+    def present(self):
+        """ Envia o último quadro para a janela """
+        if self._update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._update_rects)
+
+    def fill_rate_saved(self):
+        """ Fração dos pixels de fundo/fill do caminho antigo que deixaram de ser escritos """
+        baseline = self.stats["baseline_pixels"]
+        return 1 - self.stats["bg_pixels"] / baseline if baseline else 0.0
+
+    # Os draw_* recebem back = 1 - alpha: a posição desenhada é x - (x - prev_x) * back
+
+    def sprites(self, name, radius):
+        """ Quadros do sprite name com lado 2 * radius (os do tamanho certo não são copiados) """
+        key = (name, radius)
+        sprites = self._sprites.get(key)
+        if sprites is None:
+            size = (2 * radius, 2 * radius)
+            sprites = tuple(f if f.get_size() == size else pygame.transform.smoothscale(f, size)
+                            for f in self.assets.frames(name))
+            self._sprites[key] = sprites
+        return sprites
+
+    def draw_entities(self, entities, back=0.0):
+        """ Desenha as entidades de um EntityStore (sprites, depois os que giram, depois explosões) """
+        sheets = entities.sheets
+        rects = []
+        for archetype in entities.query("position", "collider", "sprite"):
+            if archetype.count and "spin" not in archetype.components:
+                rects.extend(self.draw_sprites(archetype, sheets, back))
+        for archetype in entities.query("position", "collider", "sprite", "spin"):
+            if archetype.count:
+                rects.extend(self.draw_spinning(archetype, sheets, back))
+        for archetype in entities.query("position", "lifetime", "blast"):
+            if archetype.count:
+                rects.extend(self.draw_blasts(archetype))
+        return rects
+
+    def draw_sprites(self, archetype, sheets, back=0.0):
+        """ Desenha todas as linhas de um arquétipo com sprite com um blits() só e retorna os retângulos """
+        n = archetype.count
+        xs = archetype["x"]
+        ys = archetype["y"]
+        if back:
+            xs = xs - (xs - archetype["px"]) * back
+            ys = ys - (ys - archetype["py"]) * back
+        radii = archetype["radius"]
+        frames = archetype["frame"]
+        sheet_ids = archetype["sheet"]
+        if self.cull_offscreen:
+            visible = self._visible(xs, ys, radii)
+            if visible is not None:
+                xs, ys, radii = xs[visible], ys[visible], radii[visible]
+                frames, sheet_ids = frames[visible], sheet_ids[visible]
+                n = len(xs)
+                if not n:
+                    return []
+        frames = frames.tolist()
+
+        # O sprite tem lado 2 * raio: o canto é o centro menos o raio
+        lefts = (xs - radii).astype(int).tolist()
+        tops = (ys - radii).astype(int).tolist()
+
+        # DEBUG: Desenha o hitbox para depuração
+        # for x, y, r in zip(xs, ys, radii): pygame.draw.circle(self.screen, (255, 0, 0), (int(x), int(y)), r, 1)
+
+        items = self._blit_items
+        if len(items) < n:
+            items.extend([None, [0, 0]] for _ in range(n - len(items)))
+        radius = int(radii[0])
+        sheet = int(sheet_ids[0])
+        if (radii == radius).all() and (sheet_ids == sheet).all():
+            sprites = self.sprites(sheets[sheet], radius)
+            for item, f, x, y in zip(items, frames, lefts, tops):
+                item[0] = sprites[f]
+                pos = item[1]
+                pos[0] = x
+                pos[1] = y
+        else:
+            sets = {}
+            for item, s, r, f, x, y in zip(items, sheet_ids.tolist(), radii.tolist(), frames, lefts, tops):
+                sprites = sets.get((s, r))
+                if sprites is None:
+                    sprites = sets[s, r] = self.sprites(sheets[s], r)
+                item[0] = sprites[f]
+                pos = item[1]
+                pos[0] = x
+                pos[1] = y
+        return self.screen.blits(items if len(items) == n else items[:n])
+
+    def draw_spinning(self, archetype, sheets, back=0.0):
+        """ Linhas com spin (meteoros): cada uma vem rotacionada do cache """
+        screen = self.screen
+        angles = archetype["angle"]
+        xs = archetype["x"]
+        ys = archetype["y"]
+        if back:
+            angles = angles - (angles - archetype["prev_angle"]) * back
+            xs = xs - (xs - archetype["px"]) * back
+            ys = ys - (ys - archetype["py"]) * back
+        sheet_ids = archetype["sheet"]
+        radii = archetype["radius"]
+        frames = archetype["frame"]
+        if self.cull_offscreen:
+            # Rotacionado, o sprite pode passar do raio até a diagonal (~1,42 raio)
+            visible = self._visible(xs, ys, radii * 1.5)
+            if visible is not None:
+                xs, ys, angles = xs[visible], ys[visible], angles[visible]
+                sheet_ids, radii, frames = sheet_ids[visible], radii[visible], frames[visible]
+        rects = []
+        for s, r, f, angle, x, y in zip(sheet_ids.tolist(), radii.tolist(), frames.tolist(),
+                                        angles.tolist(), xs.tolist(), ys.tolist()):
+            # Busca a imagem rotacionada no cache e centraliza
+            rotated = self.rotations.get(self.sprites(sheets[s], r)[f], angle)
+            rect = rotated.get_rect(center=(int(x), int(y)))
+            rects.append(screen.blit(rotated, rect.topleft))
+        return rects
+
+    def _visible(self, xs, ys, extents):
+        """ Máscara de quem aparece na tela (centro a menos de extents da borda) ou None se todos aparecem """
+        width, height = self.screen.get_size()
+        visible = (xs > -extents) & (xs < width + extents) & (ys > -extents) & (ys < height + extents)
+        hidden = len(visible) - int(visible.sum())
+        if not hidden:
+            return None
+        self.stats["skipped"] += hidden
+        return visible
+
+    def draw_projectiles(self, projectiles, back=0.0):
+        """ Desenha todos os tiros vivos (jogador e inimigos) e retorna seus retângulos """
+        screen = self.screen
+        alive = projectiles.active()
+        xs = projectiles.x[alive]
+        ys = projectiles.y[alive]
+        if back:
+            xs -= (xs - projectiles.px[alive]) * back
+            ys -= (ys - projectiles.py[alive]) * back
+        xs = xs.astype(int).tolist()
+        ys = ys.astype(int).tolist()
+        return [pygame.draw.circle(screen, (255, 0, 0), (x, y), 5) for x, y in zip(xs, ys)]
+
+    def draw_blasts(self, archetype):
+        """ Explosões: círculos que crescem conforme o ttl acaba """
+        screen = self.screen
+        ttls, xs, ys = archetype["ttl"], archetype["x"], archetype["y"]
+        if self.max_blasts is not None and len(ttls) > self.max_blasts:
+            # As mais novas ficam no fim do arquétipo
+            skip = len(ttls) - self.max_blasts
+            ttls, xs, ys = ttls[skip:], xs[skip:], ys[skip:]
+            self.stats["skipped"] += skip
+        rects = []
+        for ttl, x, y in zip(ttls.tolist(), xs.astype(int).tolist(), ys.astype(int).tolist()):
+            age = EXPLOSION_FRAMES - ttl
+            color = EXPLOSION_COLORS[min(2, age) // 5]
+            rects.append(pygame.draw.circle(screen, color, (x, y), age * 3))
+        return rects
+
+    def draw_player(self, player, back=0.0):
+        """ Desenha a nave e o HUD; retorna os retângulos alterados """
+        screen = self.screen
+        angle = player.angle - (player.angle - player.prev_angle) * back
+        rotated_tank = self.rotations.get(self.tank_img, angle)
+        x = player.x - (player.x - player.prev_x) * back
+        y = player.y - (player.y - player.prev_y) * back
+        rect = rotated_tank.get_rect(center=(x, y))
+        ship_rect = screen.blit(rotated_tank, rect.topleft)
+
+        # Barra de saúde e placar
+        return [ship_rect] + self.hud.draw(screen, player)
@@ -0,0 +1,351 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+
+import pygame
+
+from world import World, Inputs, INPUT_KEYS, EVENT_KEYS, WIDTH, HEIGHT
+
+# =================== Gravação e replay =================== #
+# Uma partida é reproduzível a partir da semente, das regras do World no
+# início e, a cada tick, das teclas que a simulação lê (INPUT_KEYS, o que
+# interessa de pygame.key.get_pressed()) e dos KEYDOWN de EVENT_KEYS recebidos
+# desde o tick anterior. O Recorder grava isso num fluxo binário por diferença: só entra o
+# que mudou (tecla apertada/solta, KEYDOWN, regra alterada pelo governador de
+# qualidade) e sequências de ticks iguais viram um único contador. Parado ou
+# segurando a mesma tecla, um minuto de jogo custa poucos bytes.
+#
+# De tempos em tempos (e no fim) o fluxo leva um resumo do estado do World
+# (world_checksum); play() refaz a partida, sem janela ou desenhando, na
+# velocidade máxima, e confere cada resumo: uma divergência aponta o tick.
+#
+# Formato: cabeçalho MAGIC + versão (u8) + semente (u64) + largura e altura
+# da nave (u16 cada) + regras (JSON com tamanho u32), depois operações de um
+# byte seguidas dos argumentos em varint (inteiro sem sinal, 7 bits por byte).
+
+MAGIC = b"SJRP"
+VERSION = 1
+CHECK_EVERY = 600  # Ticks entre resumos do estado (10 s de jogo)
+REPLAY_SUFFIX = ".sjr"
+
+# Atributos de balanceamento do World gravados no início e a cada mudança
+RULES = ("enemy_spawn_rate", "score_threshold", "max_enemies", "spawn_batch", "enemy_radius",
+         "separation", "shooter_chance", "safe_distance", "meteor_spawn_rate")
+
+# Operações do fluxo
+OP_TICKS = 0  # n: n ticks com o estado atual (os KEYDOWN pendentes valem só para o primeiro)
+OP_PRESS = 1  # tecla: passa a estar apertada
+OP_RELEASE = 2  # tecla: deixa de estar apertada
+OP_KEYDOWN = 3  # tecla: evento KEYDOWN antes do próximo tick
+OP_RULE = 4  # índice em RULES + float64: regra alterada antes do próximo tick
+OP_CHECK = 5  # 8 bytes: world_checksum depois dos ticks até aqui
+OP_END = 6
+
+
+def _varint(value):
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return out
+
+
+def world_rules(world):
+    return tuple(getattr(world, name) for name in RULES)
+
+
+def world_checksum(world):
+    """ Resumo (8 bytes) de tudo o que decide os próximos ticks: jogador, entidades, tiros e o gerador """
+    h = hashlib.blake2b(digest_size=8)
+    player = world.player
+    h.update(struct.pack("<q7d2q", world.frame, player.x, player.y, player.angle, player.velocity_x,
+                         player.velocity_y, world.total_offset_x, world.total_offset_y, player.health, player.score))
+    for archetype in world.entities.archetypes.values():
+        for name in archetype.fields:
+            h.update(archetype[name].tobytes())
+    pool = world.projectiles
+    alive = pool.active()
+    for values in (pool.x, pool.y, pool.dx, pool.dy, pool.owner):
+        h.update(values[alive].tobytes())
+    h.update(repr(world.random.getstate()).encode())
+    return h.digest()
+
+
+class KeyState:
+    """ Teclas apertadas num tick do replay, lidas como o retorno de pygame.key.get_pressed() """
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# =================== Gravação =================== #
+class Recorder:
+    def __init__(self, check_every=CHECK_EVERY):
+        self.check_every = check_every
+        self.data = None  # bytearray da partida em gravação (None = parado)
+
+    @property
+    def recording(self):
+        return self.data is not None
+
+    def start(self, world):
+        """ Começa uma partida nova (chamar logo depois de world.reset(seed)) """
+        if world.seed is None:
+            raise ValueError("Só dá para gravar um World com semente (World.reset(seed=...))")
+        data = self.data = bytearray(MAGIC)
+        rules = json.dumps(dict(zip(RULES, world_rules(world)))).encode()
+        data += struct.pack("<BQHHI", VERSION, world.seed, world.player.width, world.player.height, len(rules))
+        data += rules
+        self.ticks = 0
+        self._idle = 0  # Ticks sem mudança ainda não escritos
+        self._pressed = frozenset()
+        self._rules = world_rules(world)
+
+    def _flush(self):
+        if self._idle:
+            self.data.append(OP_TICKS)
+            self.data += _varint(self._idle)
+            self._idle = 0
+
+    def tick(self, keys, keydowns, world):
+        """ Grava a entrada de um tick, antes de world.step (keys: get_pressed; keydowns: teclas dos KEYDOWN) """
+        if self.data is None:
+            return
+        pressed = frozenset(key for key in INPUT_KEYS if keys[key])
+        rules = world_rules(world)
+        keydowns = [key for key in keydowns if key in EVENT_KEYS]
+        if pressed != self._pressed or keydowns or rules != self._rules:
+            self._flush()
+            data = self.data
+            for key in sorted(pressed - self._pressed):
+                data.append(OP_PRESS)
+                data += _varint(key)
+            for key in sorted(self._pressed - pressed):
+                data.append(OP_RELEASE)
+                data += _varint(key)
+            for key in keydowns:
+                data.append(OP_KEYDOWN)
+                data += _varint(key)
+            for index, (old, new) in enumerate(zip(self._rules, rules)):
+                if old != new:
+                    data.append(OP_RULE)
+                    data += _varint(index)
+                    data += struct.pack("<d", new)
+            self._pressed = pressed
+            self._rules = rules
+        self._idle += 1
+        self.ticks += 1
+
+    def after_tick(self, world):
+        """ Depois de world.step: a cada check_every ticks grava o resumo do estado """
+        if self.data is not None and self.ticks % self.check_every == 0:
+            self._check(world)
+
+    def _check(self, world):
+        self._flush()
+        self.data.append(OP_CHECK)
+        self.data += world_checksum(world)
+
+    def finish(self, world):
+        """ Fecha a partida (com o resumo do estado final) e retorna os bytes; None se não gravava """
+        if self.data is None:
+            return None
+        if self.ticks % self.check_every:
+            self._check(world)
+        self._flush()
+        self.data.append(OP_END)
+        data, self.data = bytes(self.data), None
+        return data
+
+
+class ReplayStore:
+    """ Grava cada partida terminada num arquivo de directory e mantém só as keep mais recentes """
+
+    def __init__(self, directory, keep=20):
+        self.directory = directory
+        self.keep = keep
+        self.last_path = None
+
+    def save(self, data, ticks):
+        if not data or not ticks:
+            return None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, time.strftime("%Y%m%d_%H%M%S") + f"_{ticks}{REPLAY_SUFFIX}")
+            with open(path, "wb") as f:
+                f.write(data)
+            self._prune()
+        except OSError as e:
+            print("❌ Erro ao gravar replay:", e)
+            return None
+        self.last_path = path
+        print(f"🎞️ Replay salvo em {path} ({ticks} ticks, {len(data)} bytes)")
+        return path
+
+    def _prune(self):
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith(REPLAY_SUFFIX))
+        for name in names[:-self.keep]:
+            os.remove(os.path.join(self.directory, name))
+
+
+# =================== Leitura e reprodução =================== #
+class Replay:
+    def __init__(self, data):
+        if data[:4] != MAGIC:
+            raise ValueError("Não é um replay do Space Journey")
+        version, self.seed, width, height, size = struct.unpack_from("<BQHHI", data, 4)
+        if version != VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        start = 4 + struct.calcsize("<BQHHI")
+        self.player_size = (width, height)
+        self.rules = json.loads(data[start:start + size])
+        self.data = data
+        self._body = start + size
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def create_world(self):
+        world = World(self.seed, player_size=self.player_size)
+        for name, value in self.rules.items():
+            setattr(world, name, value)
+        return world
+
+    def events(self):
+        """ Gera (op, argumento) do fluxo até OP_END """
+        data = self.data
+        i = self._body
+        while i < len(data):
+            op = data[i]
+            i += 1
+            if op == OP_END:
+                return
+            if op == OP_CHECK:
+                yield op, bytes(data[i:i + 8])
+                i += 8
+                continue
+            value = shift = 0
+            while True:
+                byte = data[i]
+                i += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            if op == OP_RULE:
+                yield op, (RULES[value], struct.unpack_from("<d", data, i)[0])
+                i += 8
+            else:
+                yield op, value
+        raise ValueError("Replay truncado (sem OP_END)")
+
+    def inputs(self):
+        """ Gera o Inputs de cada tick gravado (sem as mudanças de regra), como entrada roteirizada """
+        pressed = set()
+        shoot = False
+        for op, arg in self.events():
+            if op == OP_TICKS:
+                keys = KeyState(pressed)
+                yield Inputs.from_keys(keys, shoot)
+                if arg > 1:
+                    idle = Inputs.from_keys(keys)
+                    for _ in range(arg - 1):
+                        yield idle
+                shoot = False
+            elif op == OP_PRESS:
+                pressed.add(arg)
+            elif op == OP_RELEASE:
+                pressed.discard(arg)
+            elif op == OP_KEYDOWN:
+                shoot = shoot or arg == pygame.K_SPACE
+
+
+def play(replay, world=None, on_tick=None):
+    """
+    Refaz a partida do replay na velocidade máxima; on_tick(world) roda depois
+    de cada tick (ex.: desenhar). Retorna (world, ticks, divergências), com as
+    divergências como lista dos ticks cujo resumo não bateu.
+    """
+    if world is None:
+        world = replay.create_world()
+    else:
+        world.reset(replay.seed)
+        for name, value in replay.rules.items():
+            setattr(world, name, value)
+    pressed = set()
+    keydowns = []
+    mismatches = []
+    ticks = 0
+    for op, arg in replay.events():
+        if op == OP_TICKS:
+            for _ in range(arg):
+                world.step(Inputs.from_keys(KeyState(pressed), pygame.K_SPACE in keydowns))
+                keydowns.clear()
+                ticks += 1
+                if on_tick is not None:
+                    on_tick(world)
+        elif op == OP_PRESS:
+            pressed.add(arg)
+        elif op == OP_RELEASE:
+            pressed.discard(arg)
+        elif op == OP_KEYDOWN:
+            keydowns.append(arg)
+        elif op == OP_RULE:
+            name, value = arg
+            setattr(world, name, type(getattr(world, name))(value))
+        elif op == OP_CHECK:
+            if world_checksum(world) != arg:
+                mismatches.append(ticks)
+    return world, ticks, mismatches
+
+
+def window_drawer():
+    """ on_tick que desenha cada tick numa janela (sem limite de FPS) """
+    from assets import AssetRegistry
+    from render import Renderer
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Space Journey - replay")
+    renderer = Renderer(screen, AssetRegistry().load_defaults(), prebake=True)
+
+    def draw(world):
+        pygame.event.pump()
+        renderer.draw(world)
+        renderer.present()
+    return draw
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reproduz um replay gravado pelo jogo")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="desenha cada tick (sem limite de FPS)")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    start = time.perf_counter()
+    world, ticks, mismatches = play(replay, on_tick=window_drawer() if args.render else None)
+    elapsed = time.perf_counter() - start
+    print(f"🎞️ {ticks} ticks em {elapsed:.3f}s ({ticks / max(elapsed, 1e-9):.0f} ticks/s) | semente {replay.seed}"
+          f" | pontuação {world.player.score} | vida {world.player.health}")
+    if mismatches:
+        print(f"❌ Estado divergiu do gravado nos ticks {mismatches}")
+        sys.exit(1)
+    print("✅ Mesmo estado da partida gravada em todos os resumos")
+
+
+if __name__ == "__main__":
+    main()
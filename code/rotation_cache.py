@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+import pygame
+
+# =================== Cache de rotação =================== #
+# pygame.transform.rotate é uma das chamadas mais caras do quadro. Aqui o ângulo
+# é quantizado (ex.: passos de 3°) e cada par (imagem, ângulo quantizado) é
+# rotacionado uma única vez; os quadros seguintes só fazem blit da superfície pronta.
+
+
+class RotationCache:
+    def __init__(self, step=3, max_entries=512):
+        """
+        step: resolução angular em graus (360 precisa ser múltiplo, ex.: 1, 2, 3, 5)
+        max_entries: superfícies guardadas antes de descartar a menos usada (LRU)
+        """
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.set_step(step)
+
+    def set_step(self, step):
+        """ Muda a resolução angular; as rotações antigas deixam de servir """
+        self.step = step
+        self.buckets = max(1, round(360 / step))
+        self._cache.clear()
+
+    def quantize(self, angle):
+        """ Índice do passo angular mais próximo de angle """
+        return round(angle / self.step) % self.buckets
+
+    def get(self, image, angle):
+        """ Versão de image rotacionada para o passo mais próximo de angle """
+        key = (image, self.quantize(angle))
+        cache = self._cache
+        rotated = cache.get(key)
+        if rotated is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return rotated
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(image, key[1] * self.step)
+        cache[key] = rotated
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+            self.evictions += 1
+        return rotated
+
+    def prebake(self, image):
+        """ Gera de uma vez todas as rotações de image (ex.: na inicialização) """
+        cache = self._cache
+        for bucket in range(self.buckets):
+            key = (image, bucket)
+            if key not in cache:
+                cache[key] = pygame.transform.rotate(image, bucket * self.step)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
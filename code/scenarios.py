@@ -0,0 +1,151 @@
+import math
+import random
+
+from world import World, Inputs, WIDTH, HEIGHT, HORDE_RULES
+
+# =================== Cenários de carga =================== #
+# Partidas reproduzíveis para medir desempenho: cada cenário tem uma semente,
+# uma duração, um bot e, se quiser, populações fixas ("100 inimigos, 500 tiros,
+# 50 meteoros"). As regras normais de spawn só colocam alguns inimigos na tela;
+# aqui o cenário completa as populações antes de cada tick, então a carga fica
+# constante do começo ao fim. O jogador não morre nesses cenários (a vida
+# volta ao máximo depois de cada tick), para a carga não cair a cada reinício.
+
+ENEMY_BULLET_SPEED = 4
+BULLET_OWNER = 2 ** 31 - 1  # Dono dos tiros extras (nenhum atirador chega a esse id)
+
+
+def idle_bot(world):
+    return Inputs()
+
+
+def spinning_shooter(world):
+    # Gira, acelera metade do tempo e atira a cada 10 ticks
+    return Inputs(left=True, up=world.frame % 120 < 60, shoot=world.frame % 10 == 0)
+
+
+def rapid_shooter(world):
+    # Parado no centro, girando e atirando a cada 3 ticks
+    return Inputs(left=True, shoot=world.frame % 3 == 0)
+
+
+def patrol(world):
+    # Alterna entre voar (câmera rolando) e ficar parado atirando
+    phase = world.frame % 240
+    return Inputs(left=phase < 30, up=phase < 60, shoot=world.frame % 8 == 0)
+
+
+def hunter(world):
+    # Mira no perseguidor mais perto e atira quando alinhado; foge dos que chegam perto demais
+    player = world.player
+    nearest = None
+    for archetype in world.entities.query("position", "chase"):
+        if archetype.count:
+            dist = (archetype["x"] - player.x) ** 2 + (archetype["y"] - player.y) ** 2
+            i = int(dist.argmin())
+            if nearest is None or dist[i] < nearest[0]:
+                nearest = (dist[i], float(archetype["x"][i]), float(archetype["y"][i]))
+    if nearest is None:
+        return Inputs(left=True, shoot=world.frame % 30 == 0)
+    dist, x, y = nearest
+    target = math.degrees(math.atan2(player.y - y, x - player.x))
+    turn = (target - player.angle + 180) % 360 - 180
+    aligned = abs(turn) < 10
+    return Inputs(left=turn > player.rotation_speed / 2, right=turn < -player.rotation_speed / 2,
+                  down=dist < 120 ** 2, shoot=aligned and world.frame % 6 == 0)
+
+
+BOTS = {"idle": idle_bot, "spinning": spinning_shooter, "rapid": rapid_shooter, "patrol": patrol, "hunter": hunter}
+
+
+class Scenario:
+    def __init__(self, name, description, frames, bot=idle_bot, seed=1, enemies=0, shooters=0.0,
+                 bullets=0, meteors=0, rules=None, immortal=True):
+        """
+        frames: ticks simulados
+        enemies, bullets, meteors: populações mantidas a cada tick (0 = só as regras normais)
+        shooters: fração dos inimigos extras que são atiradores
+        rules: atributos do World sobrescritos (ex.: {"max_enemies": 20})
+        immortal: a vida do jogador volta ao máximo a cada tick; senão a partida reinicia no game over
+        """
+        self.name = name
+        self.description = description
+        self.frames = frames
+        self.bot = bot
+        self.seed = seed
+        self.enemies = enemies
+        self.shooters = shooters
+        self.bullets = bullets
+        self.meteors = meteors
+        self.rules = rules or {}
+        self.immortal = immortal
+
+    def create_world(self, world=None, **kwargs):
+        """ World novo (ou reiniciado) já com as regras do cenário """
+        if world is None:
+            world = World(self.seed, **kwargs)
+        else:
+            world.random.seed(self.seed)
+            world.reset()
+        for attr, value in self.rules.items():
+            setattr(world, attr, value)
+        return world
+
+    def run(self, world, on_frame=None):
+        """
+        Roda o cenário inteiro; on_frame(world) é chamado depois de cada tick
+        (ex.: desenhar). Os extras saem de um gerador próprio, com a mesma semente.
+        """
+        rng = random.Random(self.seed)
+        bot = self.bot
+        health = world.player.health
+        for _ in range(self.frames):
+            self.maintain(world, rng)
+            world.step(bot(world))
+            if self.immortal:
+                world.player.health = health
+            elif world.game_over:
+                world.reset()
+            if on_frame is not None:
+                on_frame(world)
+        return world
+
+    def maintain(self, world, rng):
+        """ Completa as populações do cenário antes do tick """
+        while world.enemy_count < self.enemies:
+            x, y = world.safe_spawn_point()
+            world.spawn_enemy(x, y, shooter=rng.random() < self.shooters)
+        while world.meteor_count < self.meteors:
+            world.spawn_meteor(speed=rng.uniform(1, 10))
+        if self.bullets:
+            self._fill_bullets(world, rng)
+
+    def _fill_bullets(self, world, rng):
+        # Tiros inimigos entrando pelas bordas na direção do jogador
+        pool = world.projectiles
+        player = world.player
+        while pool.count < self.bullets:
+            # Um pixel para dentro: quem está na borda já sai no cull do tick
+            if rng.random() < 0.5:
+                x, y = rng.choice((1, WIDTH - 1)), rng.uniform(1, HEIGHT - 1)
+            else:
+                x, y = rng.uniform(1, WIDTH - 1), rng.choice((1, HEIGHT - 1))
+            angle = math.atan2(player.y - y, player.x - x) + rng.uniform(-0.3, 0.3)
+            pool.spawn(x, y, ENEMY_BULLET_SPEED * math.cos(angle), ENEMY_BULLET_SPEED * math.sin(angle),
+                       BULLET_OWNER)
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in (
+        Scenario("idle", "Regras padrão, nave parada", 3600),
+        Scenario("swarm", "100 inimigos (10% atiradores) e bot atirando", 1800, spinning_shooter,
+                 enemies=100, shooters=0.1),
+        Scenario("bullet_hell", "500 tiros na tela, 20 inimigos e bot atirando a cada 3 ticks", 1800,
+                 rapid_shooter, enemies=20, bullets=500),
+        Scenario("meteor_storm", "50 meteoros cruzando a tela", 1800, spinning_shooter, meteors=50),
+        Scenario("horde", "Modo horda: 3000 inimigos (2% atiradores) perseguindo a nave", 1800,
+                 spinning_shooter, enemies=3000, shooters=0.02, rules=HORDE_RULES),
+        Scenario("long_session", "Regras padrão por 10 minutos de jogo, reiniciando no game over", 36000,
+                 patrol, immortal=False),
+    )
+}
@@ -0,0 +1,391 @@
+import asyncio
+import random
+
+import pygame
+
+from world import Inputs, WIDTH, HEIGHT, TICK_RATE
+
+# =================== Cenas =================== #
+# Um único laço (SceneManager.run) chama a cena atual a cada quadro. Trocar de
+# tela é só trocar de cena com switch(); nenhuma tela chama o laço de outra,
+# então reiniciar a partida não empilha corrotinas nem deixa partidas antigas
+# vivas. O World e o Renderer são criados uma vez e reaproveitados (reset()).
+#
+# A partida usa passo fixo: o tempo real de cada quadro entra num acumulador e
+# a simulação avança quantos ticks de 1/TICK_RATE couberem nele. O desenho
+# pode rodar a 30, 60 ou 144 FPS sem mudar a velocidade do jogo, e as posições
+# desenhadas são interpoladas entre os dois últimos ticks.
+#
+# Com um Recorder (replay.py), cada partida começa com uma semente nova e a
+# entrada de cada tick é gravada antes do step; ao sair da partida os bytes
+# vão para on_replay.
+
+TICK_EPSILON = 1e-9  # Folga para o erro de ponto flutuante (60 x 1/60 nem sempre dá 1.0)
+
+
+class Scene:
+    """ Uma tela do jogo. enter/exit rodam a cada troca de cena """
+
+    manager = None  # Preenchido pelo SceneManager
+
+    def enter(self, **kwargs):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        """ Desenha e atualiza o display """
+
+
+class SceneManager:
+    def __init__(self, scenes, text_cache=None, fps=60, hotkeys=None, on_first_frame=None, on_frame_time=None):
+        """
+        scenes: nome -> Scene
+        hotkeys: tecla -> função sem argumentos, tratada antes da cena atual (vale em todas as telas)
+        on_first_frame: chamada uma vez, logo depois do primeiro quadro desenhado
+        on_frame_time: recebe, a cada quadro, quantos ms ele levou sem a espera do FPS (ex.: QualityGovernor.observe)
+        """
+        self.scenes = scenes
+        for scene in scenes.values():
+            scene.manager = self
+        self.text_cache = text_cache
+        self.fps = fps
+        self.hotkeys = hotkeys if hotkeys is not None else {}
+        self.on_first_frame = on_first_frame
+        self.on_frame_time = on_frame_time
+        self.current = None
+        self.current_name = None
+        self.running = True
+        self.switches = 0
+        self._pending = None
+
+    def switch(self, name, **kwargs):
+        """ Pede a troca para a cena name; kwargs vão para o enter() dela """
+        self._pending = (name, kwargs)
+
+    def quit(self):
+        self.running = False
+
+    def _apply_switch(self):
+        name, kwargs = self._pending
+        self._pending = None
+        if self.current is not None:
+            self.current.exit()
+        self.current_name = name
+        self.current = self.scenes[name]
+        self.switches += 1
+        self.current.enter(**kwargs)
+
+    def step(self, events, dt):
+        """ Um quadro sem desenhar: eventos, atualização e trocas de cena pedidas """
+        if self._pending is not None:
+            self._apply_switch()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+                return
+            if event.type == pygame.KEYDOWN and event.key in self.hotkeys:
+                self.hotkeys[event.key]()
+                continue
+            self.current.handle_event(event)
+            if self._pending is not None:
+                break  # O resto dos eventos era para a cena que está saindo
+        if self._pending is not None:
+            self._apply_switch()
+        self.current.update(dt)
+        if self._pending is not None:
+            self._apply_switch()
+
+    def draw(self):
+        self.current.draw()
+        if self.text_cache is not None:
+            self.text_cache.end_frame()
+
+    def poll_events(self):
+        return pygame.event.get()
+
+    def tick(self, dt):
+        """ Um quadro completo: eventos, atualização e desenho """
+        self.step(self.poll_events(), dt)
+        if self.running:
+            self.draw()
+            if self.on_first_frame is not None:
+                callback, self.on_first_frame = self.on_first_frame, None
+                callback()
+
+    async def run(self, first, **kwargs):
+        """ Laço principal: roda até quit() ou o evento QUIT """
+        self.switch(first, **kwargs)
+        clock = pygame.time.Clock()
+        dt = 0.0
+        while self.running:
+            self.tick(dt)
+            if not self.running:
+                break
+            dt = clock.tick(self.fps) / 1000.0
+            if self.on_frame_time is not None:
+                self.on_frame_time(clock.get_rawtime())
+            await asyncio.sleep(0)
+
+
+# =================== Partida =================== #
+class PlayingScene(Scene):
+    def __init__(self, world, renderer, play_sounds=None, tick_rate=TICK_RATE, max_steps=5, recorder=None,
+                 on_replay=None):
+        """
+        tick_rate: ticks da simulação por segundo, independente do FPS de desenho
+        max_steps: ticks no máximo por quadro; se o desenho atrasar mais que isso
+        o tempo excedente é descartado (o jogo desacelera em vez de travar tentando alcançar)
+        recorder: replay.Recorder que grava cada partida (None = não grava)
+        on_replay: recebe (bytes, ticks) de cada partida gravada, ao sair dela
+        """
+        self.world = world
+        self.renderer = renderer
+        self.play_sounds = play_sounds
+        self.tick_dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.recorder = recorder
+        self.on_replay = on_replay
+        self.shoot = False
+        self.keydowns = []  # Teclas dos KEYDOWN ainda não entregues a um tick (gravação)
+        self.accumulator = 0.0  # Tempo real ainda não simulado (s)
+        self.alpha = 1.0  # Posição do desenho entre o tick anterior e o atual
+        self.ticks = 0  # Ticks simulados desde o início
+        self.dropped = 0.0  # Segundos descartados pelo limite max_steps
+
+    def enter(self):
+        if self.recorder is None:
+            self.world.reset()  # Reaproveita o mesmo World (pool de projéteis, grades...)
+        else:
+            self.world.reset(seed=random.getrandbits(63))  # Semente nova e conhecida: a partida pode ser refeita
+            self.recorder.start(self.world)
+        self.renderer.invalidate()  # A tela anterior desenhou por cima
+        self.shoot = False
+        self.keydowns.clear()
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def exit(self):
+        self.finish_recording()
+
+    def finish_recording(self):
+        """ Fecha a gravação da partida atual (se houver) e entrega os bytes a on_replay """
+        recorder = self.recorder
+        if recorder is None or not recorder.recording:
+            return
+        ticks = recorder.ticks
+        data = recorder.finish(self.world)
+        if self.on_replay is not None:
+            self.on_replay(data, ticks)
+
+    def handle_event(self, event):
+        if event.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+            self.renderer.invalidate()
+        if event.type == pygame.KEYDOWN:
+            self.keydowns.append(event.key)
+            if event.key == pygame.K_SPACE:  # Pressione ESPAÇO para atirar
+                self.shoot = True
+            elif event.key == pygame.K_ESCAPE:
+                self.manager.quit()
+            elif event.key == pygame.K_r:
+                self.manager.switch("playing")
+
+    def update(self, dt):
+        world = self.world
+        # Verifica se o jogador ainda está vivo
+        if world.game_over:
+            self.manager.switch("initials", score=world.player.score)
+            return
+
+        # Avança a simulação quantos ticks couberem no tempo acumulado
+        self.accumulator += dt
+        steps = 0
+        keys = None
+        while self.accumulator >= self.tick_dt - TICK_EPSILON:
+            if steps == self.max_steps:
+                self.dropped += self.accumulator
+                self.accumulator = 0.0
+                break
+            if keys is None:
+                keys = pygame.key.get_pressed()
+            if self.recorder is not None:
+                self.recorder.tick(keys, self.keydowns, world)
+            # Um tiro pedido num quadro sem tick fica guardado para o próximo tick
+            world.step(Inputs.from_keys(keys, self.shoot))
+            self.shoot = False
+            self.keydowns.clear()
+            if self.recorder is not None:
+                self.recorder.after_tick(world)
+            self.accumulator -= self.tick_dt
+            self.ticks += 1
+            steps += 1
+            if self.play_sounds is not None:
+                self.play_sounds(world.sounds)
+            if world.game_over:
+                self.accumulator = 0.0
+                break
+        self.alpha = min(1.0, max(0.0, self.accumulator / self.tick_dt))
+
+    def draw(self):
+        self.renderer.draw(self.world, self.alpha)
+        self.renderer.present()
+
+
+# =================== Iniciais =================== #
+class InitialsScene(Scene):
+    def __init__(self, screen, background, text_cache, on_submit, pause=1.0):
+        """
+        on_submit(nome, pontuação): chamado quando o jogador confirma as iniciais
+        pause: segundos mostrando o último quadro da partida antes de pedir as iniciais
+        """
+        self.screen = screen
+        self.background = background
+        self.text = text_cache
+        self.on_submit = on_submit
+        self.pause = pause
+        self.score = 0
+        self.initials = ""
+        self.wait = 0.0
+
+    def enter(self, score=0):
+        self.score = score
+        self.initials = ""
+        self.wait = self.pause
+        print("⌨️ Pedindo iniciais do jogador...")
+
+    def handle_event(self, event):
+        if self.wait > 0 or event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_RETURN and len(self.initials) == 3:
+            print(f"✅ Nome recebido: {self.initials}")
+            self.on_submit(self.initials, self.score)  # Não espera a rede
+            self.manager.switch("game_over")
+        elif event.key == pygame.K_BACKSPACE and len(self.initials) > 0:
+            self.initials = self.initials[:-1]
+        elif len(self.initials) < 3 and event.unicode.isalnum():
+            self.initials += event.unicode.upper()
+
+    def update(self, dt):
+        if self.wait > 0:
+            self.wait -= dt
+
+    def draw(self):
+        if self.wait > 0:
+            return  # O último quadro da partida continua na tela
+        screen = self.screen
+        screen.blit(self.background, (0, 0))
+
+        # Texto de instrução
+        text_prompt = self.text.render("Digite suas iniciais:", 50, (255, 255, 255))
+        screen.blit(text_prompt, (WIDTH // 2 - 150, HEIGHT // 2 - 50))
+
+        # Mostra as iniciais digitadas (só rasteriza quando o texto muda)
+        text_initials = self.text.render(self.initials, 50, (255, 255, 0))
+        screen.blit(text_initials, (WIDTH // 2 - 50, HEIGHT // 2))
+
+        pygame.display.flip()
+
+
+# =================== Tela de Game Over =================== #
+class GameOverScene(Scene):
+    COR_TITULO = (255, 0, 0)       # Vermelho
+    COR_SUBTITULO = (21, 101, 230)  # Azul
+    COR_REINICIAR = (0, 255, 0)    # Verde
+
+    def __init__(self, screen, background, text_cache):
+        self.screen = screen
+        self.background = background
+        self.text = text_cache
+        # Centraliza todos os textos
+        centro_x = WIDTH // 2
+        self.game_over_pos = (centro_x, HEIGHT // 3)
+        self.ranking_pos = (centro_x, HEIGHT // 3 + 60)
+        self.ranking_rect = None  # Área do botão, medida no primeiro draw (construir a cena não inicia as fontes)
+        self.restart_pos = (centro_x, HEIGHT - 80)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                self.manager.switch("playing")
+            elif event.key == pygame.K_ESCAPE:
+                self.manager.quit()
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Verifica se clicou no botão de ranking
+            if self.ranking_rect is not None and self.ranking_rect.collidepoint(event.pos):
+                self.manager.switch("leaderboard")
+
+    def draw(self):
+        screen = self.screen
+        screen.blit(self.background, (0, 0))
+
+        text_game_over = self.text.render("FIM DE JOGO", 50, self.COR_TITULO)
+        screen.blit(text_game_over, text_game_over.get_rect(center=self.game_over_pos))
+
+        # Desenha o botão de ranking
+        text_ranking = self.text.render("CLIQUE AQUI PARA VER TOP 10", 50, self.COR_SUBTITULO)
+        self.ranking_rect = text_ranking.get_rect(center=self.ranking_pos)
+        pygame.draw.rect(screen, self.COR_SUBTITULO, self.ranking_rect.inflate(20, 10), 2)  # Borda do botão
+        screen.blit(text_ranking, self.ranking_rect)
+
+        # Texto de reinício na parte inferior
+        text_restart = self.text.render("Pressione ENTER para reiniciar", 50, self.COR_REINICIAR)
+        screen.blit(text_restart, text_restart.get_rect(center=self.restart_pos))
+
+        pygame.display.flip()
+
+
+# =================== Top 10 =================== #
+class LeaderboardScene(Scene):
+    COR_TITULO = (21, 101, 230)  # Azul
+    COR_PLACAR = (255, 255, 255)  # Branco
+    COR_VOLTAR = (255, 0, 0)     # Vermelho
+
+    def __init__(self, screen, background, text_cache, cache):
+        """ cache: LeaderboardCache (lido a cada quadro, sem esperar a rede) """
+        self.screen = screen
+        self.background = background
+        self.text = text_cache
+        self.cache = cache
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.switch("game_over")
+
+    def draw(self):
+        screen = self.screen
+        centro_x = WIDTH // 2
+
+        # Limpa a tela e desenha o fundo
+        screen.blit(self.background, (0, 0))
+
+        # Título
+        text_titulo = self.text.render("TOP 10 PONTUAÇÕES", 50, self.COR_TITULO)
+        screen.blit(text_titulo, text_titulo.get_rect(center=(centro_x, 50)))
+
+        # Mostra placar (a revalidação em segundo plano aparece sozinha)
+        top_scores = self.cache.get()
+        y_offset = 120
+        if not top_scores:
+            mensagem = "Nenhuma pontuação encontrada" if self.cache.loaded else "Carregando..."
+            no_scores_text = self.text.render(mensagem, 50, self.COR_PLACAR)
+            screen.blit(no_scores_text, no_scores_text.get_rect(center=(centro_x, y_offset)))
+        else:
+            for i, record in enumerate(top_scores[:10]):
+                name = str(record.get("name", "???"))[:3]
+                score = str(record.get("score", "0"))
+                score_text = self.text.render(f"{i+1}. {name} - {score}", 50, self.COR_PLACAR)
+                screen.blit(score_text, score_text.get_rect(center=(centro_x, y_offset)))
+                y_offset += 40
+
+        # Botão voltar
+        text_voltar = self.text.render("Pressione ESC para voltar", 50, self.COR_VOLTAR)
+        screen.blit(text_voltar, text_voltar.get_rect(center=(centro_x, HEIGHT - 50)))
+
+        pygame.display.flip()
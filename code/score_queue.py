@@ -0,0 +1,176 @@
+import asyncio
+import json
+import os
+import random
+import string
+import time
+
+# =================== Fila de envio de recordes =================== #
+# submit() só anota o recorde e volta na hora; uma tarefa asyncio envia em
+# segundo plano. Os pendentes ficam num arquivo de diário, então sobrevivem a
+# um fechamento do jogo, e falhas são repetidas com backoff.
+# O envio usa PATCH em records.json com chaves geradas aqui: vários recordes vão
+# numa requisição só e repetir o mesmo lote não duplica nada no Firebase.
+
+PUSH_CHARS = string.ascii_letters + string.digits
+
+
+def make_key(now=None):
+    """ Chave única no estilo dos push ids do Firebase (ordenada pelo tempo) """
+    millis = int((now if now is not None else time.time()) * 1000)
+    return f"-{millis:013d}{''.join(random.choice(PUSH_CHARS) for _ in range(8))}"
+
+
+class ScoreQueue:
+    def __init__(self, request_handler, url, journal_path="pending_scores.json",
+                 batch_size=20, backoff=1.0, max_backoff=60.0):
+        """
+        url: endpoint REST da coleção (records.json)
+        journal_path: arquivo onde os recordes ainda não enviados ficam guardados
+        batch_size: máximo de recordes por requisição
+        backoff/max_backoff: espera após uma falha (dobra a cada falha seguida)
+        """
+        self.request_handler = request_handler
+        self.url = url
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.pending = self._load_journal()
+        self._wakeup = None
+        self._task = None
+
+        # Métricas
+        self.sent = 0
+        self.batches = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.last_latency = None
+        self.total_latency = 0.0
+
+    # ---------- diário ---------- #
+    def _load_journal(self):
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return []
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                entries = json.load(f)
+            print(f"📒 {len(entries)} recorde(s) pendente(s) recuperado(s) do diário")
+            return [e for e in entries if isinstance(e, dict) and "key" in e]
+        except (OSError, ValueError) as e:
+            print("❌ Erro ao ler diário de recordes:", e)
+            return []
+
+    def _save_journal(self):
+        if not self.journal_path:
+            return
+        try:
+            if not self.pending:
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                return
+            tmp_path = self.journal_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.pending, f)
+            os.replace(tmp_path, self.journal_path)  # Troca atômica: nunca fica pela metade
+        except OSError as e:
+            print("❌ Erro ao gravar diário de recordes:", e)
+
+    # ---------- API ---------- #
+    def submit(self, name, score):
+        """ Enfileira um recorde e retorna imediatamente com a chave gerada """
+        entry = {
+            "key": make_key(),
+            "name": str(name)[:3],  # Garante que terá no máximo 3 caracteres
+            "score": int(score),    # Garante que será um número inteiro
+            "queued_at": time.time(),
+        }
+        self.pending.append(entry)
+        self._save_journal()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return entry["key"]
+
+    def start(self):
+        """ Inicia a tarefa de envio (precisa de um event loop rodando) """
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            if self.pending:
+                self._wakeup.set()
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def close(self, flush_timeout=2.0):
+        """ Tenta enviar o que falta por até flush_timeout segundos e para a tarefa """
+        if self._task is None:
+            return
+        if self.pending and flush_timeout:
+            try:
+                await asyncio.wait_for(self.flush(), flush_timeout)
+            except asyncio.TimeoutError:
+                print(f"⚠️ {len(self.pending)} recorde(s) ficam no diário para a próxima vez")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def flush(self):
+        """ Espera até a fila esvaziar """
+        while self.pending:
+            self._wakeup.set()
+            await asyncio.sleep(0.05)
+
+    def metrics(self):
+        oldest = min((e["queued_at"] for e in self.pending), default=None)
+        return {
+            "depth": len(self.pending),
+            "oldest_age": time.time() - oldest if oldest is not None else 0.0,
+            "sent": self.sent,
+            "batches": self.batches,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "last_latency": self.last_latency,
+            "avg_latency": self.total_latency / self.batches if self.batches else None,
+        }
+
+    # ---------- envio ---------- #
+    async def _send(self, batch):
+        payload = {e["key"]: {"name": e["name"], "score": e["score"]} for e in batch}
+        response = await self.request_handler.patch(self.url, payload)
+        if isinstance(response, dict) and "error" in response:
+            raise RuntimeError(response["error"])
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self.pending:
+                batch = self.pending[:self.batch_size]
+                start = time.perf_counter()
+                try:
+                    await self._send(batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.failures += 1
+                    self.consecutive_failures += 1
+                    self.last_error = f"{type(e).__name__}: {e}"
+                    delay = min(self.max_backoff, self.backoff * 2 ** (self.consecutive_failures - 1))
+                    print(f"❌ Erro ao enviar {len(batch)} recorde(s), nova tentativa em {delay:.0f}s:", e)
+                    await asyncio.sleep(delay)
+                    continue
+
+                self.last_latency = time.perf_counter() - start
+                self.total_latency += self.last_latency
+                self.batches += 1
+                self.sent += len(batch)
+                self.consecutive_failures = 0
+                sent_keys = {e["key"] for e in batch}
+                self.pending = [e for e in self.pending if e["key"] not in sent_keys]
+                self._save_journal()
+                print(f"✅ {len(batch)} recorde(s) salvo(s) no Firebase!")
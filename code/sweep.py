@@ -0,0 +1,313 @@
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from assets import SPRITES, load_image
+from replay import Replay
+from scenarios import BOTS
+from world import World, Inputs, GAME_MODES, TICK_RATE
+
+# =================== Varredura em lote =================== #
+# Roda muitas partidas sem janela, cada uma com sua semente e suas regras, em
+# paralelo num ProcessPoolExecutor (um processo por núcleo). Cada partida é
+# um World próprio: as regras são atributos do World (os globais de world.py
+# só dão os valores iniciais), então variar enemy_spawn_rate ou safe_distance
+# numa partida não afeta as outras. Quem joga é um bot de scenarios.BOTS ou a
+# entrada gravada num replay (replay.py), repetida sob outras regras (as do
+# modo e as de --set, não as do cabeçalho do replay).
+#
+# Cada resultado (pontuação, tempo de sobrevivência, custo por tick) é
+# entregue assim que a partida acaba, na ordem em que terminam; aggregate()
+# junta as partidas de cada combinação de regras num relatório. Uma partida
+# que levanta exceção vira um resultado com "error" (e as regras e a semente
+# para reproduzi-la) e a varredura continua com as outras.
+
+# Nome aceito em --set -> atributo do World
+PARAMS = {
+    "enemy_spawn_rate": "enemy_spawn_rate",
+    "score_threshold": "score_threshold",
+    "SAFE_DISTANCE": "safe_distance",
+    "safe_distance": "safe_distance",
+    "METEOR_SPAWN_RATE": "meteor_spawn_rate",
+    "meteor_spawn_rate": "meteor_spawn_rate",
+    "SHOOTER_CHANCE": "shooter_chance",
+    "shooter_chance": "shooter_chance",
+    "max_enemies": "max_enemies",
+    "spawn_batch": "spawn_batch",
+    "separation": "separation",
+}
+# Taxas (divisor dos timers de spawn) e contagens precisam ser > 0; probabilidades ficam em [0, 1]; o resto >= 0
+POSITIVE = {"enemy_spawn_rate", "meteor_spawn_rate", "max_enemies", "spawn_batch"}
+INTEGERS = {"enemy_spawn_rate", "meteor_spawn_rate", "max_enemies", "spawn_batch"}  # Vão para range() e %
+PROBABILITIES = {"shooter_chance"}
+MAX_TICKS = 10 * 60 * TICK_RATE  # Partida mais longa (10 min de jogo); quem sobrevive até lá para
+
+
+def ship_size():
+    """ Tamanho do sprite da nave (o raio de colisão do jogador sai dele), sem abrir janela """
+    files = SPRITES["ship"][0]
+    return load_image(os.path.join(os.path.dirname(os.path.abspath(__file__)), files[0])).get_size()
+
+
+def simulate(run):
+    """
+    Uma partida, do início ao game over (ou max_ticks). run é um dict simples
+    (vai por pickle para o processo): seed, rules, max_ticks, player_size e
+    bot (nome em BOTS) ou script (bytes de um replay). Retorna o resultado.
+    """
+    world = World(run["seed"], player_size=tuple(run["player_size"]))
+    for name, value in run["rules"].items():
+        setattr(world, name, value)
+    max_ticks = run["max_ticks"]
+    if run.get("script") is not None:
+        script = Replay(run["script"]).inputs()
+        idle = Inputs()
+
+        def bot(world):
+            return next(script, idle)
+    else:
+        bot = BOTS[run["bot"]]
+
+    player = world.player
+    peak_enemies = 0
+    worst = 0.0
+    start = time.perf_counter()
+    while world.frame < max_ticks and not world.game_over:
+        tick_start = time.perf_counter()
+        world.step(bot(world))
+        worst = max(worst, time.perf_counter() - tick_start)
+        peak_enemies = max(peak_enemies, world.enemy_count)
+    elapsed = time.perf_counter() - start
+    ticks = world.frame
+    return {
+        "id": run["id"],
+        "config": run["config"],
+        "seed": run["seed"],
+        "score": player.score,
+        "health": player.health,
+        "died": world.game_over,
+        "ticks": ticks,
+        "survived_s": ticks / TICK_RATE,
+        "tick_ms": elapsed * 1000 / max(ticks, 1),
+        "worst_tick_ms": worst * 1000,
+        "peak_enemies": peak_enemies,
+        "pid": os.getpid(),
+    }
+
+
+def failure(run, error):
+    """ Resultado de uma partida que levantou exceção: o bastante para reproduzi-la """
+    return {
+        "id": run["id"],
+        "config": run["config"],
+        "seed": run["seed"],
+        "rules": run["rules"],
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def grid(values):
+    """ {atributo: [valores]} -> uma combinação de regras por elemento do produto cartesiano """
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(values[name] for name in names))]
+
+
+def plan(configs, seeds, bot="spinning", script=None, mode="normal", max_ticks=MAX_TICKS, player_size=(32, 32),
+         first_seed=1):
+    """ Lista de partidas: cada combinação de regras com as mesmas `seeds` sementes (comparáveis entre si) """
+    runs = []
+    for index, overrides in enumerate(configs):
+        rules = dict(GAME_MODES[mode])
+        rules.update(overrides)
+        for seed in range(first_seed, first_seed + seeds):
+            runs.append({"id": len(runs), "config": index, "seed": seed, "rules": rules, "bot": bot,
+                         "script": script, "max_ticks": max_ticks, "player_size": player_size})
+    return runs
+
+
+def run_batch(runs, workers=None, on_result=None):
+    """
+    Roda as partidas em paralelo (workers processos; None = um por núcleo,
+    1 = no próprio processo) e chama on_result(resultado) na ordem em que
+    terminam. Retorna os resultados na ordem de runs; uma partida que falhou
+    tem o resultado de failure() no lugar.
+    """
+    results = [None] * len(runs)
+
+    def collect(result):
+        results[result["id"]] = result
+        if on_result is not None:
+            on_result(result)
+
+    if workers == 1:
+        for run in runs:
+            try:
+                result = simulate(run)
+            except Exception as error:
+                result = failure(run, error)
+            collect(result)
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Uma tarefa por partida: o pickle de um dict é nada perto de milhares de ticks
+        futures = {pool.submit(simulate, run): run for run in runs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                result = failure(futures[future], error)
+            collect(result)
+    return results
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def aggregate(configs, results):
+    """ Resumo por combinação de regras: pontuação, sobrevivência, mortes e custo por tick """
+    report = []
+    for index, rules in enumerate(configs):
+        group = [result for result in results
+                 if result is not None and "error" not in result and result["config"] == index]
+        if not group:
+            continue
+        scores = [result["score"] for result in group]
+        survived = [result["survived_s"] for result in group]
+        costs = [result["tick_ms"] for result in group]
+        report.append({
+            "config": index,
+            "rules": rules,
+            "runs": len(group),
+            "score_mean": statistics.fmean(scores),
+            "score_p50": _percentile(scores, 0.5),
+            "score_min": min(scores),
+            "score_max": max(scores),
+            "survived_mean_s": statistics.fmean(survived),
+            "survived_p50_s": _percentile(survived, 0.5),
+            "death_rate": sum(result["died"] for result in group) / len(group),
+            "tick_ms_mean": statistics.fmean(costs),
+            "tick_ms_p90": _percentile(costs, 0.9),
+            "worst_tick_ms": max(result["worst_tick_ms"] for result in group),
+            "peak_enemies": max(result["peak_enemies"] for result in group),
+        })
+    return report
+
+
+def format_report(report):
+    lines = [f"{'#':>3}  {'regras':<44} {'n':>4} {'pontos (mín-máx)':>20} {'sobrevive (s)':>14} {'mortes':>7}"
+             f" {'ms/tick':>8} {'pior ms':>8}"]
+    for row in report:
+        rules = " ".join(f"{name}={value}" for name, value in row["rules"].items()) or "padrão"
+        lines.append(f"{row['config']:>3}  {rules:<44.44} {row['runs']:>4}"
+                     f" {row['score_mean']:>7.1f} ({row['score_min']:>4}-{row['score_max']:<5})"
+                     f" {row['survived_mean_s']:>7.1f} ({row['survived_p50_s']:>4.0f})"
+                     f" {row['death_rate']:>7.0%} {row['tick_ms_mean']:>8.3f} {row['worst_tick_ms']:>8.2f}")
+    return "\n".join(lines)
+
+
+def _parse_set(text):
+    """ "nome=v1,v2,..." -> (atributo do World, [valores]) """
+    name, _, values = text.partition("=")
+    if name not in PARAMS or not values:
+        raise argparse.ArgumentTypeError(f"use nome=v1,v2 com nome em {', '.join(PARAMS)}")
+    parsed = []
+    for value in values.split(","):
+        try:
+            parsed.append(int(value))
+        except ValueError:
+            try:
+                parsed.append(float(value))
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"valor inválido para {name}: {value}") from None
+        _check_value(name, PARAMS[name], parsed[-1])
+    return PARAMS[name], parsed
+
+
+def _check_value(name, attribute, value):
+    if attribute in INTEGERS and not isinstance(value, int):
+        raise argparse.ArgumentTypeError(f"{name} precisa ser inteiro: {value}")
+    if attribute in POSITIVE:
+        ok, rule = value > 0, "ser maior que 0"
+    elif attribute in PROBABILITIES:
+        ok, rule = 0 <= value <= 1, "estar entre 0 e 1"
+    else:
+        ok, rule = value >= 0, "ser maior ou igual a 0"
+    if not ok:
+        raise argparse.ArgumentTypeError(f"{name} precisa {rule}: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roda partidas sem janela em paralelo e resume os resultados")
+    parser.add_argument("--set", dest="params", action="append", type=_parse_set, default=[], metavar="NOME=V1,V2",
+                        help=f"valores de uma regra (produto cartesiano entre vários --set): {', '.join(PARAMS)}")
+    parser.add_argument("--seeds", type=int, default=8, help="partidas por combinação de regras (sementes 1..N)")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="spinning")
+    parser.add_argument("--script", help="replay (.sjr) cuja entrada é repetida em vez do bot")
+    parser.add_argument("--mode", choices=sorted(GAME_MODES), default="normal")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: um por núcleo; 1 = sem pool)")
+    parser.add_argument("--runs", help="arquivo JSON Lines com cada partida, escrito conforme terminam")
+    parser.add_argument("--out", help="JSON com o relatório agregado e todas as partidas")
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script, "rb") as f:
+            script = f.read()
+    configs = grid(dict(args.params))
+    runs = plan(configs, args.seeds, args.bot, script, args.mode, args.max_ticks, ship_size())
+    workers = args.workers or os.cpu_count()
+    print(f"🧪 {len(runs)} partidas ({len(configs)} combinações x {args.seeds} sementes) em {workers} processo(s)"
+          f" | {'replay ' + args.script if script else 'bot ' + args.bot} | modo {args.mode}")
+
+    stream = open(args.runs, "w") if args.runs else None
+    done = 0
+    start = time.perf_counter()
+
+    def on_result(result):
+        nonlocal done
+        done += 1
+        if stream is not None:
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+        if "error" in result:
+            rules = " ".join(f"{name}={value}" for name, value in result["rules"].items()) or "padrão"
+            print(f"  [{done:>{len(str(len(runs)))}}/{len(runs)}] ❌ combinação {result['config']} semente"
+                  f" {result['seed']} ({rules}): {result['error']}")
+            return
+        print(f"  [{done:>{len(str(len(runs)))}}/{len(runs)}] combinação {result['config']} semente {result['seed']}:"
+              f" {result['score']} pontos, {result['survived_s']:.0f} s{' (morreu)' if result['died'] else ''},"
+              f" {result['tick_ms']:.3f} ms/tick")
+
+    try:
+        results = run_batch(runs, workers, on_result)
+    finally:
+        if stream is not None:
+            stream.close()
+    elapsed = time.perf_counter() - start
+    failed = [result for result in results if "error" in result]
+    ticks = sum(result["ticks"] for result in results if "error" not in result)
+    print(f"\n✅ {len(results) - len(failed)} partidas, {ticks} ticks em {elapsed:.1f}s"
+          f" ({ticks / elapsed:.0f} ticks/s no total)")
+    if failed:
+        print(f"❌ {len(failed)} partida(s) falharam (veja acima as regras e a semente de cada uma)")
+    print()
+    report = aggregate(configs, results)
+    print(format_report(report))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"workers": workers, "seeds": args.seeds, "bot": args.bot, "script": args.script,
+                       "mode": args.mode, "max_ticks": args.max_ticks, "elapsed_s": elapsed,
+                       "configs": report, "runs": results}, f, indent=2)
+        print(f"💾 Relatório salvo em {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import numpy as np
+
+# =================== Sistemas =================== #
+# Funções que rodam sobre as colunas de um arquétipo (veja ecs.py): cada uma
+# recebe os arquétipos que têm os componentes de que precisa e atualiza todas
+# as linhas de uma vez, sem objeto por entidade. Nenhuma sabe de tipos de
+# entidade; quem decide o que acontece com quem é World.step.
+#
+# Os sistemas de todo tick rodam sobre a capacidade inteira das colunas (as
+# linhas depois de count têm lixo e alive False, e o resultado é filtrado por
+# alive) e mandam os temporários (distâncias, máscaras) para os arrays de
+# trabalho do arquétipo (Archetype.scratch) pelo out= dos ufuncs: em regime um
+# tick não aloca arrays nem views proporcionais às entidades. Os testes de
+# colisão recebem só as linhas candidatas da grade de colisão (collision.py).
+
+SEPARATION_CELL = 64  # Lado das células da separação (~ diâmetro de um inimigo)
+_CELL_ROWS = 1 << 20  # Chave da célula = cx * _CELL_ROWS + cy
+_NONE = np.zeros(0, dtype=np.intp)  # Lista vazia de índices, reaproveitada
+# Escalares como arrays 0-d: com int/float do Python o NumPy converte (e aloca) o operando a cada chamada
+_ZERO = np.array(0, dtype=np.int32)
+_ONE = np.array(1, dtype=np.int32)
+
+
+def remember(archetype):
+    """ position: guarda a posição atual como a do tick anterior """
+    columns = archetype.columns
+    np.copyto(columns["px"], columns["x"])
+    np.copyto(columns["py"], columns["y"])
+
+
+def chase(archetype, target_x, target_y):
+    """ chase: anda speed px em linha reta até o alvo (normalização por divisão, sem atan2) """
+    columns = archetype.columns
+    x = columns["x"]
+    y = columns["y"]
+    dx = archetype.scratch("dx")
+    dy = archetype.scratch("dy")
+    dist = archetype.scratch("dist")
+    np.subtract(target_x, x, out=dx)
+    np.subtract(target_y, y, out=dy)
+    np.hypot(dx, dy, out=dist)
+    # Sobre o alvo anda para +x, como atan2(0, 0) = 0
+    if np.count_nonzero(dist) != len(dist):
+        here = dist == 0
+        dist[here] = 1.0
+        dx[here] = 1.0
+    step = np.divide(columns["speed"], dist, out=dist)
+    dx *= step
+    dy *= step
+    x += dx
+    y += dy
+
+
+def move(archetype):
+    """ velocity: x += vx, y += vy """
+    columns = archetype.columns
+    x = columns["x"]
+    y = columns["y"]
+    x += columns["vx"]
+    y += columns["vy"]
+
+
+def spin(archetype):
+    """ spin: gira rate graus """
+    columns = archetype.columns
+    angle = columns["angle"]
+    np.copyto(columns["prev_angle"], angle)
+    angle += columns["rate"]
+
+
+def separate(archetypes, strength):
+    """
+    Empurra cada entidade para longe do centro das outras da mesma célula
+    (todas as dos arquétipos dadas juntas), até strength px por tick: um
+    enxame se espalha em vez de virar uma pilha de sprites no mesmo ponto.
+    """
+    groups = [archetype for archetype in archetypes if archetype.count]
+    if not groups or sum(archetype.count for archetype in groups) < 2:
+        return
+    if len(groups) == 1:
+        x, y = groups[0]["x"], groups[0]["y"]
+    else:
+        x = np.concatenate([archetype["x"] for archetype in groups])
+        y = np.concatenate([archetype["y"] for archetype in groups])
+    if not _separate(x, y, strength) or len(groups) == 1:
+        return
+    start = 0
+    for archetype in groups:
+        end = start + archetype.count
+        archetype["x"][:] = x[start:end]
+        archetype["y"][:] = y[start:end]
+        start = end
+
+
+def _separate(x, y, strength):
+    # Centro de cada célula ocupada (bincount sobre a chave da célula)
+    cx = np.floor(x / SEPARATION_CELL).astype(np.int64)
+    cy = np.floor(y / SEPARATION_CELL).astype(np.int64)
+    cells, inverse, counts = np.unique(cx * _CELL_ROWS + cy, return_inverse=True, return_counts=True)
+    crowd = counts[inverse]
+    crowded = crowd > 1
+    if not crowded.any():
+        return False
+    mean_x = np.bincount(inverse, weights=x, minlength=len(cells))[inverse] / crowd
+    mean_y = np.bincount(inverse, weights=y, minlength=len(cells))[inverse] / crowd
+    awayx = (x - mean_x)[crowded]
+    awayy = (y - mean_y)[crowded]
+    dist = np.hypot(awayx, awayy)
+    # Em cima do centro: direção fixa pela posição na lista (ângulo áureo), para quem nasceu no mesmo ponto se separar
+    stacked = dist < 1e-6
+    if stacked.any():
+        angles = np.flatnonzero(crowded)[stacked] * 2.399963229728653
+        awayx[stacked] = np.cos(angles)
+        awayy[stacked] = np.sin(angles)
+        dist[stacked] = 1.0
+    # Mais vizinhos na célula, empurrão mais forte (até strength)
+    push = strength * (1.0 - 1.0 / crowd[crowded]) / dist
+    x[crowded] += awayx * push
+    y[crowded] += awayy * push
+    return True
+
+
+def animate(archetype):
+    """ animation: avança o quadro do sprite a cada delay ticks """
+    columns = archetype.columns
+    timer = columns["timer"]
+    timer += _ONE
+    wrap = np.greater_equal(timer, columns["delay"], out=archetype.scratch("wrap", bool))
+    wrap &= archetype.alive
+    if np.count_nonzero(wrap):
+        timer[wrap] = 0
+        frame = columns["frame"]
+        frame[wrap] = (frame[wrap] + 1) % columns["frames"][wrap]
+
+
+def reload(archetype):
+    """ shooter: quem está com a recarga zerada dispara (e recarrega); retorna essas linhas """
+    columns = archetype.columns
+    cooldown = columns["cooldown"]
+    # Todos descontam um tick; quem ficou negativo estava zerado e dispara (e recarrega)
+    cooldown -= _ONE
+    fire = np.less(cooldown, _ZERO, out=archetype.scratch("fire", bool))
+    fire &= archetype.alive  # Mortos neste tick saem no compact; não precisam recarregar
+    if not np.count_nonzero(fire):
+        return _NONE
+    fired = np.flatnonzero(fire)
+    cooldown[fired] = columns["reload"][fired]
+    return fired
+
+
+def aim(archetype, row, target_x, target_y):
+    """ Velocidade (dx, dy) de um tiro da linha row em direção ao alvo """
+    columns = archetype.columns
+    speed = float(columns["bullet_speed"][row])
+    dx = target_x - float(columns["x"][row])
+    dy = target_y - float(columns["y"][row])
+    dist = (dx * dx + dy * dy) ** 0.5
+    if not dist:
+        return speed, 0.0
+    return speed * dx / dist, speed * dy / dist
+
+
+def expire(archetype):
+    """ lifetime: conta um tick; retorna as linhas vivas que chegaram a zero """
+    ttl = archetype.columns["ttl"]
+    ttl -= _ONE
+    done = np.less_equal(ttl, _ZERO, out=archetype.scratch("done", bool))
+    done &= archetype.alive
+    return np.flatnonzero(done) if np.count_nonzero(done) else _NONE
+
+
+def outside(archetype, width, height):
+    """ cull: linhas vivas fora de (0, 0, width, height) por mais que a margem """
+    columns = archetype.columns
+    x = columns["x"]
+    y = columns["y"]
+    low = archetype.scratch("dx")
+    high = archetype.scratch("dy")
+    out = archetype.scratch("out", bool)
+    tmp = archetype.scratch("tmp", bool)
+    # copyto converte int -> float sem o iterador com buffer que um ufunc com out= de outro dtype alocaria
+    np.copyto(low, columns["margin"])
+    np.negative(low, out=low)
+    np.less(x, low, out=out)
+    np.less(y, low, out=tmp)
+    out |= tmp
+    np.subtract(width, low, out=high)
+    np.greater(x, high, out=tmp)
+    out |= tmp
+    np.subtract(height, low, out=high)
+    np.greater(y, high, out=tmp)
+    out |= tmp
+    out &= archetype.alive
+    return np.flatnonzero(out) if np.count_nonzero(out) else _NONE
+
+
+def hits_circle(archetype, rows, cx, cy, radius):
+    """ collider: linhas vivas entre rows (candidatas da grade de colisão) cujo círculo toca o círculo (cx, cy, radius) """
+    columns = archetype.columns
+    dist = np.hypot(columns["x"][rows] - cx, columns["y"][rows] - cy)
+    hit = dist < columns["radius"][rows] + radius
+    hit &= archetype.alive[rows]
+    return rows[hit]
+
+
+def reach(archetype):
+    """
+    target: alcance de um tiro em cada linha (radius + pad), num array de
+    trabalho com capacity linhas; linhas mortas (e as depois de count) ficam
+    com alcance 0 e nenhum tiro as atinge.
+    """
+    columns = archetype.columns
+    reach = archetype.scratch("reach")
+    pad = archetype.scratch("pad")
+    np.copyto(reach, columns["radius"])
+    np.copyto(pad, columns["pad"])
+    reach += pad
+    np.putmask(reach, np.logical_not(archetype.alive, out=archetype.scratch("dead", bool)), _ZERO)
+    return reach
@@ -0,0 +1,615 @@
+import math
+import random
+import time
+
+import numpy as np
+import pygame
+
+import systems
+from collision import SpatialHash
+from ecs import EntityStore
+from projectiles import ProjectilePool, OWNER_PLAYER
+
+# =================== Simulação (sem renderização) =================== #
+# Toda a lógica do jogo vive aqui: jogador, inimigos, meteoros, explosões e
+# temporizadores de spawn. Nada neste módulo abre janela, toca som ou desenha
+# na tela, então o mundo pode avançar sem display e mais rápido que 60 FPS.
+
+WIDTH, HEIGHT = 800, 600  # Tamanho fixo
+
+enemy_spawn_rate = 150
+score_threshold = 50  # Pontuação necessária para spawnar inimigos atiradores
+max_enemies = 5  # Limite de inimigos na tela
+spawn_batch = 1  # Inimigos criados a cada enemy_spawn_rate ticks
+ENEMY_RADIUS = 30  # Raio de colisão (o sprite é desenhado com o dobro: 60x60); menor que SEPARATION_CELL
+enemy_radius = ENEMY_RADIUS  # Raio dos inimigos novos (o sprite acompanha)
+separation = 0.0  # Força da separação entre inimigos (px/tick; 0 = podem se sobrepor)
+SHOOTER_CHANCE = 0.1  # Chance de um inimigo novo ser atirador
+SAFE_DISTANCE = 180
+METEOR_SPAWN_RATE = 400  # controlar a frequência
+METEOR_VARIANTS = 3  # Quantidade de imagens diferentes de meteoro
+BULLET_RADIUS = 5
+GRID_CELL = 64  # Lado das células da grade de colisão (~ diâmetro de um inimigo)
+ENEMY_SHOTS = "enemy_shots"  # Camada da grade com os tiros dos inimigos (as outras são os arquétipos)
+TICK_RATE = 60  # Ticks da simulação por segundo (o jogo original dava um tick por quadro a 60 FPS)
+EXPLOSION_COLORS = ((255, 165, 0), (255, 69, 0), (255, 0, 0))  # Cores da explosão (compartilhadas)
+EXPLOSION_FRAMES = 15  # Ticks de vida de uma explosão
+
+# Modo horda: milhares de inimigos perseguindo a nave, espalhados pela separação
+HORDE_RULES = {
+    "max_enemies": 3000,
+    "enemy_spawn_rate": 1,
+    "spawn_batch": 10,
+    "separation": 1.5,
+    "enemy_radius": 14,  # Inimigos menores: 3000 sprites de 60x60 cobririam a tela 20 vezes
+}
+GAME_MODES = {"normal": {}, "horde": HORDE_RULES}  # Atributos do World sobrescritos em cada modo
+
+# Tipos de entidade: componentes (ecs.py) e valores iniciais. Um inimigo novo
+# é uma entrada aqui; os sistemas de World.step valem para qualquer tipo com
+# os componentes certos. O jogador não entra: é um só, movido pelos controles.
+ENTITY_TYPES = {
+    "enemy": {
+        "position": {},
+        "chase": {"speed": 1},
+        "collider": {"radius": ENEMY_RADIUS},
+        "health": {"hp": 1},
+        "target": {},
+        "sprite": {"sheet": "enemy"},
+        "animation": {"frames": 2, "delay": 10},
+        "contact": {"damage": 1},
+        "bounty": {"points": 5},
+    },
+    "shooter": {
+        "position": {},
+        "chase": {"speed": 1},
+        "collider": {"radius": ENEMY_RADIUS},
+        "health": {"hp": 2},  # Atiradores são mais resistentes
+        "target": {},
+        "sprite": {"sheet": "shooter"},
+        "animation": {"frames": 2, "delay": 10},
+        "contact": {"damage": 1},
+        "bounty": {"points": 5},
+        "shooter": {"cooldown": 0, "reload": 150, "bullet_speed": 4},  # Dispara já no primeiro tick
+    },
+    "meteor": {
+        "position": {},
+        "velocity": {},
+        "spin": {},
+        "collider": {"radius": 20},  # Metade do sprite de 40x40
+        "health": {"hp": 1},
+        "target": {"pad": BULLET_RADIUS},
+        "sprite": {"sheet": "meteor"},
+        "contact": {"damage": 2},
+        "bounty": {"points": 5},
+        "cull": {"margin": 100},
+        "ram": {},
+    },
+    "explosion": {
+        "position": {},
+        "lifetime": {"ttl": EXPLOSION_FRAMES},
+        "blast": {},
+    },
+}
+
+# O jogador usa __slots__ (sem __dict__) e guarda a posição do tick anterior
+# (prev_x, prev_y) para o renderizador interpolar entre os dois ticks. As
+# outras entidades não são objetos: são linhas dos arquétipos de World.entities.
+
+
+# Teclas que a simulação lê: as seguradas (get_pressed) e as de evento (KEYDOWN)
+INPUT_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_UP, pygame.K_w,
+              pygame.K_DOWN, pygame.K_s)
+EVENT_KEYS = (pygame.K_SPACE,)
+
+
+class Inputs:
+    """ Estado dos controles em um tick da simulação """
+
+    __slots__ = ("left", "right", "up", "down", "shoot")
+
+    def __init__(self, left=False, right=False, up=False, down=False, shoot=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.shoot = shoot
+
+    @classmethod
+    def from_keys(cls, keys, shoot=False):
+        """ Converte o retorno de pygame.key.get_pressed() em Inputs """
+        return cls(
+            left=bool(keys[pygame.K_LEFT] or keys[pygame.K_a]),
+            right=bool(keys[pygame.K_RIGHT] or keys[pygame.K_d]),
+            up=bool(keys[pygame.K_UP] or keys[pygame.K_w]),
+            down=bool(keys[pygame.K_DOWN] or keys[pygame.K_s]),
+            shoot=shoot,
+        )
+
+
+class Player:
+    __slots__ = ("x", "y", "angle", "acceleration", "friction", "velocity_x", "velocity_y",
+                 "rotation_speed", "drift_factor", "width", "height", "health", "score",
+                 "prev_x", "prev_y", "prev_angle")
+
+    def __init__(self, x, y, width=32, height=32):
+        self.spawn(x, y, width, height)
+
+    def spawn(self, x, y, width=32, height=32):
+        self.x = x
+        self.y = y
+        self.angle = 0
+        self.acceleration = 0.3
+        self.friction = 0.05
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.rotation_speed = 3
+        self.drift_factor = 0.95
+        self.width, self.height = width, height
+        self.health = 5
+        self.score = 0
+        self.prev_x, self.prev_y, self.prev_angle = x, y, 0
+
+    def update(self, inputs, world):
+        """ Aplica os controles e retorna True se a nave estiver acelerando """
+        self.prev_x, self.prev_y, self.prev_angle = self.x, self.y, self.angle
+        moving = False
+        if inputs.left:
+            self.angle += self.rotation_speed
+        if inputs.right:
+            self.angle -= self.rotation_speed
+        if inputs.up:
+            self.velocity_x += self.acceleration * math.cos(math.radians(self.angle))
+            self.velocity_y -= self.acceleration * math.sin(math.radians(self.angle))
+            moving = True
+        elif inputs.down:
+            self.velocity_x -= (self.acceleration / 2) * math.cos(math.radians(self.angle))
+            self.velocity_y += (self.acceleration / 2) * math.sin(math.radians(self.angle))
+            moving = True
+
+        # Aplica o drift
+        self.velocity_x *= self.drift_factor
+        self.velocity_y *= self.drift_factor
+
+        # Calcula a nova posição
+        new_x = self.x + self.velocity_x
+        new_y = self.y + self.velocity_y
+
+        # Define as margens
+        MARGIN_LEFT = 50
+        MARGIN_RIGHT = WIDTH - 50
+        MARGIN_TOP = 50
+        MARGIN_BOTTOM = HEIGHT - 50
+
+        # Movimento horizontal: fora das margens quem anda é o fundo
+        if new_x < MARGIN_LEFT or new_x > MARGIN_RIGHT:
+            world.total_offset_x += self.velocity_x
+        else:
+            self.x = new_x
+
+        # Movimento vertical
+        if new_y < MARGIN_TOP or new_y > MARGIN_BOTTOM:
+            world.total_offset_y += self.velocity_y
+        else:
+            self.y = new_y
+
+        return moving
+
+    def shoot(self, projectiles):
+        bullet_speed = 7
+        bullet_dx = bullet_speed * math.cos(math.radians(self.angle))
+        bullet_dy = -bullet_speed * math.sin(math.radians(self.angle))
+        projectiles.spawn(self.x, self.y, bullet_dx, bullet_dy, OWNER_PLAYER)
+
+
+# =================== Mundo =================== #
+class World:
+    """
+    Dono de todo o estado de uma partida.
+    Cada chamada de step(inputs) avança exatamente um tick (1/60 s no jogo
+    original); renderização e som ficam a cargo de quem chama, que pode ler
+    `sounds` para saber quais efeitos tocar após o tick.
+    """
+
+    def __init__(self, seed=None, player_size=(32, 32), entity_types=ENTITY_TYPES):
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.player_size = player_size
+
+        # Parâmetros de balanceamento (copiados dos padrões do módulo)
+        self.enemy_spawn_rate = enemy_spawn_rate
+        self.score_threshold = score_threshold
+        self.max_enemies = max_enemies
+        self.spawn_batch = spawn_batch
+        self.enemy_radius = enemy_radius
+        self.separation = separation
+        self.shooter_chance = SHOOTER_CHANCE
+        self.safe_distance = SAFE_DISTANCE
+        self.meteor_spawn_rate = METEOR_SPAWN_RATE
+
+        self.projectiles = ProjectilePool()
+        # Inimigos, atiradores, meteoros e explosões (veja ecs.py e ENTITY_TYPES)
+        self.entities = EntityStore(entity_types)
+        self.grid = SpatialHash(GRID_CELL)  # Broad-phase de todas as colisões, refeita a cada tick
+        self.player = None
+        self.sounds = []
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """ Volta o mundo ao estado inicial de uma partida; com seed, reinicia também o gerador """
+        if seed is not None:
+            self.seed = seed
+            self.random.seed(seed)
+        if self.player is None:
+            self.player = Player(WIDTH // 2, HEIGHT // 2, *self.player_size)
+        else:
+            self.player.spawn(WIDTH // 2, HEIGHT // 2, *self.player_size)
+        self.entities.clear()
+        self.spawn_timer = 0
+        self.meteor_spawn_timer = 0
+        self.total_offset_x = 0
+        self.total_offset_y = 0
+        self.prev_offset_x = 0  # Deslocamento do fundo no tick anterior (interpolação)
+        self.prev_offset_y = 0
+        self.frame = 0
+        self.sounds.clear()
+        self._next_owner_id = OWNER_PLAYER + 1
+        self.projectiles.clear()
+
+    @property
+    def game_over(self):
+        return self.player.health <= 0
+
+    # Populações (contam também quem morreu neste tick, até o compact)
+    @property
+    def enemy_count(self):
+        return self.entities.count("chase")
+
+    @property
+    def meteor_count(self):
+        return self.entities.count("ram")
+
+    @property
+    def explosion_count(self):
+        return self.entities.count("blast")
+
+    def step(self, inputs):
+        """ Avança a simulação em um tick """
+        self.sounds.clear()
+        # Cada fase é um método (o profiler de quadros cronometra cada um)
+        self._update_player(inputs)
+        self._spawn_enemies()
+        self._spawn_meteors()
+        self._update_motion()
+        self._update_weapons()
+        self._update_grid()
+        self._update_collisions()
+        self._update_timers()
+        self._update_bullets()
+
+        # Tira os mortos do tick dos arquétipos (mantendo a ordem dos vivos)
+        self.entities.compact()
+
+        self.frame += 1
+
+    def _update_player(self, inputs):
+        player = self.player
+        self.prev_offset_x = self.total_offset_x
+        self.prev_offset_y = self.total_offset_y
+        if inputs.shoot:
+            player.shoot(self.projectiles)
+            self.sounds.append("shoot")
+
+        # Atualiza o jogador
+        if player.update(inputs, self):
+            self.sounds.append("engine")
+
+        # Atualiza o deslocamento do plano de fundo
+        self.total_offset_x += player.velocity_x
+        self.total_offset_y += player.velocity_y
+
+    # =================== Entidades =================== #
+    def spawn(self, kind, x, y, **values):
+        """ Entidade do tipo kind (ENTITY_TYPES) parada em (x, y); retorna (arquétipo, linha) """
+        return self.entities.spawn(kind, x=x, y=y, px=x, py=y, **values)
+
+    def kill(self, archetype, row):
+        """
+        Tira a entidade do jogo (sai do arquétipo no fim do tick); os tiros de
+        um atirador somem junto com ele. Retorna False se ela já estava morta.
+        """
+        if not archetype.alive[row]:
+            return False
+        archetype.kill(row)
+        if "shooter" in archetype.components:
+            self.projectiles.kill_owner(int(archetype.columns["owner"][row]))
+        return True
+
+    def explode(self, x, y):
+        """ Cria uma explosão em (x, y) """
+        return self.spawn("explosion", float(x), float(y))
+
+    def _spawn_enemies(self):
+        rng = self.random
+        player = self.player
+        if self.spawn_timer % self.enemy_spawn_rate == 0:
+            for _ in range(min(self.spawn_batch, self.max_enemies - self.enemy_count)):
+                enemy_x, enemy_y = self.safe_spawn_point()
+
+                # Spawn de inimigos que atiram aleatoriamente após o jogador atingir a pontuação mínima
+                shooter = player.score >= self.score_threshold and rng.random() < self.shooter_chance
+                self.spawn_enemy(enemy_x, enemy_y, shooter)
+
+        self.spawn_timer += 1
+
+    def safe_spawn_point(self):
+        """ Posição aleatória na tela a mais de safe_distance do jogador """
+        rng = self.random
+        player = self.player
+        while True:
+            x = rng.randint(0, WIDTH)
+            y = rng.randint(0, HEIGHT)
+            if math.hypot(player.x - x, player.y - y) > self.safe_distance:
+                return x, y
+
+    def spawn_enemy(self, x, y, shooter=False):
+        """ Coloca um inimigo (ou atirador) em (x, y), fora das regras de spawn; retorna (arquétipo, linha) """
+        if shooter:
+            owner = self._next_owner_id
+            self._next_owner_id += 1
+            return self.spawn("shooter", x, y, radius=self.enemy_radius, owner=owner)
+        return self.spawn("enemy", x, y, radius=self.enemy_radius)
+
+    def _spawn_meteors(self):
+        self.meteor_spawn_timer += 1
+        if self.meteor_spawn_timer < self.meteor_spawn_rate:
+            return
+        self.meteor_spawn_timer = 0
+        self.spawn_meteor()
+
+    def spawn_meteor(self, speed=None):
+        """ Meteoro entrando por um lado aleatório da tela (speed: px/tick, sorteada se None); retorna (arquétipo, linha) """
+        rng = self.random
+
+        # Escolhe um lado aleatório da tela para spawnar
+        side = rng.choice(['top', 'right', 'bottom', 'left'])
+
+        if side == 'top':
+            x = rng.randint(0, WIDTH)
+            y = -50
+            dir_y = rng.uniform(0.5, 1)
+            dir_x = rng.uniform(-0.5, 0.5)
+        elif side == 'right':
+            x = WIDTH + 50
+            y = rng.randint(0, HEIGHT)
+            dir_x = rng.uniform(-1, -0.5)
+            dir_y = rng.uniform(-0.5, 0.5)
+        elif side == 'bottom':
+            x = rng.randint(0, WIDTH)
+            y = HEIGHT + 50
+            dir_y = rng.uniform(-1, -0.5)
+            dir_x = rng.uniform(-0.5, 0.5)
+        else:  # left
+            x = -50
+            y = rng.randint(0, HEIGHT)
+            dir_x = rng.uniform(0.5, 1)
+            dir_y = rng.uniform(-0.5, 0.5)
+
+        # Normaliza o vetor direção
+        length = math.sqrt(dir_x**2 + dir_y**2)
+        dir_x /= length
+        dir_y /= length
+
+        angle = rng.randint(0, 360)
+        rate = rng.uniform(-2, 2)
+        variant = rng.randrange(METEOR_VARIANTS)  # Qual imagem de meteoro usar
+        if speed is None:
+            speed = rng.uniform(1, 10)
+        return self.spawn("meteor", x, y, vx=dir_x * speed, vy=dir_y * speed,
+                          angle=angle, prev_angle=angle, rate=rate, frame=variant)
+
+    # =================== Sistemas =================== #
+    def _update_motion(self):
+        player = self.player
+        entities = self.entities
+        for archetype in entities.query("position"):
+            if archetype.count:
+                systems.remember(archetype)
+        chasers = entities.query("position", "chase")
+        for archetype in chasers:
+            if archetype.count:
+                systems.chase(archetype, player.x, player.y)
+        if self.separation:
+            systems.separate(chasers, self.separation)
+        for archetype in entities.query("position", "velocity"):
+            if archetype.count:
+                systems.move(archetype)
+        for archetype in entities.query("spin"):
+            if archetype.count:
+                systems.spin(archetype)
+
+    def _update_weapons(self):
+        player = self.player
+        pool = self.projectiles
+        # Atiradores com a recarga zerada disparam na direção do jogador
+        for archetype in self.entities.query("position", "shooter"):
+            if not archetype.count:
+                continue
+            columns = archetype.columns
+            for row in systems.reload(archetype).tolist():
+                dx, dy = systems.aim(archetype, row, player.x, player.y)
+                pool.spawn(float(columns["x"][row]), float(columns["y"][row]), dx, dy, int(columns["owner"][row]))
+
+        # Move todos os projéteis de uma vez
+        pool.move()
+
+    def _update_grid(self):
+        """ Refaz a grade de colisão com as posições do tick: entidades com collider e tiros dos inimigos """
+        # Todas as linhas até count entram (quem consulta filtra os mortos por alive)
+        grid = self.grid
+        grid.clear()
+        for archetype in self.entities.query("position", "collider"):
+            n = archetype.count
+            if not n:
+                continue
+            columns = archetype.columns
+            radius = int(columns["radius"][:n].max())
+            if "target" in archetype.components:
+                radius += int(columns["pad"][:n].max())  # Alcance dos tiros do jogador
+            grid.insert(archetype, columns["x"][:n], columns["y"][:n], radius)
+        pool = self.projectiles
+        if pool.count:
+            shots = pool.active(player=False)
+            grid.insert(ENEMY_SHOTS, pool.x[shots], pool.y[shots], 0, rows=shots)
+
+    def _update_collisions(self):
+        player = self.player
+        entities = self.entities
+        grid = self.grid
+
+        # Tiros dos inimigos atiradores que atingiram o jogador
+        pool = self.projectiles
+        radius = player.width // 2
+        near = grid.near(ENEMY_SHOTS, player.x, player.y, radius)
+        if len(near):
+            near.sort()
+            hits = pool.hits_circle(near, player.x, player.y, radius)
+            if len(hits):
+                player.health -= len(hits)
+                pool.kill(hits)
+
+        # Quem encosta no jogador causa dano e explode
+        radius = player.width // 3
+        for archetype in entities.query("position", "collider", "contact"):
+            if not archetype.count:
+                continue
+            near = grid.near(archetype, player.x, player.y, radius)
+            if not len(near):
+                continue
+            near.sort()
+            columns = archetype.columns
+            for row in systems.hits_circle(archetype, near, player.x, player.y, radius).tolist():
+                player.health -= int(columns["damage"][row])
+                self.kill(archetype, row)
+                self.explode(columns["x"][row], columns["y"][row])
+
+        # Meteoros destroem o primeiro inimigo em que encostam (e somem junto)
+        if self.enemy_count:
+            prey = entities.query("position", "collider", "chase")
+            for archetype in entities.query("position", "collider", "ram"):
+                if archetype.count:
+                    self._ram(archetype, prey)
+
+        # Remove quem saiu da tela
+        for archetype in entities.query("position", "cull"):
+            if archetype.count:
+                for row in systems.outside(archetype, WIDTH, HEIGHT).tolist():
+                    self.kill(archetype, row)
+
+    def _ram(self, archetype, prey):
+        """ Cada meteoro vivo de archetype destrói o primeiro perseguidor de prey que tocar (na ordem de prey e das linhas) """
+        columns = archetype.columns
+        n = archetype.count
+        alive = archetype.alive
+        xs, ys, radii = columns["x"][:n], columns["y"][:n], columns["radius"][:n]
+        reach = int(radii.max())
+        # Toques possíveis de todos os meteoros vivos de uma vez, por presa: (meteoro, linha) ordenados
+        touches = []
+        for other in prey:
+            points, targets = self.grid.query(other, xs, ys, reach)
+            if len(points):
+                near = other.columns
+                dist = np.hypot(near["x"][targets] - xs[points], near["y"][targets] - ys[points])
+                touch = dist < near["radius"][targets] + radii[points]
+                touch &= alive[points]
+                points, targets = points[touch], targets[touch]
+                order = np.lexsort((targets, points))
+                points, targets = points[order], targets[order]
+            touches.append((other, points.tolist(), targets.tolist()))
+        if not any(points for _, points, _ in touches):
+            return
+        # Em ordem, porque cada meteoro tira da disputa a presa que destruiu
+        for row in sorted({point for _, points, _ in touches for point in points}):
+            for other, points, targets in touches:
+                target = next((target for p, target in zip(points, targets) if p == row and other.alive[target]), None)
+                if target is not None:
+                    x, y = float(xs[row]), float(ys[row])
+                    self.kill(other, target)
+                    self.kill(archetype, row)
+                    self.explode(x, y)
+                    break
+
+    def _update_timers(self):
+        entities = self.entities
+        for archetype in entities.query("sprite", "animation"):
+            if archetype.count:
+                systems.animate(archetype)
+        for archetype in entities.query("lifetime"):
+            if archetype.count:
+                for row in systems.expire(archetype).tolist():
+                    self.kill(archetype, row)
+
+    def _update_bullets(self):
+        # Colisões dos tiros do jogador (já movidos no tick) e remoção dos que saíram da tela
+        pool = self.projectiles
+        bullets = pool.active(player=True) if pool.count else ()
+        for archetype in self.entities.query("position", "collider", "health", "target"):
+            if not len(bullets):
+                break
+            if not archetype.count:
+                continue
+            # Candidatos da grade nas células ao redor dos tiros; o teste exato é vetorizado sobre os pares
+            points, rows = self.grid.query(archetype, pool.x[bullets], pool.y[bullets])
+            if not len(points):
+                continue
+            # Destruídos antes neste tick têm alcance 0 e ficam de fora
+            columns = archetype.columns
+            hit_bullets, rows = pool.first_hits(bullets, points, rows, columns["x"], columns["y"],
+                                                systems.reach(archetype))
+            if not len(hit_bullets):
+                continue
+            hp = columns["hp"]
+            for bullet, row in zip(hit_bullets.tolist(), rows.tolist()):
+                if hp[row] <= 0:
+                    continue  # Já destruído por outro projétil neste tick
+                pool.kill(bullet)
+                hp[row] -= 1
+                if hp[row] <= 0:
+                    self.kill(archetype, row)
+                    self.explode(columns["x"][row], columns["y"][row])
+                    self.sounds.append("explosion")
+                    if "bounty" in archetype.components:
+                        self.player.score += int(columns["points"][row])
+            bullets = bullets[pool.alive[bullets]]
+        pool.cull(WIDTH, HEIGHT)
+
+
+def run_headless(frames, seed=None, input_fn=None, world=None):
+    """
+    Roda a simulação sem display e sem limite de FPS.
+    input_fn(world) deve retornar um Inputs por tick; sem ela a nave fica parada.
+    Reinicia a partida sempre que o jogador morre. Retorna (world, segundos).
+    """
+    if world is None:
+        world = World(seed)
+    idle = Inputs()
+    start = time.perf_counter()
+    for _ in range(frames):
+        world.step(input_fn(world) if input_fn else idle)
+        if world.game_over:
+            world.reset()
+    return world, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    import sys
+
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    def spinning_shooter(world):
+        # Bot simples: gira e atira a cada 10 ticks
+        return Inputs(left=True, up=world.frame % 120 < 60, shoot=world.frame % 10 == 0)
+
+    _, elapsed = run_headless(frames, seed=1, input_fn=spinning_shooter)
+    print(f"{frames} ticks em {elapsed:.3f}s ({frames / elapsed:.0f} ticks/s)")